@@ -0,0 +1,976 @@
+// 끝말잇기 웹 버전의 사전 색인·단어 검증·봇 탐색·힌트 계산 전용 Web Worker
+// (index.html은 화면 갱신만 담당하고 계산은 모두 이 워커에 요청한다)
+//
+// 메시지 프로토콜: 요청에는 id를 붙이고, 응답은 { id, result } 또는 { id, error }
+//   load            { url, versionUrl }              → { count, source: 'cache' | 'delta' | 'network' }
+//   start_game      {}                               → {}  이음 수·사용 단어·기록 초기화
+//   play_word       { word }                         → { ok, reason } 또는 { ok, word, firstChar, lastChar }
+//   bot_move        { turnId, effectiveDifficulty }  → { turnId, stale } 또는 { turnId, decision }
+//   commit_bot_word { word }                         → {}  메인 스레드가 채택한 봇 단어 반영
+//   hints           { limit }                        → { lastChar, words, initials }
+//   word_info       { word }                         → 뜻풀이 항목 배열 또는 null
+//   invalidate      { turnId }                       (응답 없음) 최신 봇 턴 번호 갱신
+//
+// 봇 턴 무효화는 데스크톱 bot_turn_sequence와 같다. 메인 스레드가 턴 번호를 올릴 때마다
+// invalidate를 보내고, 워커는 이미 지난 턴의 bot_move를 계산하지 않고 stale로 응답한다.
+// 메인 스레드도 응답을 받을 때 턴 번호를 다시 확인해 늦게 도착한 결과를 버린다.
+
+// 한글 유니코드 처리
+const HANGUL_BASE = 0xAC00;
+const CHOS = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'];
+const CHO_N = 2;
+const CHO_R = 5;
+const CHO_YIEUNG = 11;
+const IY_JUNG_IDX = new Set([20, 2, 6, 12, 17, 7, 16, 3, 19]);
+
+function isHangulSyllable(ch) {
+    if (!ch) return false;
+    const code = ch.charCodeAt(0);
+    return code >= 0xAC00 && code <= 0xD7A3;
+}
+
+function decompose(ch) {
+    if (!isHangulSyllable(ch)) return null;
+    const code = ch.charCodeAt(0) - HANGUL_BASE;
+    const cho = Math.floor(code / 588);
+    const jung = Math.floor((code % 588) / 28);
+    const jong = code % 28;
+    return { cho, jung, jong };
+}
+
+function compose(cho, jung, jong) {
+    return String.fromCharCode(HANGUL_BASE + cho * 588 + jung * 28 + jong);
+}
+
+function dueumTransform(syll) {
+    const decomp = decompose(syll);
+    if (!decomp) return null;
+
+    const { cho, jung, jong } = decomp;
+    if (cho === CHO_N) {
+        if (IY_JUNG_IDX.has(jung)) {
+            return compose(CHO_YIEUNG, jung, jong);
+        }
+        return null;
+    }
+
+    if (cho === CHO_R) {
+        if (IY_JUNG_IDX.has(jung)) {
+            return compose(CHO_YIEUNG, jung, jong);
+        }
+        return compose(CHO_N, jung, jong);
+    }
+
+    return null;
+}
+
+function getInitialConsonants(word) {
+    let result = '';
+    for (const ch of word) {
+        const decomp = decompose(ch);
+        if (!decomp) {
+            result += ch;
+        } else {
+            result += CHOS[decomp.cho];
+        }
+    }
+    return result;
+}
+
+function getDueumVariants(syllable) {
+    if (!syllable) return new Set();
+    const variants = new Set([syllable]);
+    const transformed = dueumTransform(syllable);
+    if (transformed) variants.add(transformed);
+    return variants;
+}
+
+// 사전 (불러온 뒤에는 읽기 전용)
+// 단어는 번호(words.json 키 순서)로 다루고, 모든 색인은 하나의 ArrayBuffer 위의 typed array 뷰다.
+// 단어 문자열은 필요할 때만 wordText에서 잘라 만든다.
+const dict = {
+    buffer: null,
+    count: 0,
+    text: '',                   // 모든 단어를 이어 붙인 문자열
+    wordOffsets: null,          // Uint32[N+1]: 단어 번호 → text 구간
+    baseEuem: null,             // Int32[N]: 초기 최대 이음 수
+    wordTable: null,            // Int32: 단어 → 번호 개방 주소 해시 테이블 (-1은 빈 칸)
+    firstCharGroup: null,       // Int32[0x10000]: 음절 코드 → firstChar 그룹 번호 (-1은 없음)
+    firstCharOffsets: null,
+    firstCharIds: null,         // 첫 음절별 단어 번호 (그룹 안에서 오름차순)
+    lastVariantGroup: null,     // Int32[0x10000]: 음절 코드 → lastVariant 그룹 번호
+    lastVariantOffsets: null,
+    lastVariantIds: null,       // 두음 변형 포함 끝 음절별 단어 번호
+    definitionOffsets: null,
+    definitionBytes: null       // 단어별 뜻풀이 UTF-8 JSON (word_info 요청 때만 디코딩)
+};
+
+// 게임 상태 (사전 크기의 typed array는 사전을 불러올 때 한 번만 할당해 게임마다 재사용)
+const state = {
+    euem: new Int32Array(0),    // 단어 번호 → 현재 최대 이음 수
+    used: new Uint8Array(0),    // 단어 번호 → 사용 여부
+    gameHistory: [],
+    currentLastChar: '',
+    latestTurnId: 0
+};
+
+// ---------------------------------------------------------------------
+// 사전 직렬화: words.json을 파싱·색인한 결과를 ArrayBuffer 하나로 묶는다
+//   헤더 Uint32[8]: MAGIC, 형식 버전, 단어 수 N, 첫 음절 수 F, 끝 음절 변형 수 L,
+//                   끝 음절 변형 색인 길이 M, 단어 문자열 길이 T, 뜻풀이 바이트 수 D
+//   이후 4바이트 정렬로 다음 구간이 이어진다
+//     wordOffsets Uint32[N+1], baseEuem Int32[N], definitionOffsets Uint32[N+1],
+//     firstCharOffsets Uint32[F+1], firstCharIds Uint32[N],
+//     lastVariantOffsets Uint32[L+1], lastVariantIds Uint32[M],
+//     firstCharKeys Uint16[F], lastVariantKeys Uint16[L], wordText Uint16[T],
+//     definitionBytes Uint8[D] (단어별 뜻풀이 항목 배열의 UTF-8 JSON, 이음 수 제외)
+// ---------------------------------------------------------------------
+const PACK_MAGIC = 0x57434431;  // 'WCD1'
+const PACK_FORMAT = 1;
+const PACK_HEADER_LENGTH = 8;
+
+function groupIdsByKey(keyOfId, count) {
+    // 키(UTF-16 코드 단위) → 단어 번호 목록을 키 순서로 정렬한 (keys, offsets, ids)
+    const groups = new Map();
+    for (let id = 0; id < count; id++) {
+        for (const key of keyOfId(id)) {
+            let group = groups.get(key);
+            if (!group) {
+                group = [];
+                groups.set(key, group);
+            }
+            group.push(id);
+        }
+    }
+
+    const keys = [...groups.keys()].sort((a, b) => a - b);
+    const offsets = new Uint32Array(keys.length + 1);
+    let total = 0;
+    keys.forEach((key, idx) => {
+        offsets[idx] = total;
+        total += groups.get(key).length;
+    });
+    offsets[keys.length] = total;
+
+    const ids = new Uint32Array(total);
+    keys.forEach((key, idx) => ids.set(groups.get(key), offsets[idx]));
+    return { keys: Uint16Array.from(keys), offsets, ids };
+}
+
+function linkCountOf(entries) {
+    return Math.max(0, ...entries.map(e => e['이음 수'] || 0));
+}
+
+// words.json의 "" 키: 범주형 필드(고유어 여부, 전문 분야)의 값 목록. 항목에는 목록 위치(코드)가
+// 저장되어 있으므로 뜻풀이를 묶을 때 문자열로 되돌린다 (field_codes.py 참고)
+const FIELD_CODES_KEY = '';
+
+function takeFieldCodes(wordsData) {
+    const codes = wordsData[FIELD_CODES_KEY];
+    delete wordsData[FIELD_CODES_KEY];
+    return codes && typeof codes === 'object' ? codes : {};
+}
+
+function decodeFields(entry, codes) {
+    for (const [field, values] of Object.entries(codes)) {
+        const code = entry[field];
+        if (typeof code === 'number' && Array.isArray(values) && code >= 0 && code < values.length) {
+            entry[field] = values[code];
+        }
+    }
+    return entry;
+}
+
+function encodeDefinitions(encoder, entries, codes = {}) {
+    return encoder.encode(JSON.stringify(
+        entries.map(({ '이음 수': _, ...rest }) => decodeFields(rest, codes))));
+}
+
+function copyWordText(word, target, offset) {
+    for (let i = 0; i < word.length; i++) {
+        target[offset + i] = word.charCodeAt(i);
+    }
+}
+
+function packDictionary(wordsData) {
+    const codes = takeFieldCodes(wordsData);
+    const words = Object.keys(wordsData);
+    const count = words.length;
+    const encoder = new TextEncoder();
+
+    const wordOffsets = new Uint32Array(count + 1);
+    const baseEuem = new Int32Array(count);
+    const definitionOffsets = new Uint32Array(count + 1);
+    const definitionChunks = [];
+    let textLength = 0;
+    let definitionLength = 0;
+
+    words.forEach((word, id) => {
+        wordOffsets[id] = textLength;
+        textLength += word.length;
+
+        const entries = wordsData[word];
+        baseEuem[id] = linkCountOf(entries);
+
+        const bytes = encodeDefinitions(encoder, entries, codes);
+        definitionOffsets[id] = definitionLength;
+        definitionLength += bytes.length;
+        definitionChunks.push(bytes);
+    });
+    wordOffsets[count] = textLength;
+    definitionOffsets[count] = definitionLength;
+
+    const wordText = new Uint16Array(textLength);
+    words.forEach((word, id) => copyWordText(word, wordText, wordOffsets[id]));
+
+    const firstChar = groupIdsByKey(id => [words[id].charCodeAt(0)], count);
+    const lastVariant = groupIdsByKey(id => lastVariantKeysOf(words[id]), count);
+
+    return writePackedDictionary({
+        count, wordOffsets, baseEuem, definitionOffsets, firstChar, lastVariant, wordText,
+        definitionChunks, definitionLength
+    });
+}
+
+function lastVariantKeysOf(word) {
+    return [...getDueumVariants(word[word.length - 1])].map(ch => ch.charCodeAt(0));
+}
+
+function writePackedDictionary(packed) {
+    const { count, firstChar, lastVariant, wordText, definitionChunks, definitionLength } = packed;
+    const header = Uint32Array.of(
+        PACK_MAGIC, PACK_FORMAT, count, firstChar.keys.length, lastVariant.keys.length,
+        lastVariant.ids.length, wordText.length, definitionLength
+    );
+    const sections = [
+        header, packed.wordOffsets, packed.baseEuem, packed.definitionOffsets,
+        firstChar.offsets, firstChar.ids, lastVariant.offsets, lastVariant.ids,
+        firstChar.keys, lastVariant.keys, wordText
+    ];
+
+    let size = 0;
+    for (const section of sections) {
+        size = align4(size) + section.byteLength;
+    }
+    size = align4(size);
+    const buffer = new ArrayBuffer(size + definitionLength);
+    const bytes = new Uint8Array(buffer);
+
+    let offset = 0;
+    for (const section of sections) {
+        offset = align4(offset);
+        bytes.set(new Uint8Array(section.buffer, section.byteOffset, section.byteLength), offset);
+        offset += section.byteLength;
+    }
+    offset = align4(offset);
+    for (const chunk of definitionChunks) {
+        bytes.set(chunk, offset);
+        offset += chunk.length;
+    }
+    return buffer;
+}
+
+function align4(offset) {
+    return (offset + 3) & ~3;
+}
+
+function readPackedDictionary(buffer) {
+    const header = new Uint32Array(buffer, 0, PACK_HEADER_LENGTH);
+    if (header[0] !== PACK_MAGIC || header[1] !== PACK_FORMAT) {
+        throw new Error('사전 캐시 형식이 올바르지 않습니다.');
+    }
+    const [, , count, firstCount, variantCount, variantIdCount, textLength, definitionLength] = header;
+
+    let offset = header.byteLength;
+    function take(ArrayType, length) {
+        offset = align4(offset);
+        const view = new ArrayType(buffer, offset, length);
+        offset += view.byteLength;
+        return view;
+    }
+
+    const wordOffsets = take(Uint32Array, count + 1);
+    const baseEuem = take(Int32Array, count);
+    const definitionOffsets = take(Uint32Array, count + 1);
+    const firstCharOffsets = take(Uint32Array, firstCount + 1);
+    const firstCharIds = take(Uint32Array, count);
+    const lastVariantOffsets = take(Uint32Array, variantCount + 1);
+    const lastVariantIds = take(Uint32Array, variantIdCount);
+    const firstCharKeys = take(Uint16Array, firstCount);
+    const lastVariantKeys = take(Uint16Array, variantCount);
+    const wordText = take(Uint16Array, textLength);
+    const definitionBytes = take(Uint8Array, definitionLength);
+
+    return {
+        count, wordOffsets, baseEuem, definitionOffsets, wordText, definitionBytes,
+        firstChar: { keys: firstCharKeys, offsets: firstCharOffsets, ids: firstCharIds },
+        lastVariant: { keys: lastVariantKeys, offsets: lastVariantOffsets, ids: lastVariantIds }
+    };
+}
+
+function unpackDictionary(buffer) {
+    const packed = readPackedDictionary(buffer);
+    const count = packed.count;
+
+    dict.buffer = buffer;
+    dict.count = count;
+    dict.text = new TextDecoder('utf-16le').decode(packed.wordText);
+    dict.wordOffsets = packed.wordOffsets;
+    dict.baseEuem = packed.baseEuem;
+    dict.wordTable = buildWordTable(packed.wordText, packed.wordOffsets, count);
+    dict.firstCharGroup = buildGroupLookup(packed.firstChar.keys);
+    dict.firstCharOffsets = packed.firstChar.offsets;
+    dict.firstCharIds = packed.firstChar.ids;
+    dict.lastVariantGroup = buildGroupLookup(packed.lastVariant.keys);
+    dict.lastVariantOffsets = packed.lastVariant.offsets;
+    dict.lastVariantIds = packed.lastVariant.ids;
+    dict.definitionOffsets = packed.definitionOffsets;
+    dict.definitionBytes = packed.definitionBytes;
+
+    state.euem = new Int32Array(count);
+    state.used = new Uint8Array(count);
+}
+
+// ---------------------------------------------------------------------
+// 변경분 적용: 저장된 기준 사전 버퍼에 words_delta.json을 반영한 새 버퍼를 만든다
+//   words.json을 다시 받거나 파싱하지 않고, 남는 단어의 문자열·뜻풀이 바이트와
+//   그룹 색인은 번호만 바꿔 그대로 복사한다. 새 단어는 끝에 붙인다.
+// ---------------------------------------------------------------------
+function patchGroups(group, remap, addedKeys, keptCount) {
+    const extra = new Map();  // 키 → 새 단어 번호 목록
+    let extraTotal = 0;
+    addedKeys.forEach((keys, i) => {
+        keys.forEach(key => {
+            let ids = extra.get(key);
+            if (!ids) {
+                ids = [];
+                extra.set(key, ids);
+            }
+            ids.push(keptCount + i);
+            extraTotal++;
+        });
+    });
+
+    const baseIndex = new Map();
+    group.keys.forEach((key, idx) => baseIndex.set(key, idx));
+    const keys = Uint16Array.from(new Set([...group.keys, ...extra.keys()])).sort();
+
+    const offsets = new Uint32Array(keys.length + 1);
+    const ids = new Uint32Array(group.ids.length + extraTotal);
+    let total = 0;
+    keys.forEach((key, k) => {
+        offsets[k] = total;
+        const idx = baseIndex.get(key);
+        if (idx !== undefined) {
+            for (let i = group.offsets[idx]; i < group.offsets[idx + 1]; i++) {
+                const id = remap[group.ids[i]];
+                if (id >= 0) ids[total++] = id;
+            }
+        }
+        for (const id of extra.get(key) || []) {
+            ids[total++] = id;
+        }
+    });
+    offsets[keys.length] = total;
+    return { keys, offsets, ids: ids.subarray(0, total) };
+}
+
+function patchPackedDictionary(buffer, delta) {
+    const base = readPackedDictionary(buffer);
+    const baseText = new TextDecoder('utf-16le').decode(base.wordText);
+    const baseTable = buildWordTable(base.wordText, base.wordOffsets, base.count);
+    const findBaseId = word => findWordId(baseTable, baseText, base.wordOffsets, word);
+    const encoder = new TextEncoder();
+
+    const removed = new Uint8Array(base.count);
+    for (const word of delta.removed) {
+        const id = findBaseId(word);
+        if (id >= 0) removed[id] = 1;
+    }
+    const changed = new Map();
+    for (const [word, entries] of Object.entries(delta.changed)) {
+        const id = findBaseId(word);
+        if (id >= 0 && !removed[id]) changed.set(id, entries);
+    }
+    const addedWords = Object.keys(delta.added).filter(word => word && findBaseId(word) < 0);
+
+    // 기준 번호 → 새 번호 (삭제된 단어는 -1, 순서 유지)
+    const remap = new Int32Array(base.count);
+    let keptCount = 0;
+    for (let id = 0; id < base.count; id++) {
+        remap[id] = removed[id] ? -1 : keptCount++;
+    }
+    const count = keptCount + addedWords.length;
+
+    const wordOffsets = new Uint32Array(count + 1);
+    const baseEuem = new Int32Array(count);
+    const definitionOffsets = new Uint32Array(count + 1);
+    const definitionChunks = [];
+    let textLength = 0;
+    let definitionLength = 0;
+
+    function appendDefinitions(newId, bytes) {
+        definitionOffsets[newId] = definitionLength;
+        definitionLength += bytes.length;
+        definitionChunks.push(bytes);
+    }
+
+    for (let id = 0; id < base.count; id++) {
+        const newId = remap[id];
+        if (newId < 0) continue;
+        wordOffsets[newId] = textLength;
+        textLength += base.wordOffsets[id + 1] - base.wordOffsets[id];
+        baseEuem[newId] = base.baseEuem[id];
+        appendDefinitions(newId, changed.has(id)
+            ? encodeDefinitions(encoder, changed.get(id))
+            : base.definitionBytes.subarray(base.definitionOffsets[id], base.definitionOffsets[id + 1]));
+    }
+    const addedIds = new Map();
+    addedWords.forEach((word, i) => {
+        const newId = keptCount + i;
+        addedIds.set(word, newId);
+        wordOffsets[newId] = textLength;
+        textLength += word.length;
+        baseEuem[newId] = linkCountOf(delta.added[word]);
+        appendDefinitions(newId, encodeDefinitions(encoder, delta.added[word]));
+    });
+    wordOffsets[count] = textLength;
+    definitionOffsets[count] = definitionLength;
+
+    for (const [word, linkCount] of Object.entries(delta.link_counts)) {
+        const baseId = findBaseId(word);
+        const newId = baseId >= 0 ? remap[baseId] : addedIds.get(word);
+        if (newId !== undefined && newId >= 0) baseEuem[newId] = linkCount;
+    }
+
+    const wordText = new Uint16Array(textLength);
+    for (let id = 0; id < base.count; id++) {
+        if (remap[id] < 0) continue;
+        wordText.set(base.wordText.subarray(base.wordOffsets[id], base.wordOffsets[id + 1]), wordOffsets[remap[id]]);
+    }
+    addedWords.forEach((word, i) => copyWordText(word, wordText, wordOffsets[keptCount + i]));
+
+    const firstChar = patchGroups(base.firstChar, remap, addedWords.map(word => [word.charCodeAt(0)]), keptCount);
+    const lastVariant = patchGroups(base.lastVariant, remap, addedWords.map(lastVariantKeysOf), keptCount);
+
+    return writePackedDictionary({
+        count, wordOffsets, baseEuem, definitionOffsets, firstChar, lastVariant, wordText,
+        definitionChunks, definitionLength
+    });
+}
+
+function buildGroupLookup(keys) {
+    const lookup = new Int32Array(0x10000).fill(-1);
+    keys.forEach((key, idx) => { lookup[key] = idx; });
+    return lookup;
+}
+
+// 단어 → 번호 조회용 개방 주소 해시 테이블 (FNV-1a, 선형 탐사, 적재율 0.5 이하)
+function hashWord(codeAt, start, end) {
+    let hash = 0x811c9dc5;
+    for (let i = start; i < end; i++) {
+        hash = Math.imul(hash ^ codeAt(i), 0x01000193);
+    }
+    return hash >>> 0;
+}
+
+function buildWordTable(wordText, wordOffsets, count) {
+    let size = 2;
+    while (size < count * 2) size *= 2;
+    const table = new Int32Array(size).fill(-1);
+    const mask = size - 1;
+    const codeAt = i => wordText[i];
+
+    for (let id = 0; id < count; id++) {
+        let slot = hashWord(codeAt, wordOffsets[id], wordOffsets[id + 1]) & mask;
+        while (table[slot] !== -1) slot = (slot + 1) & mask;
+        table[slot] = id;
+    }
+    return table;
+}
+
+function findWordId(table, text, wordOffsets, word) {
+    const mask = table.length - 1;
+    let slot = hashWord(i => word.charCodeAt(i), 0, word.length) & mask;
+    while (table[slot] !== -1) {
+        const id = table[slot];
+        const start = wordOffsets[id];
+        if (wordOffsets[id + 1] - start === word.length && text.startsWith(word, start)) {
+            return id;
+        }
+        slot = (slot + 1) & mask;
+    }
+    return -1;
+}
+
+function lookupWordId(word) {
+    if (!dict.wordTable) return -1;
+    return findWordId(dict.wordTable, dict.text, dict.wordOffsets, word);
+}
+
+function wordAt(id) {
+    return dict.text.slice(dict.wordOffsets[id], dict.wordOffsets[id + 1]);
+}
+
+function firstCodeOf(id) {
+    return dict.text.charCodeAt(dict.wordOffsets[id]);
+}
+
+function lastCharOf(id) {
+    return dict.text[dict.wordOffsets[id + 1] - 1];
+}
+
+function forEachIdStartingWith(char, callback) {
+    const group = dict.firstCharGroup[char.charCodeAt(0)];
+    if (group < 0) return;
+    for (let i = dict.firstCharOffsets[group]; i < dict.firstCharOffsets[group + 1]; i++) {
+        callback(dict.firstCharIds[i]);
+    }
+}
+
+function getDefinitions(word) {
+    const id = lookupWordId(word);
+    if (id < 0) return null;
+
+    const bytes = dict.definitionBytes.subarray(dict.definitionOffsets[id], dict.definitionOffsets[id + 1]);
+    return JSON.parse(new TextDecoder().decode(bytes));
+}
+
+// ---------------------------------------------------------------------
+// IndexedDB 사전 캐시: extractor가 만든 버전 해시를 키로 직렬화된 사전을 보관
+// ---------------------------------------------------------------------
+const DICTIONARY_DB_NAME = 'wordchainer';
+const DICTIONARY_DB_STORE = 'dictionary';
+
+function openDictionaryDb() {
+    return new Promise((resolve) => {
+        if (typeof indexedDB === 'undefined') {
+            resolve(null);
+            return;
+        }
+        const request = indexedDB.open(DICTIONARY_DB_NAME, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(DICTIONARY_DB_STORE);
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => resolve(null);
+    });
+}
+
+async function readCachedDictionary(version) {
+    const db = await openDictionaryDb();
+    if (!db) return null;
+
+    return new Promise((resolve) => {
+        const request = db.transaction(DICTIONARY_DB_STORE, 'readonly')
+            .objectStore(DICTIONARY_DB_STORE).get(version);
+        request.onsuccess = () => {
+            db.close();
+            resolve(request.result instanceof ArrayBuffer ? request.result : null);
+        };
+        request.onerror = () => {
+            db.close();
+            resolve(null);
+        };
+    });
+}
+
+async function writeCachedDictionary(version, buffer) {
+    const db = await openDictionaryDb();
+    if (!db) return;
+
+    await new Promise((resolve) => {
+        const transaction = db.transaction(DICTIONARY_DB_STORE, 'readwrite');
+        const store = transaction.objectStore(DICTIONARY_DB_STORE);
+        // 다른 버전의 사전은 지우고 현재 버전 하나만 보관
+        store.clear();
+        store.put(buffer, version);
+        transaction.oncomplete = resolve;
+        transaction.onerror = resolve;
+        transaction.onabort = resolve;
+    });
+    db.close();
+}
+
+async function fetchDictionaryManifest(versionUrl) {
+    // words_version.json: { version, words_count, delta: { base_version, path } }
+    if (!versionUrl) return null;
+    try {
+        const response = await fetch(versionUrl, { cache: 'no-cache' });
+        if (!response.ok) return null;
+        const data = await response.json();
+        return typeof data.version === 'string' ? data : null;
+    } catch (e) {
+        return null;
+    }
+}
+
+async function loadDictionaryDelta(manifest) {
+    // 저장된 기준 사전에 변경분을 적용한 버퍼 (적용할 수 없으면 null)
+    const delta = manifest.delta;
+    if (!delta || typeof delta.base_version !== 'string' || typeof delta.path !== 'string') {
+        return null;
+    }
+    const baseBuffer = await readCachedDictionary(delta.base_version);
+    if (!baseBuffer) return null;
+
+    try {
+        const response = await fetch(delta.path, { cache: 'no-cache' });
+        if (!response.ok) return null;
+        const data = await response.json();
+        if (data.base_version !== delta.base_version || data.version !== manifest.version) {
+            return null;
+        }
+        return patchPackedDictionary(baseBuffer, data);
+    } catch (e) {
+        return null;
+    }
+}
+
+function resetState() {
+    if (dict.baseEuem) state.euem.set(dict.baseEuem);
+    state.used.fill(0);
+    state.gameHistory = [];
+    state.currentLastChar = '';
+}
+
+function getEuem(word) {
+    const id = lookupWordId(word);
+    return id < 0 ? 0 : state.euem[id];
+}
+
+function applyDueumDecrease(char) {
+    if (!char) return;
+
+    const group = dict.lastVariantGroup[char.charCodeAt(0)];
+    if (group < 0) return;
+
+    const euem = state.euem;
+    for (let i = dict.lastVariantOffsets[group]; i < dict.lastVariantOffsets[group + 1]; i++) {
+        const id = dict.lastVariantIds[i];
+        if (euem[id] > 0) euem[id]--;
+    }
+}
+
+function recordWord(speaker, word) {
+    const id = lookupWordId(word);
+    if (id >= 0) state.used[id] = 1;
+    state.gameHistory.push([speaker, word]);
+    state.currentLastChar = word[word.length - 1];
+    applyDueumDecrease(word[0]);
+}
+
+function countAvailableFollowups(lastChar, excludeId = -1) {
+    if (!lastChar) return 0;
+
+    // 시작 음절 그룹은 서로 겹치지 않으므로 중복 제거가 필요 없다
+    let count = 0;
+    getDueumVariants(lastChar).forEach(char => {
+        forEachIdStartingWith(char, id => {
+            if (id !== excludeId && !state.used[id]) count++;
+        });
+    });
+    return count;
+}
+
+function compareHintCandidates(a, b) {
+    return b.maxEuem - a.maxEuem || a.word.localeCompare(b.word);
+}
+
+function getPossibleUserWords(limit = 10) {
+    if (!state.currentLastChar || limit <= 0) return [];
+
+    // 이음 수 상위 limit개만 정렬된 채로 유지 (데스크톱 get_top_words와 같은 순서)
+    const top = [];
+    const bansZeroLink = state.gameHistory.length < 4;
+    getDueumVariants(state.currentLastChar).forEach(char => {
+        forEachIdStartingWith(char, id => {
+            if (state.used[id]) return;
+
+            const maxEuem = state.euem[id];
+            if (bansZeroLink && maxEuem === 0) return;
+            // 꽉 찬 목록의 마지막보다 이음 수가 작으면 단어를 꺼내지 않고 건너뜀
+            if (top.length === limit && maxEuem < top[limit - 1].maxEuem) return;
+
+            const candidate = { word: wordAt(id), maxEuem };
+            let pos = top.length;
+            while (pos > 0 && compareHintCandidates(candidate, top[pos - 1]) < 0) pos--;
+            if (pos >= limit) return;
+            top.splice(pos, 0, candidate);
+            if (top.length > limit) top.pop();
+        });
+    });
+
+    return top.map(c => c.word);
+}
+
+function validateWord(word) {
+    if (!isHangulSyllable(word[0]) || !isHangulSyllable(word[word.length - 1])) {
+        return `${word}(은)는 잘못된 단어입니다: 한글로 시작하고 끝나야 합니다.`;
+    }
+
+    if (word.length < 2) {
+        return `${word}(은)는 잘못된 단어입니다: 최소 2글자 이상이어야 합니다.`;
+    }
+
+    const id = lookupWordId(word);
+    if (id < 0) {
+        return `${word}(은)는 잘못된 단어입니다: 사전에 없는 단어이거나 명사가 아닙니다.`;
+    }
+
+    if (state.gameHistory.length < 4 && state.euem[id] === 0) {
+        return `${word}(은)는 잘못된 단어입니다: 게임 시작 후 4턴까지는 이음 수가 0인 단어를 사용할 수 없습니다.`;
+    }
+
+    if (state.used[id]) {
+        return `${word}(은)는 잘못된 단어입니다: 이미 사용된 단어입니다.`;
+    }
+
+    // 첫 단어가 아니면 끝말잇기 규칙 검사
+    if (state.currentLastChar) {
+        const allowedChars = getDueumVariants(state.currentLastChar);
+        if (!allowedChars.has(word[0])) {
+            return `${word}(은)는 잘못된 단어입니다: '${state.currentLastChar}'(으)로 시작하는 단어를 입력하세요.`;
+        }
+    }
+
+    return null;
+}
+
+function computeBotDecision(effectiveDifficulty) {
+    const possibleWords = [];
+    const gameHistorySnapshot = state.gameHistory;
+    const lastRequiredChar = state.currentLastChar;
+
+    if (gameHistorySnapshot.length === 0) {
+        return { type: 'no_word' };
+    }
+
+    // 후보 단어 번호 (사전 순서 유지: 시작 음절 그룹을 합쳐 정렬)
+    let candidateIds = null;
+    if (lastRequiredChar) {
+        const ids = [];
+        getDueumVariants(lastRequiredChar).forEach(char => {
+            forEachIdStartingWith(char, id => ids.push(id));
+        });
+        candidateIds = Uint32Array.from(ids).sort();
+    }
+
+    const minThreshold = Math.max(0, 3200 - (effectiveDifficulty * 400));
+    const bansZeroLink = gameHistorySnapshot.length < 4;
+    const candidateCount = candidateIds ? candidateIds.length : dict.count;
+    for (let k = 0; k < candidateCount; k++) {
+        const id = candidateIds ? candidateIds[k] : k;
+        if (state.used[id]) continue;
+
+        const maxEuem = state.euem[id];
+
+        if (bansZeroLink && maxEuem === 0) continue;
+
+        if (maxEuem < minThreshold) continue;
+
+        possibleWords.push({ id, maxEuem });
+    }
+
+    if (possibleWords.length === 0) {
+        return { type: 'no_word' };
+    }
+
+    // 안전한 단어만 선택 (끝 음절별 남은 단어 수를 한 번씩만 세고, 후보 자신은 빼서 비교)
+    const followupsByLastChar = new Map();
+    const safeWords = possibleWords.filter(({ id }) => {
+        const lastChar = lastCharOf(id);
+        let available = followupsByLastChar.get(lastChar);
+        if (available === undefined) {
+            available = countAvailableFollowups(lastChar);
+            followupsByLastChar.set(lastChar, available);
+        }
+        const selfCounted = getDueumVariants(lastChar).has(String.fromCharCode(firstCodeOf(id)));
+        return available - (selfCounted ? 1 : 0) > 0;
+    });
+
+    if (safeWords.length > 0) {
+        possibleWords.length = 0;
+        possibleWords.push(...safeWords);
+    }
+
+    // 난이도에 따른 실패 확률
+    const lastUserWord = gameHistorySnapshot[gameHistorySnapshot.length - 1][1];
+    const lastEuem = getEuem(lastUserWord);
+
+    let baseProb = 1.0;
+    if (lastEuem < 1000) {
+        const difficultyFactor = effectiveDifficulty / 10.0;
+        const euemFactor = lastEuem / 1000.0;
+
+        const baseSkill = 0.35 + (0.65 * difficultyFactor);
+        const penaltyScale = Math.pow(1 - difficultyFactor, 3);
+        const lowEuemPenalty = (1 - euemFactor) * 0.4 * penaltyScale;
+        const euemBonus = euemFactor * 0.25 * (1 - penaltyScale);
+
+        baseProb = baseSkill - lowEuemPenalty + euemBonus;
+        baseProb = Math.max(0.1, Math.min(1.0, baseProb));
+    }
+
+    let shouldFail = false;
+    if (effectiveDifficulty < 10) {
+        shouldFail = Math.random() > baseProb;
+    }
+
+    if (shouldFail) {
+        return { type: 'fail', baseProb };
+    }
+
+    // 단어 선택
+    let minEuem = Infinity;
+    let maxEuemVal = -Infinity;
+    for (const { maxEuem } of possibleWords) {
+        if (maxEuem < minEuem) minEuem = maxEuem;
+        if (maxEuem > maxEuemVal) maxEuemVal = maxEuem;
+    }
+    const difficultyFactor = effectiveDifficulty / 10.0;
+
+    let selectedWord;
+    if (effectiveDifficulty >= 10) {
+        const minCandidates = possibleWords.filter(p => p.maxEuem === minEuem);
+        selectedWord = wordAt(minCandidates[Math.floor(Math.random() * minCandidates.length)].id);
+    } else {
+        if (maxEuemVal === minEuem) {
+            selectedWord = wordAt(possibleWords[Math.floor(Math.random() * possibleWords.length)].id);
+        } else {
+            const weights = possibleWords.map(({ maxEuem }) => {
+                const normalized = (maxEuem - minEuem) / (maxEuemVal - minEuem);
+                const highPref = (1.0 - difficultyFactor) * normalized;
+                const lowPref = difficultyFactor * (1.0 - normalized);
+                return highPref + lowPref + 0.05;
+            });
+
+            const totalWeight = weights.reduce((a, b) => a + b, 0);
+            let random = Math.random() * totalWeight;
+
+            for (let i = 0; i < possibleWords.length; i++) {
+                random -= weights[i];
+                if (random <= 0) {
+                    selectedWord = wordAt(possibleWords[i].id);
+                    break;
+                }
+            }
+
+            if (!selectedWord) {
+                selectedWord = wordAt(possibleWords[possibleWords.length - 1].id);
+            }
+        }
+    }
+
+    return {
+        type: 'word',
+        word: selectedWord,
+        firstChar: selectedWord[0],
+        lastChar: selectedWord[selectedWord.length - 1]
+    };
+}
+
+// 메시지 처리
+const handlers = {
+    async load({ url, versionUrl }) {
+        // 같은 버전의 사전이 저장되어 있으면 내려받기·파싱·색인 생성을 모두 건너뜀,
+        // 기준 버전이 저장되어 있으면 변경분만 받아 적용
+        const manifest = await fetchDictionaryManifest(versionUrl);
+        const version = manifest ? manifest.version : null;
+        let source = 'cache';
+        let buffer = version ? await readCachedDictionary(version) : null;
+
+        if (buffer) {
+            try {
+                unpackDictionary(buffer);
+            } catch (e) {
+                buffer = null;
+            }
+        }
+        if (!buffer && manifest) {
+            buffer = await loadDictionaryDelta(manifest);
+            if (buffer) {
+                try {
+                    unpackDictionary(buffer);
+                    source = 'delta';
+                    await writeCachedDictionary(version, buffer);
+                } catch (e) {
+                    // 변경분을 적용한 사전이 깨졌으면 전체 사전을 받음
+                    buffer = null;
+                }
+            }
+        }
+        if (!buffer) {
+            source = 'network';
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`${url}을(를) 불러올 수 없습니다 (HTTP ${response.status})`);
+            }
+            let data;
+            try {
+                data = await response.json();
+            } catch (e) {
+                throw new Error(`${url}의 형식이 올바르지 않습니다: ${(e && e.message) || e}`);
+            }
+            buffer = packDictionary(data);
+            unpackDictionary(buffer);
+            if (version) await writeCachedDictionary(version, buffer);
+        }
+
+        resetState();
+        return { count: dict.count, source };
+    },
+
+    start_game() {
+        resetState();
+        return {};
+    },
+
+    play_word({ word }) {
+        const reason = validateWord(word);
+        if (reason) return { ok: false, reason };
+
+        recordWord('user', word);
+        return { ok: true, word, firstChar: word[0], lastChar: word[word.length - 1] };
+    },
+
+    bot_move({ turnId, effectiveDifficulty }) {
+        if (turnId !== state.latestTurnId) {
+            return { turnId, stale: true };
+        }
+        return { turnId, decision: computeBotDecision(effectiveDifficulty) };
+    },
+
+    commit_bot_word({ word }) {
+        recordWord('bot', word);
+        return {};
+    },
+
+    hints({ limit }) {
+        const words = getPossibleUserWords(limit);
+        return { lastChar: state.currentLastChar, words, initials: words.map(getInitialConsonants) };
+    },
+
+    word_info({ word }) {
+        return getDefinitions(word);
+    },
+
+    invalidate({ turnId }) {
+        state.latestTurnId = turnId;
+    }
+};
+
+self.onmessage = async (event) => {
+    const message = event.data;
+    const handler = handlers[message.type];
+    if (!handler) return;
+
+    try {
+        const result = await handler(message);
+        if (message.id !== undefined) {
+            self.postMessage({ id: message.id, result });
+        }
+    } catch (e) {
+        if (message.id !== undefined) {
+            self.postMessage({ id: message.id, error: String((e && e.message) || e) });
+        }
+    }
+};
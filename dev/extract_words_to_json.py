@@ -17,16 +17,31 @@
 - 동일 표기의 여러 단어 허용 (표기별 리스트로 저장)
 - 입력: ./input_xls 폴더의 모든 .xls
 - 출력: ./output/words.json
+        ./output/words.dawg (표제어 압축 집합, 메모리 제약 환경용)
+        ./output/rule_profiles.json (두음법칙 방식별 이음 수와 정렬 색인, rule_profiles.py 참고)
+        ./output/opening_book.json (초반 봇 후보 오프닝 북, opening_book.py 참고)
+        ./output/initials_index.json (초성 검색 정렬 순서, initials_index.py 참고)
+        ./output/words_version.json (words.json 내용 해시, 웹 버전의 IndexedDB 사전 캐시 키)
+        ./output/words_delta.json (이전 빌드가 있으면 이전 → 새 빌드 변경분, dictionary_delta.py 참고)
+- 스트리밍 모드(--streaming): 시트를 행 묶음 단위로 필요한 열만 읽고, 첫 음절별 부분 결과를
+  임시 파일로 내려 둔 뒤 마지막에 음절별로 병합하여 입력 크기와 관계없이 메모리 사용량을 제한
+  (words.json의 표기는 첫 음절 순으로 묶여 저장됨)
+- 고유어 여부·전문 분야는 항목마다 정수 코드로 저장하고 words.json의 "" 키에 값 목록을 둠
+  (field_codes.py 참고)
 - 후처리: 각 표기의 모든 엔트리에 "이음 수" 추가
   · 정의: 해당 표기의 마지막 음절과 그 두음법칙 변환 음절로 시작하는
           다른 표기들의 개수(자기 자신 제외)
+  · words.json에는 표준 두음법칙 기준 값을 기록
 """
 
+import math
 import os
 import re
+import sys
 import json
-import pandas as pd
-from typing import Dict, List, Any
+import argparse
+import tempfile
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TextIO, Tuple
 
 # -------------------------------------------------------------------------
 # 설정
@@ -34,65 +49,33 @@ from typing import Dict, List, Any
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.join(BASE_DIR, "input_xls")
 OUTPUT_PATH = os.path.join(BASE_DIR, "output", "words.json")
+DAWG_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "words.dawg")
+RULE_PROFILES_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "rule_profiles.json")
+OPENING_BOOK_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "opening_book.json")
+INITIALS_INDEX_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "initials_index.json")
+VERSION_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "words_version.json")
+DELTA_OUTPUT_PATH = os.path.join(BASE_DIR, "output", "words_delta.json")
+
+# 한글 분해/두음법칙 유틸은 저장소 루트의 공용 모듈(hangul.py) 사용
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+from dictionary_delta import (compute_delta, compute_file_version, save_delta,  # noqa: E402
+                              save_version)
+from field_codes import (CATEGORICAL_FIELDS, FIELD_CODES_KEY, build_field_codes,  # noqa: E402
+                         code_lookup, decode_entries, encode_entries, encode_words,
+                         load_words_file)
+from hangul import DUEUM_STANDARD  # noqa: E402
+from headword_dawg import HeadwordDawg  # noqa: E402
+from initials_index import save_initials_index  # noqa: E402
+from opening_book import save_opening_book  # noqa: E402
+from rule_profiles import compute_link_counts, compute_profile_data, save_profile_data  # noqa: E402
 
 ALLOWED_UNIT = "단어"
 ALLOWED_POS = "명사"
 VALID_KEYS = ["고유어 여부", "발음", "뜻풀이", "용례", "전문 분야"]
+REQUIRED_COLUMNS = ["어휘", "구성 단위", "품사"]
 
-# -------------------------------------------------------------------------
-# 한글 유니코드 분해/합성 유틸
-# -------------------------------------------------------------------------
-HANGUL_BASE = 0xAC00
-CHOS = ['ㄱ','ㄲ','ㄴ','ㄷ','ㄸ','ㄹ','ㅁ','ㅂ','ㅃ','ㅅ','ㅆ','ㅇ','ㅈ','ㅉ','ㅊ','ㅋ','ㅌ','ㅍ','ㅎ']
-JUNGS = ['ㅏ','ㅐ','ㅑ','ㅒ','ㅓ','ㅔ','ㅕ','ㅖ','ㅗ','ㅘ','ㅙ','ㅚ','ㅛ','ㅜ','ㅝ','ㅞ','ㅟ','ㅠ','ㅡ','ㅢ','ㅣ']
-JONGS = ['','ㄱ','ㄲ','ㄳ','ㄴ','ㄵ','ㄶ','ㄷ','ㄹ','ㄺ','ㄻ','ㄼ','ㄽ','ㄾ','ㄿ','ㅀ','ㅁ','ㅂ','ㅄ','ㅅ','ㅆ','ㅇ','ㅈ','ㅊ','ㅋ','ㅌ','ㅍ','ㅎ']
-
-CHO_N = 2   # ㄴ
-CHO_R = 5   # ㄹ
-CHO_Yieung = 11 # ㅇ
-
-# ㄴ/ㄹ이 단어 첫머리에 올 때 'ㅇ'으로 떨어지는 모음군(ㅣ계열·y계열·ㅖ·ㅒ·ㅟ·(보수적으로)ㅢ)
-IY_JUNG_IDX = {20, 2, 6, 12, 17, 7, 16, 3, 19}
-
-def is_hangul_syllable(ch: str) -> bool:
-    if not ch:
-        return False
-    o = ord(ch)
-    return 0xAC00 <= o <= 0xD7A3
-
-def decompose(ch: str):
-    if not is_hangul_syllable(ch):
-        return None
-    code = ord(ch) - HANGUL_BASE
-    cho = code // 588
-    jung = (code % 588) // 28
-    jong = code % 28
-    return cho, jung, jong
-
-def compose(cho: int, jung: int, jong: int) -> str:
-    return chr(HANGUL_BASE + cho * 588 + jung * 28 + jong)
-
-def dueum_transform(syll: str) -> str | None:
-    """
-    두음법칙 변환:
-      - 초성 ㄴ: 모음이 IY_JUNG_IDX에 속하면 ㅇ으로 변환, 그 외 변화 없음
-      - 초성 ㄹ: 모음이 IY_JUNG_IDX에 속하면 ㅇ, 아니면 ㄴ으로 변환
-      - 그 외 초성은 변환 없음
-    반환값: 변환된 음절(문자) 또는 None
-    """
-    d = decompose(syll)
-    if d is None:
-        return None
-    cho, jung, jong = d
-    if cho == CHO_N:
-        if jung in IY_JUNG_IDX:
-            return compose(CHO_Yieung, jung, jong)  # 여/요/유/이/야/예/윗류 등
-        return None
-    if cho == CHO_R:
-        if jung in IY_JUNG_IDX:
-            return compose(CHO_Yieung, jung, jong)  # 려/료/류/례/리/랴/률 등 → 여/요/유/예/이/야/율
-        return compose(CHO_N, jung, jong)       # 라/래/로/루/르/뢰... → 나/내/노/누/느/뇌
-    return None
+# 스트리밍 모드(--streaming)에서 한 번에 읽고 디스크에 내려 두는 행 수
+DEFAULT_CHUNK_ROWS = 5000
 
 # -------------------------------------------------------------------------
 # 텍스트 정제
@@ -128,8 +111,32 @@ def clean_field_value(key: str, value: Any) -> str:
 # -------------------------------------------------------------------------
 # XLS 파싱
 # -------------------------------------------------------------------------
+def row_to_entry(row: Mapping[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """행 하나(열 이름 → 값)가 조건에 맞으면 (표기, 엔트리) 반환"""
+    unit = str(row.get("구성 단위", "")).strip()
+    pos = normalize_pos(str(row.get("품사", "")))
+    if unit != ALLOWED_UNIT or pos != ALLOWED_POS:
+        return None
+
+    raw_word = str(row.get("어휘", "")).strip()
+    word = clean_word(raw_word)
+    if len(word) <= 1:
+        return None
+
+    entry: Dict[str, Any] = {}
+    for key in VALID_KEYS:
+        val = row.get(key, None)
+        if isinstance(val, float) and math.isnan(val):
+            continue
+        if val not in (None, "", "nan", "NaN"):
+            entry[key] = clean_field_value(key, str(val))
+    return word, entry
+
 def extract_from_xls(filepath: str) -> Dict[str, List[Dict[str, Any]]]:
     """단일 XLS 파일에서 조건에 맞는 단어 데이터 추출"""
+    # pandas는 메모리 모드에서만 사용 (스트리밍 모드는 xlrd만으로 읽음)
+    import pandas as pd
+
     try:
         df = pd.read_excel(filepath)
     except Exception as e:
@@ -138,30 +145,15 @@ def extract_from_xls(filepath: str) -> Dict[str, List[Dict[str, Any]]]:
 
     result: Dict[str, List[Dict[str, Any]]] = {}
     cols = df.columns.tolist()
-    if not ("구성 단위" in cols and "품사" in cols and "어휘" in cols):
+    if not all(name in cols for name in REQUIRED_COLUMNS):
         print(f"[무시] {os.path.basename(filepath)}: 필수 열 누락")
         return {}
 
     for _, row in df.iterrows():
-        unit = str(row.get("구성 단위", "")).strip()
-        pos = normalize_pos(str(row.get("품사", "")))
-        if unit != ALLOWED_UNIT or pos != ALLOWED_POS:
-            continue
-
-        raw_word = str(row.get("어휘", "")).strip()
-        word = clean_word(raw_word)
-        if len(word) <= 1:
-            continue
-
-        entry: Dict[str, Any] = {}
-        for key in VALID_KEYS:
-            val = row.get(key, None)
-            if isinstance(val, float) and pd.isna(val):
-                continue
-            if val not in (None, "", "nan", "NaN"):
-                entry[key] = clean_field_value(key, str(val))
-
-        result.setdefault(word, []).append(entry or {})
+        item = row_to_entry(row)
+        if item is not None:
+            word, entry = item
+            result.setdefault(word, []).append(entry)
 
     return result
 
@@ -172,59 +164,286 @@ def merge_dicts(main_dict: Dict[str, List[Dict[str, Any]]],
         main_dict.setdefault(k, []).extend(v)
 
 # -------------------------------------------------------------------------
-# 후처리: 이음 수 계산 (두음법칙 포함)
+# 스트리밍 모드: 행 묶음 단위 읽기 + 음절별 부분 결과 디스크 저장
 # -------------------------------------------------------------------------
-def first_syllable(word: str) -> str:
-    return word[0] if word else ""
+def _cell_value(sheet: Any, row_idx: int, col_idx: int) -> Any:
+    """xlrd 셀 값 (pandas처럼 정수인 실수는 int로)"""
+    value = sheet.cell_value(row_idx, col_idx)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def iter_xls_row_chunks(filepath: str, chunk_rows: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    첫 시트를 chunk_rows 행씩, 필요한 열(필수 열 + VALID_KEYS)만 읽음.
+    DataFrame을 만들지 않으며, 다 읽은 시트는 바로 해제한다.
+    """
+    # xlrd는 스트리밍 모드에서만 직접 사용 (메모리 모드는 pandas가 읽음)
+    import xlrd
+
+    try:
+        book = xlrd.open_workbook(filepath, on_demand=True)
+        sheet = book.sheet_by_index(0)
+    except Exception as e:
+        print(f"[경고] {filepath} 읽기 실패: {e}")
+        return
+
+    try:
+        if sheet.nrows == 0:
+            return
+        header = [str(v) for v in sheet.row_values(0)]
+        columns = {name: header.index(name) for name in REQUIRED_COLUMNS + VALID_KEYS
+                   if name in header}
+        if not all(name in columns for name in REQUIRED_COLUMNS):
+            print(f"[무시] {os.path.basename(filepath)}: 필수 열 누락")
+            return
+
+        for start in range(1, sheet.nrows, chunk_rows):
+            stop = min(start + chunk_rows, sheet.nrows)
+            yield [{name: _cell_value(sheet, r, c) for name, c in columns.items()}
+                   for r in range(start, stop)]
+    finally:
+        book.release_resources()
+
+class SyllableSpill:
+    """
+    표기별 엔트리 목록을 첫 음절별 파일(JSON 줄)에 덧붙여 두는 임시 저장소.
+    flush_rows개가 쌓일 때마다 디스크에 내려 메모리에는 묶음 하나만 남는다.
+    """
 
-def last_syllable(word: str) -> str:
-    return word[-1] if word else ""
+    def __init__(self, directory: str, flush_rows: int):
+        self.directory = directory
+        self.flush_rows = max(1, flush_rows)
+        self._buffer: Dict[str, List[str]] = {}
+        self._buffered = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, syllable: str) -> str:
+        return os.path.join(self.directory, f"{ord(syllable):06x}.jsonl")
+
+    def add(self, word: str, entries: List[Dict[str, Any]]):
+        self._buffer.setdefault(word[0], []).append(json.dumps([word, entries], ensure_ascii=False))
+        self._buffered += 1
+        if self._buffered >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        for syllable, lines in self._buffer.items():
+            with open(self._path(syllable), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines))
+                f.write("\n")
+        self._buffer = {}
+        self._buffered = 0
+
+    def syllables(self) -> List[str]:
+        """부분 결과가 있는 첫 음절 (코드 포인트 순)"""
+        self.flush()
+        return sorted(chr(int(name[:-len(".jsonl")], 16))
+                      for name in os.listdir(self.directory) if name.endswith(".jsonl"))
+
+    def load(self, syllable: str) -> Dict[str, List[Dict[str, Any]]]:
+        """한 음절의 부분 결과를 표기별로 병합 (덧붙인 순서 = 파일·행 순서)"""
+        words: Dict[str, List[Dict[str, Any]]] = {}
+        path = self._path(syllable)
+        if not os.path.exists(path):
+            return words
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                word, entries = json.loads(line)
+                words.setdefault(word, []).extend(entries)
+        return words
+
+def iter_json_object_items(path: str, read_size: int = 1 << 20) -> Iterator[Tuple[str, Any]]:
+    """최상위가 객체인 JSON 파일의 (키, 값)을 차례로 읽음 (파일 전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def read_more():
+            nonlocal buf, pos, eof
+            more = f.read(read_size)
+            eof = not more
+            buf = buf[pos:] + more
+            pos = 0
+
+        def next_char() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return buf[pos] if pos < len(buf) else ""
+                read_more()
+
+        def decode() -> Any:
+            nonlocal pos
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    # 버퍼 끝에서 끝난 값은 잘렸을 수 있음 (숫자 등)
+                    if end < len(buf) or eof:
+                        pos = end
+                        return value
+                except ValueError:
+                    if eof:
+                        raise
+                read_more()
+
+        if next_char() != "{":
+            raise ValueError(f"{path}: 최상위가 JSON 객체가 아닙니다.")
+        pos += 1
+        while True:
+            c = next_char()
+            if c == "}":
+                return
+            if c == ",":
+                pos += 1
+                continue
+            if c != '"':
+                raise ValueError(f"{path}: 잘못된 JSON 객체입니다.")
+            key = decode()
+            if next_char() != ":":
+                raise ValueError(f"{path}: 잘못된 JSON 객체입니다.")
+            pos += 1
+            next_char()
+            value = decode()
+            yield key, value
+
+def _write_json_item(f: TextIO, key: str, value: Any, first: bool):
+    """json.dump(..., indent=2)와 같은 모양으로 최상위 객체의 항목 하나를 씀"""
+    f.write("\n" if first else ",\n")
+    f.write("  " + json.dumps(key, ensure_ascii=False) + ": "
+            + json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+
+def build_words_streaming(xls_files: List[str], chunk_rows: int,
+                          spill_dir: Optional[str]) -> Tuple[List[str], str]:
+    """
+    스트리밍 모드로 words.json·words_version.json·words_delta.json을 만들고 (표제어 목록, 사전 버전) 반환.
+    메모리에는 읽는 중인 시트, 행 묶음 하나, 첫 음절 하나의 병합 결과, 표제어 목록만 남는다.
+    words.json의 표기는 첫 음절(코드 포인트) 순으로 묶여 저장된다.
+    """
+    with tempfile.TemporaryDirectory(prefix="extract_words_", dir=spill_dir) as work_dir:
+        new_spill = SyllableSpill(os.path.join(work_dir, "new"), chunk_rows)
+        field_values: Dict[str, set] = {field: set() for field in CATEGORICAL_FIELDS}
+        for filename in xls_files:
+            path = os.path.join(INPUT_DIR, filename)
+            print(f"[처리 중] {filename}")
+            for rows in iter_xls_row_chunks(path, chunk_rows):
+                for row in rows:
+                    item = row_to_entry(row)
+                    if item is not None:
+                        word, entry = item
+                        new_spill.add(word, [entry])
+                        for field in CATEGORICAL_FIELDS:
+                            if field in entry:
+                                field_values[field].add(entry[field])
+        syllables = new_spill.syllables()
+        codes = build_field_codes(field_values)
+
+        # 이음 수 (표제어 목록만으로 계산)
+        keys: List[str] = []
+        for syllable in syllables:
+            keys.extend(new_spill.load(syllable))
+        link_counts = dict(zip(keys, compute_link_counts(keys, DUEUM_STANDARD)))
+
+        # 이전 빌드도 음절별로 내려 두고 음절 단위로 비교 (변경분 계산용)
+        previous_version = None
+        old_spill = None
+        if os.path.exists(OUTPUT_PATH):
+            try:
+                previous_version = compute_file_version(OUTPUT_PATH)
+                old_spill = SyllableSpill(os.path.join(work_dir, "old"), chunk_rows)
+                old_codes = None
+                interned: Dict[str, Dict[str, str]] = {}
+                for word, entries in iter_json_object_items(OUTPUT_PATH):
+                    if word == FIELD_CODES_KEY:
+                        old_codes = entries if isinstance(entries, dict) else None
+                    elif isinstance(entries, list):
+                        decode_entries(entries, old_codes, interned)
+                        old_spill.add(word, entries)
+                old_spill.flush()
+            except (OSError, ValueError):
+                old_spill = None
+
+        parts: Dict[str, Any] = {"removed": [], "added": {}, "changed": {}, "link_counts": {}}
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+            # 범주형 필드는 코드로 저장 (변경분은 코드화 전 내용으로 계산)
+            f.write("{")
+            _write_json_item(f, FIELD_CODES_KEY, codes, True)
+            lookup = code_lookup(codes)
+            for syllable in syllables:
+                group = new_spill.load(syllable)
+                for word, entries in group.items():
+                    for entry in entries:
+                        entry["이음 수"] = int(link_counts[word])
+                    _write_json_item(f, word, encode_entries(entries, lookup), False)
+                if old_spill is not None:
+                    part = compute_delta(old_spill.load(syllable), group, "", "")
+                    for name in parts:
+                        if name == "removed":
+                            parts[name].extend(part[name])
+                        else:
+                            parts[name].update(part[name])
+            f.write("\n}")
+
+        if old_spill is not None:
+            new_syllables = set(syllables)
+            for syllable in old_spill.syllables():
+                if syllable not in new_syllables:
+                    parts["removed"].extend(old_spill.load(syllable))
+
+    print(f"[완료] 총 {len(keys)}개의 어휘를 {OUTPUT_PATH}에 저장했습니다.")
+
+    version = compute_file_version(OUTPUT_PATH)
+    delta = None
+    if old_spill is not None and previous_version != version:
+        delta = {"base_version": previous_version, "version": version, "words_count": len(keys)}
+        delta.update(parts)
+    save_version_and_delta(version, len(keys), delta)
+    return keys, version
 
+# -------------------------------------------------------------------------
+# 후처리: 이음 수 계산 (두음법칙 포함)
+# -------------------------------------------------------------------------
 def add_link_count(words_dict: Dict[str, List[Dict[str, Any]]]) -> None:
     """
-    각 표기의 모든 엔트리에 '이음 수' 필드 추가.
+    각 표기의 모든 엔트리에 '이음 수' 필드 추가 (표준 두음법칙 기준).
     집계 기준:
       T = {마지막 음절, 두음 변환 음절(if any)}
       count = Σ(해당 음절로 시작하는 표기 수) - [자기 자신이 T 중 하나로 시작하면 1]
     """
     keys = list(words_dict.keys())
-
-    # 첫 음절별 개수 맵
-    start_count: Dict[str, int] = {}
-    first_map: Dict[str, List[str]] = {}
-    for w in keys:
-        fs = first_syllable(w)
-        start_count[fs] = start_count.get(fs, 0) + 1
-        first_map.setdefault(fs, []).append(w)
-
-    for w in keys:
-        ls = last_syllable(w)
-        candidates = {ls}
-        if is_hangul_syllable(ls):
-            dueum = dueum_transform(ls)
-            if dueum:
-                candidates.add(dueum)
-
-        # 총합
-        total = sum(start_count.get(c, 0) for c in candidates)
-        # 자기 자신 제외: 자기 첫 음절이 후보에 포함되면 1 제외
-        if first_syllable(w) in candidates:
-            total -= 1
-
+    for w, total in zip(keys, compute_link_counts(keys, DUEUM_STANDARD)):
         for entry in words_dict[w]:
             entry["이음 수"] = int(total)
 
 # -------------------------------------------------------------------------
-# 메인 실행
+# 저장
 # -------------------------------------------------------------------------
-def main():
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    xls_files = [f for f in os.listdir(INPUT_DIR) if f.lower().endswith(".xls")]
-
-    if not xls_files:
-        print(f"[오류] {INPUT_DIR} 폴더에 .xls 파일이 없습니다.")
-        return
-
+def save_version_and_delta(version: str, words_count: int, delta: Optional[Dict[str, Any]]):
+    """사전 버전과 (이전 빌드가 있으면) 이전 빌드 → 새 빌드 변경분 저장"""
+    # 클라이언트가 전체 사전 대신 변경분만 적용
+    if delta is not None:
+        save_delta(DELTA_OUTPUT_PATH, delta)
+        save_version(VERSION_OUTPUT_PATH, version, words_count,
+                     os.path.basename(DELTA_OUTPUT_PATH), delta["base_version"])
+        print(f"[완료] 변경분(추가 {len(delta['added'])}, 삭제 {len(delta['removed'])}, "
+              f"수정 {len(delta['changed'])}, 이음 수 {len(delta['link_counts'])})을 "
+              f"{DELTA_OUTPUT_PATH}에 저장했습니다.")
+    else:
+        if os.path.exists(DELTA_OUTPUT_PATH):
+            os.remove(DELTA_OUTPUT_PATH)
+        save_version(VERSION_OUTPUT_PATH, version, words_count)
+    # 웹 버전은 이 값이 같으면 저장해 둔 색인을 그대로 씀
+    print(f"[완료] 사전 버전({version[:12]})을 {VERSION_OUTPUT_PATH}에 저장했습니다.")
+
+def build_words_in_memory(xls_files: List[str]) -> Tuple[List[str], str]:
+    """
+    모든 파일을 메모리에서 병합해 words.json·words_version.json·words_delta.json을 만들고
+    (표제어 목록, 사전 버전) 반환
+    """
     all_words: Dict[str, List[Dict[str, Any]]] = {}
     for filename in xls_files:
         path = os.path.join(INPUT_DIR, filename)
@@ -235,10 +454,77 @@ def main():
     # 이음 수 계산
     add_link_count(all_words)
 
+    # 이전 빌드 (변경분 계산용)
+    previous_words = None
+    previous_version = None
+    if os.path.exists(OUTPUT_PATH):
+        try:
+            previous_version = compute_file_version(OUTPUT_PATH)
+            previous_words = load_words_file(OUTPUT_PATH)
+        except (OSError, ValueError):
+            previous_words = None
+
+    # 범주형 필드는 코드로 저장 (변경분은 코드화 전 내용으로 계산)
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(all_words, f, ensure_ascii=False, indent=2)
+        json.dump(encode_words(all_words), f, ensure_ascii=False, indent=2)
 
     print(f"[완료] 총 {len(all_words)}개의 어휘를 {OUTPUT_PATH}에 저장했습니다.")
 
+    version = compute_file_version(OUTPUT_PATH)
+    delta = None
+    if isinstance(previous_words, dict) and previous_version != version:
+        delta = compute_delta(previous_words, all_words, previous_version, version)
+    save_version_and_delta(version, len(all_words), delta)
+    return list(all_words.keys()), version
+
+def save_derived_outputs(keys: List[str], version: str):
+    """표제어 목록으로 만드는 부가 파일 저장 (version: words.json 해시, 게임이 파일 짝을 확인하는 데 씀)"""
+    # 표제어 압축 집합 (DAWG)
+    dawg = HeadwordDawg.build(keys, version=version)
+    dawg.save(DAWG_OUTPUT_PATH)
+    print(f"[완료] 표제어 DAWG({dawg.nbytes() / 1024:.0f} KiB)를 {DAWG_OUTPUT_PATH}에 저장했습니다.")
+
+    # 규칙 프로필별 이음 수·색인 (main.py가 게임마다 다시 계산하지 않도록)
+    profile_data = compute_profile_data(keys, version)
+    save_profile_data(RULE_PROFILES_OUTPUT_PATH, profile_data)
+    print(f"[완료] 규칙 프로필 데이터를 {RULE_PROFILES_OUTPUT_PATH}에 저장했습니다.")
+
+    # 초반 봇 후보 오프닝 북 (시작 음절별 정렬 후보)
+    save_opening_book(OPENING_BOOK_OUTPUT_PATH, keys, profile_data)
+    print(f"[완료] 오프닝 북을 {OPENING_BOOK_OUTPUT_PATH}에 저장했습니다.")
+
+    # 초성 검색 색인 (초성 문자열 순 정렬)
+    save_initials_index(INITIALS_INDEX_OUTPUT_PATH, keys, version)
+    print(f"[완료] 초성 검색 색인을 {INITIALS_INDEX_OUTPUT_PATH}에 저장했습니다.")
+
+# -------------------------------------------------------------------------
+# 메인 실행
+# -------------------------------------------------------------------------
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="엑셀(.xls)에서 단어 데이터를 추출해 words.json 등을 생성")
+    parser.add_argument("--streaming", action="store_true",
+                        help="행 묶음 단위로 읽고 첫 음절별 부분 결과를 디스크에 내려 두어 "
+                             "입력 크기와 관계없이 메모리 사용량을 제한")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="스트리밍 모드에서 한 번에 읽고 디스크에 내려 두는 행 수")
+    parser.add_argument("--spill-dir", default=None,
+                        help="스트리밍 모드의 임시 파일 위치 (기본값: 시스템 임시 폴더)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    xls_files = [f for f in os.listdir(INPUT_DIR) if f.lower().endswith(".xls")]
+
+    if not xls_files:
+        print(f"[오류] {INPUT_DIR} 폴더에 .xls 파일이 없습니다.")
+        return
+
+    if args.streaming:
+        keys, version = build_words_streaming(xls_files, max(1, args.chunk_rows), args.spill_dir)
+    else:
+        keys, version = build_words_in_memory(xls_files)
+    save_derived_outputs(keys, version)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,158 @@
+"""
+사전 빌드 사이의 변경분(delta)과 사전 버전
+
+- dev/extract_words_to_json.py는 words.json과 함께 words_version.json(내용 해시)을 만들고,
+  이전 빌드가 있으면 이전 빌드 → 새 빌드 변경분을 words_delta.json으로 만든다.
+- 클라이언트는 가지고 있는 사전이 변경분의 기준 버전과 같으면 전체 사전을 다시 받거나
+  색인을 처음부터 만들지 않고, 변경분만 적용해 색인을 제자리에서 고친다.
+- 데스크톱 앱은 변경분을 적용한 사전을 words.json으로 다시 쓰므로 파일 해시가 새 빌드 버전과
+  달라진다. 이때 words_version.json에 파일 해시(file_version)를 함께 적어 다음 변경분의 기준
+  버전(사전 버전)과 부가 파일의 짝 확인용 버전(파일 버전)을 구분한다.
+
+words_version.json 형식:
+    {"version": 해시, "words_count": N,
+     "delta": {"base_version": 기준 해시, "path": "words_delta.json"},   (변경분이 있을 때만)
+     "file_version": 해시}                                              (version과 다를 때만)
+
+words_delta.json 형식:
+    {"base_version": 기준 해시, "version": 새 해시, "words_count": N,
+     "removed": [표기, ...], "added": {표기: [항목, ...]}, "changed": {표기: [항목, ...]},
+     "link_counts": {표기: 이음 수}}
+    changed     : 이음 수를 제외한 항목 내용이 바뀐 표기
+    link_counts : 새 빌드에서 이음 수(표준 두음법칙)가 바뀌었거나 새로 생긴 표기
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+WORDS_VERSION_PATH = "words_version.json"
+WORDS_DELTA_PATH = "words_delta.json"
+LINK_COUNT_KEY = "이음 수"
+
+
+def compute_file_version(path: str) -> str:
+    """파일 내용의 SHA-256 (사전이 바뀌었는지 확인하는 버전 값)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_version(path: str, version: str, words_count: int, delta_path: Optional[str] = None,
+                 base_version: Optional[str] = None, file_version: Optional[str] = None):
+    data: Dict[str, Any] = {"version": version, "words_count": words_count}
+    if delta_path and base_version:
+        data["delta"] = {"base_version": base_version, "path": delta_path}
+    if file_version and file_version != version:
+        data["file_version"] = file_version
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def load_words_version(words_path: str, version_path: str = WORDS_VERSION_PATH) -> Tuple[str, str]:
+    """
+    (사전 버전, 파일 버전)
+    파일 버전은 words.json 내용 해시. version_path의 file_version이 그 해시와 같으면
+    변경분을 적용해 다시 쓴 사전이므로 사전 버전은 거기 적힌 version, 아니면 파일 버전과 같다.
+    """
+    file_version = compute_file_version(words_path)
+    try:
+        with open(version_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return file_version, file_version
+
+    if (isinstance(data, dict) and data.get("file_version") == file_version
+            and isinstance(data.get("version"), str)):
+        return data["version"], file_version
+    return file_version, file_version
+
+
+def _link_count(entries: List[Dict[str, Any]]) -> int:
+    return max((entry.get(LINK_COUNT_KEY, 0) for entry in entries), default=0)
+
+
+def _without_link_count(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{k: v for k, v in entry.items() if k != LINK_COUNT_KEY} for entry in entries]
+
+
+def compute_delta(old_words: Dict[str, List[Dict[str, Any]]],
+                  new_words: Dict[str, List[Dict[str, Any]]],
+                  base_version: str, version: str) -> Dict[str, Any]:
+    """두 빌드의 words.json 내용으로 변경분 생성"""
+    removed = [w for w in old_words if w not in new_words]
+    added: Dict[str, Any] = {}
+    changed: Dict[str, Any] = {}
+    link_counts: Dict[str, int] = {}
+
+    for word, entries in new_words.items():
+        old_entries = old_words.get(word)
+        if old_entries is None:
+            added[word] = entries
+            link_counts[word] = _link_count(entries)
+            continue
+        if _without_link_count(entries) != _without_link_count(old_entries):
+            changed[word] = entries
+        count = _link_count(entries)
+        if count != _link_count(old_entries):
+            link_counts[word] = count
+
+    return {
+        "base_version": base_version,
+        "version": version,
+        "words_count": len(new_words),
+        "removed": removed,
+        "added": added,
+        "changed": changed,
+        "link_counts": link_counts,
+    }
+
+
+def save_delta(path: str, delta: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(delta, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_delta(path: str) -> Optional[Dict[str, Any]]:
+    """변경분 파일 (없거나 형식이 맞지 않으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(data, dict)
+            or not isinstance(data.get("base_version"), str)
+            or not isinstance(data.get("removed"), list)
+            or not isinstance(data.get("added"), dict)
+            or not isinstance(data.get("changed"), dict)
+            or not isinstance(data.get("link_counts"), dict)):
+        return None
+    return data
+
+
+def apply_delta_to_words(words_data: Dict[str, List[Dict[str, Any]]],
+                         delta: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    words_data를 제자리에서 새 빌드 내용으로 고치고 실제로 바뀐 표기 목록 반환
+    (새 표기는 사전 끝에 추가되므로 표기 순서는 새로 추출한 words.json과 다를 수 있다)
+    """
+    removed = [w for w in delta["removed"] if w in words_data]
+    for word in removed:
+        del words_data[word]
+
+    added = [w for w in delta["added"] if w and w not in words_data]
+    for word in added:
+        words_data[word] = delta["added"][word]
+
+    changed = [w for w in delta["changed"] if w in words_data]
+    for word in changed:
+        words_data[word] = delta["changed"][word]
+
+    for word, count in delta["link_counts"].items():
+        for entry in words_data.get(word, ()):
+            entry[LINK_COUNT_KEY] = count
+
+    return {"removed": removed, "added": added, "changed": changed}
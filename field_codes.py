@@ -0,0 +1,103 @@
+"""
+words.json 항목의 범주형 필드 코드화
+
+- 값 종류가 수십 가지뿐인 필드(고유어 여부, 전문 분야)는 항목마다 문자열 대신 정수 코드로 저장하고,
+  words.json의 빈 문자열 키(표제어가 될 수 없음)에 필드별 값 목록을 둔다.
+- 불러올 때 코드를 값 목록의 문자열로 되돌리므로 같은 값은 문자열 객체 하나를 공유한다.
+  코드 표가 없는 이전 형식 words.json도 그대로 읽으며, 이때는 같은 값의 문자열을 하나로 합친다.
+
+words.json 형식:
+    {"": {"고유어 여부": [값, ...], "전문 분야": [값, ...]},
+     표기: [{"고유어 여부": 코드, "전문 분야": 코드, "발음": ..., ...}, ...], ...}
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+FIELD_CODES_KEY = ""
+CATEGORICAL_FIELDS = ("고유어 여부", "전문 분야")
+
+# 필드 → 값 목록 (코드 = 목록 위치)
+FieldCodes = Dict[str, List[str]]
+
+
+def build_field_codes(values_by_field: Dict[str, Iterable[str]]) -> FieldCodes:
+    """필드별 값 집합으로 코드 표 생성 (값 정렬 순서로 코드를 매겨 빌드마다 안정적)"""
+    return {field: sorted(set(values_by_field.get(field, ()))) for field in CATEGORICAL_FIELDS}
+
+
+def collect_field_codes(words_data: Dict[str, List[Dict[str, Any]]]) -> FieldCodes:
+    return build_field_codes({
+        field: (entry[field] for entries in words_data.values() for entry in entries
+                if isinstance(entry.get(field), str))
+        for field in CATEGORICAL_FIELDS
+    })
+
+
+def code_lookup(codes: FieldCodes) -> Dict[str, Dict[str, int]]:
+    """필드 → {값: 코드}"""
+    return {field: {value: code for code, value in enumerate(values)}
+            for field, values in codes.items()}
+
+
+def encode_entries(entries: List[Dict[str, Any]],
+                   lookup: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+    """항목 목록의 범주형 필드를 코드로 바꾼 사본 (lookup은 code_lookup 결과)"""
+    encoded = []
+    for entry in entries:
+        entry = dict(entry)
+        for field, table in lookup.items():
+            value = entry.get(field)
+            if isinstance(value, str) and value in table:
+                entry[field] = table[value]
+        encoded.append(entry)
+    return encoded
+
+
+def encode_words(words_data: Dict[str, List[Dict[str, Any]]],
+                 codes: Optional[FieldCodes] = None) -> Dict[str, Any]:
+    """코드 표를 앞에 둔 words.json 저장용 사본"""
+    if codes is None:
+        codes = collect_field_codes(words_data)
+    lookup = code_lookup(codes)
+    encoded: Dict[str, Any] = {FIELD_CODES_KEY: codes}
+    for word, entries in words_data.items():
+        encoded[word] = encode_entries(entries, lookup)
+    return encoded
+
+
+def decode_entries(entries: List[Dict[str, Any]], codes: Optional[FieldCodes],
+                   interned: Dict[str, Dict[str, str]]):
+    """항목 목록의 코드를 제자리에서 문자열로 되돌림 (문자열 값은 interned로 하나로 합침)"""
+    for entry in entries:
+        for field in CATEGORICAL_FIELDS:
+            value = entry.get(field)
+            if isinstance(value, int) and codes is not None:
+                values = codes.get(field, ())
+                if 0 <= value < len(values):
+                    entry[field] = values[value]
+            elif isinstance(value, str):
+                entry[field] = interned.setdefault(field, {}).setdefault(value, value)
+
+
+def decode_words(words_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """json.load한 words.json에서 코드 표를 떼어 내고 항목을 제자리에서 되돌림"""
+    if not isinstance(words_data, dict):
+        raise ValueError("words.json의 최상위가 객체가 아닙니다.")
+    codes = words_data.pop(FIELD_CODES_KEY, None)
+    if not isinstance(codes, dict):
+        codes = None
+    interned: Dict[str, Dict[str, str]] = {}
+    if codes is not None:
+        # 코드 표의 값도 같은 문자열 객체를 쓰도록
+        codes = {field: [interned.setdefault(field, {}).setdefault(v, v) for v in values]
+                 for field, values in codes.items() if isinstance(values, list)}
+    for entries in words_data.values():
+        decode_entries(entries, codes, interned)
+    return words_data
+
+
+def load_words_file(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """words.json 로드 (코드화된 필드는 문자열로 되돌림)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return decode_words(json.load(f))
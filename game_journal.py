@@ -0,0 +1,104 @@
+"""
+게임 진행 기록 (무르기·분석 모드용 수순 트리, Tk 의존 없음)
+
+- 단어를 한 수 낼 때마다 그 수로 바뀐 상태(단어, 직전·새 마지막 음절, 이음 수가 줄어든 단어 번호와
+  줄기 전 값)를 노드 하나에 적는다. 무르기·다시 두기는 그 노드의 변경만 되돌리거나 다시 적용하므로
+  비용이 바뀐 단어 수에 비례하고, 사전을 다시 읽거나 이음 수 사본을 만들지 않는다.
+- 무른 자리에서 다른 단어를 내면 형제 노드가 생겨 수순이 갈라진다. 이전 수순은 지워지지 않으므로
+  분석 모드에서 다시 따라갈 수 있다.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+# (단어 번호, 줄기 전 이음 수)
+EuemChanges = Sequence[Tuple[int, int]]
+
+
+class JournalNode:
+    """수순 트리의 한 수 (루트는 게임 시작 전 상태로 word가 빈 문자열)"""
+
+    __slots__ = ("speaker", "word", "prev_last_char", "last_char", "euem_changes",
+                 "parent", "children", "active_child", "ply")
+
+    def __init__(self, speaker: str = "", word: str = "", prev_last_char: str = "",
+                 last_char: str = "", euem_changes: EuemChanges = (),
+                 parent: Optional["JournalNode"] = None):
+        self.speaker = speaker
+        self.word = word
+        self.prev_last_char = prev_last_char
+        self.last_char = last_char
+        self.euem_changes = euem_changes
+        self.parent = parent
+        self.children: List["JournalNode"] = []
+        # 다시 두기(앞으로)할 때 따라갈 자식 (마지막으로 두었거나 되돌아온 수)
+        self.active_child: Optional["JournalNode"] = None
+        self.ply = parent.ply + 1 if parent is not None else 0
+
+    def find_child(self, word: str) -> Optional["JournalNode"]:
+        for child in self.children:
+            if child.word == word:
+                return child
+        return None
+
+
+class GameJournal:
+    """현재 수순 위치를 가리키는 수순 트리"""
+
+    def __init__(self):
+        self.root = JournalNode()
+        self.current = self.root
+
+    def clear(self):
+        self.root = JournalNode()
+        self.current = self.root
+
+    @property
+    def ply(self) -> int:
+        return self.current.ply
+
+    def push(self, speaker: str, word: str, prev_last_char: str, last_char: str,
+             euem_changes: EuemChanges) -> JournalNode:
+        """현재 위치에 한 수를 두고 그 노드로 이동 (같은 단어를 둔 적이 있으면 그 수순을 이어 감)"""
+        parent = self.current
+        node = parent.find_child(word)
+        if node is None:
+            node = JournalNode(speaker, word, prev_last_char, last_char, euem_changes, parent)
+            parent.children.append(node)
+        else:
+            node.euem_changes = euem_changes
+        parent.active_child = node
+        self.current = node
+        return node
+
+    def back(self) -> Optional[JournalNode]:
+        """한 수 뒤로 (되돌릴 노드 반환, 시작 위치면 None)"""
+        node = self.current
+        if node.parent is None:
+            return None
+        node.parent.active_child = node
+        self.current = node.parent
+        return node
+
+    def forward(self, word: Optional[str] = None) -> Optional[JournalNode]:
+        """한 수 앞으로 (word를 주면 그 변화, 아니면 마지막으로 따라간 수. 다시 적용할 노드 반환)"""
+        parent = self.current
+        node = parent.find_child(word) if word is not None else parent.active_child
+        if node is None:
+            return None
+        parent.active_child = node
+        self.current = node
+        return node
+
+    def line(self) -> List[JournalNode]:
+        """시작부터 현재 위치까지의 수 (루트 제외)"""
+        nodes = []
+        node = self.current
+        while node.parent is not None:
+            nodes.append(node)
+            node = node.parent
+        nodes.reverse()
+        return nodes
+
+    def alternatives(self) -> List[JournalNode]:
+        """현재 위치에서 이미 둔 적 있는 다음 수들"""
+        return list(self.current.children)
@@ -0,0 +1,151 @@
+"""
+한글 음절 분해/합성 및 두음법칙 유틸리티 (main.py와 dev/extract_words_to_json.py 공용)
+
+11,172개 완성형 음절 전체에 대해 분해 결과, 초성, 두음 변환 음절,
+두음 변형 집합을 모듈 로드 시 한 번만 계산해 두고 조회만 한다.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+HANGUL_SYLLABLE_COUNT = HANGUL_LAST - HANGUL_BASE + 1  # 11,172
+
+CHOS = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JUNGS = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
+JONGS = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+CHO_N = 2
+CHO_R = 5
+CHO_YIEUNG = 11
+
+# ㄴ/ㄹ이 단어 첫머리에 올 때 'ㅇ'으로 떨어지는 모음군(ㅣ계열·y계열·ㅖ·ㅒ·ㅟ·(보수적으로)ㅢ)
+IY_JUNG_IDX = {20, 2, 6, 12, 17, 7, 16, 3, 19}
+
+# 엄격한 두음법칙: 맞춤법 규정의 ㅣ·y계열(ㅣ·ㅑ·ㅒ·ㅕ·ㅖ·ㅛ·ㅠ)만 'ㅇ'으로 변환 (ㅟ·ㅢ 제외)
+STRICT_IY_JUNG_IDX = {20, 2, 3, 6, 7, 12, 17}
+
+# 두음법칙 적용 방식
+DUEUM_STANDARD = "standard"
+DUEUM_STRICT = "strict"
+DUEUM_OFF = "off"
+DUEUM_MODES = (DUEUM_STANDARD, DUEUM_STRICT, DUEUM_OFF)
+
+
+def is_hangul_syllable(ch: str) -> bool:
+    if not ch:
+        return False
+    o = ord(ch)
+    return HANGUL_BASE <= o <= HANGUL_LAST
+
+
+def compose(cho: int, jung: int, jong: int) -> str:
+    return chr(HANGUL_BASE + cho * 588 + jung * 28 + jong)
+
+
+def _compute_dueum_transform(cho: int, jung: int, jong: int,
+                             iy_jung_idx=IY_JUNG_IDX) -> Optional[str]:
+    """
+    두음법칙 변환:
+      - 초성 ㄴ: 모음이 IY_JUNG_IDX에 속하면 ㅇ으로 변환, 그 외 변화 없음
+      - 초성 ㄹ: 모음이 IY_JUNG_IDX에 속하면 ㅇ, 아니면 ㄴ으로 변환
+      - 그 외 초성은 변환 없음
+    """
+    if cho == CHO_N:
+        if jung in iy_jung_idx:
+            return compose(CHO_YIEUNG, jung, jong)  # 여/요/유/이/야/예/윗류 등
+        return None
+
+    if cho == CHO_R:
+        if jung in iy_jung_idx:
+            return compose(CHO_YIEUNG, jung, jong)  # 려/료/류/례/리/랴/률 등 → 여/요/유/예/이/야/율
+        return compose(CHO_N, jung, jong)       # 라/래/로/루/르/뢰... → 나/내/노/누/느/뇌
+
+    return None
+
+
+# -------------------------------------------------------------------------
+# 음절별 사전 계산 테이블
+# -------------------------------------------------------------------------
+DECOMPOSITIONS: List[Tuple[int, int, int]] = [
+    (code // 588, (code % 588) // 28, code % 28)
+    for code in range(HANGUL_SYLLABLE_COUNT)
+]
+
+# 음절 → 두음 변환 음절 (변환이 없는 음절은 포함하지 않음)
+DUEUM_TRANSFORMS: Dict[str, str] = {}
+STRICT_DUEUM_TRANSFORMS: Dict[str, str] = {}
+
+# 음절 → 가능한 시작 음절 집합 (자기 자신 + 두음 변환 음절)
+#   변환이 없는 음절은 방식과 관계없이 같은 단일 원소 집합 객체를 공유
+SINGLE_VARIANTS: Dict[str, FrozenSet[str]] = {}
+DUEUM_VARIANTS: Dict[str, FrozenSet[str]] = {}
+STRICT_DUEUM_VARIANTS: Dict[str, FrozenSet[str]] = {}
+
+# str.translate용: 음절 코드 → 초성 자모
+INITIAL_CONSONANT_TABLE: Dict[int, str] = {}
+
+for _code, (_cho, _jung, _jong) in enumerate(DECOMPOSITIONS):
+    _syllable = chr(HANGUL_BASE + _code)
+    _single = SINGLE_VARIANTS[_syllable] = frozenset((_syllable,))
+
+    _transformed = _compute_dueum_transform(_cho, _jung, _jong)
+    if _transformed:
+        DUEUM_TRANSFORMS[_syllable] = _transformed
+        DUEUM_VARIANTS[_syllable] = frozenset((_syllable, _transformed))
+    else:
+        DUEUM_VARIANTS[_syllable] = _single
+
+    _strict = _compute_dueum_transform(_cho, _jung, _jong, STRICT_IY_JUNG_IDX)
+    if _strict:
+        STRICT_DUEUM_TRANSFORMS[_syllable] = _strict
+        STRICT_DUEUM_VARIANTS[_syllable] = (
+            DUEUM_VARIANTS[_syllable] if _strict == _transformed
+            else frozenset((_syllable, _strict))
+        )
+    else:
+        STRICT_DUEUM_VARIANTS[_syllable] = _single
+
+    INITIAL_CONSONANT_TABLE[HANGUL_BASE + _code] = CHOS[_cho]
+
+del _code, _cho, _jung, _jong, _syllable, _single, _transformed, _strict
+
+_TRANSFORMS_BY_MODE: Dict[str, Dict[str, str]] = {
+    DUEUM_STANDARD: DUEUM_TRANSFORMS,
+    DUEUM_STRICT: STRICT_DUEUM_TRANSFORMS,
+    DUEUM_OFF: {},
+}
+_VARIANTS_BY_MODE: Dict[str, Dict[str, FrozenSet[str]]] = {
+    DUEUM_STANDARD: DUEUM_VARIANTS,
+    DUEUM_STRICT: STRICT_DUEUM_VARIANTS,
+    DUEUM_OFF: SINGLE_VARIANTS,
+}
+
+_EMPTY_VARIANTS: FrozenSet[str] = frozenset()
+
+
+def decompose(ch: str) -> Optional[Tuple[int, int, int]]:
+    if not is_hangul_syllable(ch):
+        return None
+    return DECOMPOSITIONS[ord(ch) - HANGUL_BASE]
+
+
+def dueum_transform(syll: str, mode: str = DUEUM_STANDARD) -> Optional[str]:
+    """두음법칙에 따른 음절 변환."""
+    return _TRANSFORMS_BY_MODE[mode].get(syll)
+
+
+def get_initial_consonants(word: str) -> str:
+    """한글 음절은 초성으로, 그 외 문자는 그대로 둔 문자열"""
+    return word.translate(INITIAL_CONSONANT_TABLE)
+
+
+def get_dueum_variants(syllable: str, mode: str = DUEUM_STANDARD) -> FrozenSet[str]:
+    """두음법칙을 적용한 가능한 시작 음절 집합"""
+    if not syllable:
+        return _EMPTY_VARIANTS
+
+    variants = _VARIANTS_BY_MODE[mode].get(syllable)
+    if variants is None:
+        variants = frozenset((syllable,))
+    return variants
@@ -0,0 +1,553 @@
+"""
+표제어 집합을 최소 DAWG(방향성 비순환 단어 그래프)로 압축 저장하는 모듈
+
+- dev/extract_words_to_json.py가 words.json과 함께 words.dawg를 생성하고, main.py는 파일에 적힌
+  사전 버전(words.json 내용 해시)이 같으면 불러와 표제어 집합으로 쓴다.
+- 포함 여부와 단어 → 번호(가나다순 0..N-1) 변환은 O(len(word))이며,
+  노드·간선은 array 배열에만 저장되어 단어 문자열을 따로 두지 않는다.
+- 접두사로 시작하는 단어는 번호가 연속하므로 개수는 O(len(prefix)), 나열은 그 부분 그래프만 따라간다.
+- DawgHeadwords는 DAWG에 사전 변경분(추가·삭제)을 얹은 표제어 색인, DawgWordsData는 항목 목록을
+  문자열 키 dict 대신 단어 번호 순 목록에 두는 words_data 대용 매핑이다.
+- WordIds는 게임 색인(이음 수 배열 등)이 단어 문자열 대신 쓰는 단어 번호 공간이다.
+
+파일 형식 (리틀 엔디언):
+    MAGIC(8) | 노드 수, 간선 수, 단어 수, 버전 길이 (uint32 × 4) | 버전(ASCII)
+    | 배열 6개 (각각 typecode(1) + 데이터)
+    배열 순서: node_first_edge, node_final, node_count, edge_label, edge_target, edge_offset
+"""
+
+import bisect
+import heapq
+import struct
+import sys
+from array import array
+from collections.abc import ItemsView, ValuesView
+from typing import (Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional,
+                    Sequence, Set, Tuple)
+
+MAGIC = b"WCDAWG2\0"
+_HEADER = struct.Struct("<IIII")
+
+_PREFIX_UPPER_SENTINEL = chr(0x10FFFF)
+
+
+class _BuildNode:
+    __slots__ = ("final", "edges", "_key")
+
+    def __init__(self):
+        self.final = False
+        self.edges: Dict[str, "_BuildNode"] = {}
+        self._key: Optional[Tuple] = None
+
+    def key(self) -> Tuple:
+        if self._key is None:
+            self._key = (self.final,
+                         tuple((label, id(child)) for label, child in self.edges.items()))
+        return self._key
+
+
+def _build_minimal_automaton(words: List[str]) -> _BuildNode:
+    """정렬된 단어 목록으로 최소 비순환 오토마톤을 점진적으로 구성 (Daciuk 알고리즘)"""
+    root = _BuildNode()
+    register: Dict[Tuple, _BuildNode] = {}
+    unchecked: List[Tuple[_BuildNode, str, _BuildNode]] = []
+    previous = ""
+
+    def minimize(down_to: int):
+        while len(unchecked) > down_to:
+            parent, label, child = unchecked.pop()
+            existing = register.get(child.key())
+            if existing is not None:
+                parent.edges[label] = existing
+            else:
+                register[child.key()] = child
+
+    for word in words:
+        common = 0
+        limit = min(len(word), len(previous))
+        while common < limit and word[common] == previous[common]:
+            common += 1
+
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for label in word[common:]:
+            child = _BuildNode()
+            node.edges[label] = child
+            unchecked.append((node, label, child))
+            node = child
+        node.final = True
+        previous = word
+
+    minimize(0)
+    return root
+
+
+def _pack_array(typecode: str, values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(typecode, values)
+        values.byteswap()
+    return typecode.encode("ascii") + values.tobytes()
+
+
+class HeadwordDawg:
+    """표제어 포함 여부와 단어 ↔ 번호 변환을 제공하는 압축 단어 집합"""
+
+    def __init__(self, node_first_edge: array, node_final: array, node_count: array,
+                 edge_label: array, edge_target: array, edge_offset: array, version: str = ""):
+        # 만들 때 기준으로 삼은 words.json의 버전 (dictionary_delta.compute_file_version)
+        self.version = version
+        self.node_first_edge = node_first_edge
+        self.node_final = node_final
+        self.node_count = node_count
+        self.edge_label = edge_label
+        self.edge_target = edge_target
+        self.edge_offset = edge_offset
+
+    # ---------------------------------------------------------------------
+    # 생성 / 저장 / 불러오기
+    # ---------------------------------------------------------------------
+    @classmethod
+    def build(cls, words: Iterable[str], version: str = "") -> "HeadwordDawg":
+        root = _build_minimal_automaton(sorted(set(w for w in words if w)))
+
+        # 노드 번호 부여 (루트 = 0, 깊이 우선 순서)
+        order: List[_BuildNode] = []
+        index_of: Dict[int, int] = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in index_of:
+                continue
+            index_of[id(node)] = len(order)
+            order.append(node)
+            for child in reversed(list(node.edges.values())):
+                if id(child) not in index_of:
+                    stack.append(child)
+
+        # 각 노드에서 도달 가능한 단어 수 (자식 먼저 계산)
+        counts = [0] * len(order)
+        done = [False] * len(order)
+        for start in range(len(order)):
+            if done[start]:
+                continue
+            stack2 = [(start, False)]
+            while stack2:
+                idx, expanded = stack2.pop()
+                if done[idx]:
+                    continue
+                node = order[idx]
+                if not expanded:
+                    stack2.append((idx, True))
+                    for child in node.edges.values():
+                        child_idx = index_of[id(child)]
+                        if not done[child_idx]:
+                            stack2.append((child_idx, False))
+                    continue
+                counts[idx] = int(node.final) + sum(
+                    counts[index_of[id(child)]] for child in node.edges.values()
+                )
+                done[idx] = True
+
+        label_code = "H" if all(
+            ord(label) <= 0xFFFF for node in order for label in node.edges
+        ) else "I"
+
+        node_first_edge = array("I")
+        node_final = array("B")
+        node_count = array("I", counts)
+        edge_label = array(label_code)
+        edge_target = array("I")
+        edge_offset = array("I")
+
+        for node in order:
+            node_first_edge.append(len(edge_label))
+            node_final.append(1 if node.final else 0)
+            offset = 1 if node.final else 0
+            for label in sorted(node.edges):
+                child_idx = index_of[id(node.edges[label])]
+                edge_label.append(ord(label))
+                edge_target.append(child_idx)
+                edge_offset.append(offset)
+                offset += counts[child_idx]
+        node_first_edge.append(len(edge_label))
+
+        return cls(node_first_edge, node_final, node_count,
+                   edge_label, edge_target, edge_offset, version)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            version = self.version.encode("ascii")
+            f.write(_HEADER.pack(len(self.node_final), len(self.edge_label), len(self), len(version)))
+            f.write(version)
+            for typecode, values in (
+                (self.node_first_edge.typecode, self.node_first_edge),
+                (self.node_final.typecode, self.node_final),
+                (self.node_count.typecode, self.node_count),
+                (self.edge_label.typecode, self.edge_label),
+                (self.edge_target.typecode, self.edge_target),
+                (self.edge_offset.typecode, self.edge_offset),
+            ):
+                f.write(_pack_array(typecode, values))
+
+    @classmethod
+    def load(cls, path: str) -> "HeadwordDawg":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: DAWG 파일 형식이 아닙니다.")
+
+        num_nodes, num_edges, _, version_size = _HEADER.unpack_from(data, len(MAGIC))
+        pos = len(MAGIC) + _HEADER.size
+        version = data[pos:pos + version_size].decode("ascii", errors="replace")
+        pos += version_size
+        arrays: List[array] = []
+        for length in (num_nodes + 1, num_nodes, num_nodes, num_edges, num_edges, num_edges):
+            typecode = chr(data[pos])
+            pos += 1
+            values = array(typecode)
+            size = values.itemsize * length
+            values.frombytes(data[pos:pos + size])
+            if len(values) != length:
+                raise ValueError(f"{path}: DAWG 파일이 손상되었습니다.")
+            if sys.byteorder != "little":
+                values.byteswap()
+            arrays.append(values)
+            pos += size
+
+        return cls(*arrays, version=version)
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.node_count[0] if self.node_count else 0
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.word_to_id(word) >= 0
+
+    def _follow(self, node: int, ch: str) -> int:
+        """node에서 ch 간선의 번호 (없으면 -1)"""
+        code = ord(ch)
+        lo = self.node_first_edge[node]
+        hi = self.node_first_edge[node + 1]
+        edge = bisect.bisect_left(self.edge_label, code, lo, hi)
+        if edge == hi or self.edge_label[edge] != code:
+            return -1
+        return edge
+
+    def word_to_id(self, word: str) -> int:
+        """가나다순 단어 번호 (없는 단어는 -1)"""
+        if not self.node_count:
+            return -1
+
+        node = 0
+        word_id = 0
+        for ch in word:
+            edge = self._follow(node, ch)
+            if edge < 0:
+                return -1
+            word_id += self.edge_offset[edge]
+            node = self.edge_target[edge]
+
+        return word_id if self.node_final[node] else -1
+
+    def _walk(self, prefix: str) -> Tuple[int, int]:
+        """prefix를 따라간 (노드, 그 아래 첫 단어의 번호), 없는 접두사면 (-1, 0)"""
+        if not self.node_count:
+            return -1, 0
+        node = 0
+        word_id = 0
+        for ch in prefix:
+            edge = self._follow(node, ch)
+            if edge < 0:
+                return -1, 0
+            word_id += self.edge_offset[edge]
+            node = self.edge_target[edge]
+        return node, word_id
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """prefix로 시작하는 단어의 번호 구간 [시작, 끝)"""
+        node, start = self._walk(prefix)
+        if node < 0:
+            return 0, 0
+        return start, start + self.node_count[node]
+
+    def iter_prefix(self, prefix: str) -> Iterator[Tuple[int, str]]:
+        """prefix로 시작하는 (번호, 단어)를 가나다순으로"""
+        node, start = self._walk(prefix)
+        if node < 0:
+            return
+        node_first_edge, node_final = self.node_first_edge, self.node_final
+        edge_label, edge_target, edge_offset = self.edge_label, self.edge_target, self.edge_offset
+        stack = [(node, prefix, start)]
+        while stack:
+            node, text, base = stack.pop()
+            if node_final[node]:
+                yield base, text
+            # 작은 글자의 간선이 먼저 나오도록 역순으로 쌓음
+            for edge in range(node_first_edge[node + 1] - 1, node_first_edge[node] - 1, -1):
+                stack.append((edge_target[edge], text + chr(edge_label[edge]),
+                              base + edge_offset[edge]))
+
+    def id_to_word(self, word_id: int) -> str:
+        if not 0 <= word_id < len(self):
+            raise IndexError(word_id)
+
+        chars: List[str] = []
+        node = 0
+        remaining = word_id
+        while True:
+            if self.node_final[node]:
+                if remaining == 0:
+                    return "".join(chars)
+                remaining -= 1
+
+            lo = self.node_first_edge[node]
+            hi = self.node_first_edge[node + 1]
+            # edge_offset는 노드 안에서 오름차순이므로 이분 탐색으로 구간 선택
+            edge = bisect.bisect_right(self.edge_offset, remaining + int(self.node_final[node]), lo, hi) - 1
+            remaining -= self.edge_offset[edge] - int(self.node_final[node])
+            chars.append(chr(self.edge_label[edge]))
+            node = self.edge_target[edge]
+
+    def __iter__(self) -> Iterator[str]:
+        for word_id in range(len(self)):
+            yield self.id_to_word(word_id)
+
+    def nbytes(self) -> int:
+        """배열이 차지하는 바이트 수"""
+        return sum(values.itemsize * len(values) for values in (
+            self.node_first_edge, self.node_final, self.node_count,
+            self.edge_label, self.edge_target, self.edge_offset,
+        ))
+
+
+class WordIds:
+    """표제어 ↔ 단어 번호 (게임 색인이 문자열 대신 번호를 보관하도록)
+
+    DAWG가 있으면 DAWG 단어 번호를 그대로 쓰고, DAWG에 없는 표제어는 그 뒤 번호를 차례로 받는다.
+    한 번 받은 번호는 바뀌지 않는다 (삭제된 표제어의 번호는 색인에서 빈 자리로 남음).
+    """
+
+    def __init__(self, dawg: Optional[HeadwordDawg] = None):
+        self.dawg = dawg
+        self._base = len(dawg) if dawg is not None else 0
+        # DAWG 뒤 번호의 단어와 그 역방향
+        self._words: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._base + len(self._words)
+
+    def get(self, word: str) -> int:
+        """단어 번호 (번호가 없는 단어는 -1)"""
+        if self.dawg is not None:
+            word_id = self.dawg.word_to_id(word)
+            if word_id >= 0:
+                return word_id
+        return self._ids.get(word, -1)
+
+    def add(self, word: str) -> int:
+        """단어 번호 (없으면 새 번호를 줌)"""
+        word_id = self.get(word)
+        if word_id < 0:
+            word_id = len(self)
+            self._ids[word] = word_id
+            self._words.append(word)
+        return word_id
+
+    def assign(self, words: Sequence[str]) -> array:
+        """words 순서의 단어 번호 (빈 문자열은 -1)
+
+        번호가 없던 단어는 가나다순으로 새 번호를 받으므로, DAWG가 없어도
+        처음 불러온 사전 안에서는 번호 순서가 가나다순과 같다.
+        """
+        word_ids = array("i", (self.get(w) if w else -1 for w in words))
+        missing = sorted(w for w, word_id in zip(words, word_ids) if word_id < 0 and w)
+        if missing:
+            for w in missing:
+                self.add(w)
+            for idx, w in enumerate(words):
+                if word_ids[idx] < 0 and w:
+                    word_ids[idx] = self._ids[w]
+        return word_ids
+
+    def word(self, word_id: int) -> str:
+        if word_id < self._base:
+            return self.dawg.id_to_word(word_id)
+        return self._words[word_id - self._base]
+
+
+class DawgHeadwords:
+    """DAWG에 사전 변경분을 얹은 표제어 색인 (main.py PrefixIndex와 같은 조회 방법)
+
+    DAWG는 고칠 수 없으므로 삭제된 표제어는 단어 번호로, DAWG에 없는 새 표제어는 정렬 목록으로 둔다.
+    """
+
+    def __init__(self, dawg: HeadwordDawg):
+        self.dawg = dawg
+        self._removed: Set[int] = set()
+        self._added: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.dawg) - len(self._removed) + len(self._added)
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        word_id = self.dawg.word_to_id(word)
+        if word_id >= 0:
+            return word_id not in self._removed
+        idx = bisect.bisect_left(self._added, word)
+        return idx < len(self._added) and self._added[idx] == word
+
+    def add(self, word: str):
+        if not word:
+            return
+        word_id = self.dawg.word_to_id(word)
+        if word_id >= 0:
+            self._removed.discard(word_id)
+            return
+        idx = bisect.bisect_left(self._added, word)
+        if idx == len(self._added) or self._added[idx] != word:
+            self._added.insert(idx, word)
+
+    def remove(self, word: str):
+        word_id = self.dawg.word_to_id(word)
+        if word_id >= 0:
+            self._removed.add(word_id)
+            return
+        idx = bisect.bisect_left(self._added, word)
+        if idx < len(self._added) and self._added[idx] == word:
+            del self._added[idx]
+
+    def _added_range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect.bisect_left(self._added, prefix)
+        return lo, bisect.bisect_left(self._added, prefix + _PREFIX_UPPER_SENTINEL, lo)
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """prefix로 시작하는 표제어 (가나다순)"""
+        if not prefix:
+            return
+        removed = self._removed
+        words = (word for word_id, word in self.dawg.iter_prefix(prefix) if word_id not in removed)
+        lo, hi = self._added_range(prefix)
+        if lo == hi:
+            yield from words
+        else:
+            yield from heapq.merge(words, self._added[lo:hi])
+
+    def count_prefix(self, prefix: str) -> int:
+        if not prefix:
+            return 0
+        start, end = self.dawg.prefix_range(prefix)
+        lo, hi = self._added_range(prefix)
+        return (end - start - sum(1 for word_id in self._removed if start <= word_id < end)
+                + hi - lo)
+
+    def has_prefix(self, prefix: str) -> bool:
+        return self.count_prefix(prefix) > 0
+
+
+class DawgWordsData(MutableMapping):
+    """표제어 → 항목 목록 매핑 (문자열 키 dict 대신 DAWG 단어 번호 순 목록에 보관)
+
+    삭제는 그 번호의 자리를 비우고, DAWG에 없는 새 표제어는 따로 둔다.
+    순회 순서는 가나다순(DAWG 단어) 다음에 새 표제어다.
+    """
+
+    def __init__(self, dawg: HeadwordDawg, words_data: Optional[Mapping[str, Any]] = None,
+                 word_ids: Optional[Sequence[int]] = None):
+        """word_ids: words_data 순회 순서의 단어 번호 (WordIds.assign 결과가 있으면 다시 찾지 않음)"""
+        self.dawg = dawg
+        self._entries: List[Optional[Any]] = [None] * len(dawg)
+        self._extra: Dict[str, Any] = {}
+        self._count = 0
+        if words_data is None:
+            return
+        if word_ids is None:
+            for word, entries in words_data.items():
+                self[word] = entries
+            return
+        base = len(dawg)
+        for word_id, (word, entries) in zip(word_ids, words_data.items()):
+            if 0 <= word_id < base and self._entries[word_id] is None:
+                self._entries[word_id] = entries
+                self._count += 1
+            else:
+                self[word] = entries
+
+    def _word_id(self, word: object) -> int:
+        return self.dawg.word_to_id(word) if isinstance(word, str) else -1
+
+    def __getitem__(self, word: str) -> Any:
+        word_id = self._word_id(word)
+        if word_id >= 0:
+            entries = self._entries[word_id]
+            if entries is None:
+                raise KeyError(word)
+            return entries
+        return self._extra[word]
+
+    def __contains__(self, word: object) -> bool:
+        word_id = self._word_id(word)
+        if word_id >= 0:
+            return self._entries[word_id] is not None
+        return word in self._extra
+
+    def __setitem__(self, word: str, entries: Any):
+        word_id = self._word_id(word)
+        if word_id >= 0:
+            if self._entries[word_id] is None:
+                self._count += 1
+            self._entries[word_id] = entries
+            return
+        if word not in self._extra:
+            self._count += 1
+        self._extra[word] = entries
+
+    def __delitem__(self, word: str):
+        word_id = self._word_id(word)
+        if word_id >= 0:
+            if self._entries[word_id] is None:
+                raise KeyError(word)
+            self._entries[word_id] = None
+        else:
+            del self._extra[word]
+        self._count -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        entries = self._entries
+        for word_id, word in self.dawg.iter_prefix(""):
+            if entries[word_id] is not None:
+                yield word
+        yield from list(self._extra)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> ItemsView:
+        return _DawgWordsItems(self)
+
+    def values(self) -> ValuesView:
+        return _DawgWordsValues(self)
+
+    def _iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """(표기, 항목 목록)을 순회 순서대로 (기본 보기처럼 단어마다 번호를 다시 찾지 않음)"""
+        entries = self._entries
+        for word_id, word in self.dawg.iter_prefix(""):
+            if entries[word_id] is not None:
+                yield word, entries[word_id]
+        yield from list(self._extra.items())
+
+
+class _DawgWordsItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._mapping._iter_items()
+
+
+class _DawgWordsValues(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        return (entries for _, entries in self._mapping._iter_items())
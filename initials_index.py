@@ -0,0 +1,135 @@
+"""
+초성(및 음절 혼합) 검색 색인
+
+- 표제어를 초성 문자열 순으로 정렬해 두고, 검색어를 초성으로 바꾼 접두사 구간을
+  이분 탐색으로 찾는다. 검색어 중 완성된 음절은 그 자리의 음절이 같은지만 다시 확인한다.
+  예) 'ㅅㄱ' → 사과, 시간, 수건 ... / '사ㄱ' → 사과, 사건 ...
+- dev/extract_words_to_json.py가 initials_index.json으로 정렬 순서를 미리 만들어 두고,
+  파일이 없으면 처음 검색할 때 정렬한다.
+
+initials_index.json 형식:
+    {"version": 사전 버전, "words_count": N, "order": [단어 번호, ...]}
+    order는 초성 문자열, 단어 순 정렬 (words.json 키 순서 기준).
+    version(만들 때 쓴 words.json의 버전)이 다르면 쓰지 않는다.
+"""
+
+import bisect
+import heapq
+import json
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from hangul import get_initial_consonants, is_hangul_syllable
+
+INITIALS_INDEX_PATH = "initials_index.json"
+
+_UPPER_SENTINEL = chr(0x10FFFF)
+
+
+def compute_initials_order(words: Sequence[str]) -> List[int]:
+    """단어 번호를 (초성 문자열, 단어) 순으로 정렬"""
+    return sorted((idx for idx, w in enumerate(words) if w),
+                  key=lambda idx: (get_initial_consonants(words[idx]), words[idx]))
+
+
+def save_initials_index(path: str, words: Sequence[str], version: str = ""):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"version": version, "words_count": len(words),
+                            "order": compute_initials_order(words)}, separators=(",", ":")))
+
+
+def load_initials_index(path: str, words: Sequence[str], version: str) -> Optional[List[int]]:
+    """미리 만든 정렬 순서 (없거나 다른 버전의 words.json으로 만들었으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(data, dict) or not version or data.get("version") != version
+            or data.get("words_count") != len(words)
+            or not isinstance(data.get("order"), list) or len(data["order"]) > len(words)):
+        return None
+    return data["order"]
+
+
+class InitialsIndex:
+    """초성 문자열 순으로 정렬한 (초성, 단어) 병렬 배열 (처음 검색할 때 만듦)"""
+
+    def __init__(self, load_words: Callable[[], Sequence[str]],
+                 order: Optional[Sequence[int]] = None):
+        """load_words: 만들 때 부르는 표제어 목록 함수 (order는 그 목록의 번호, 만들기 전에 문자열을 잡아 두지 않음)"""
+        self._load_words: Optional[Callable[[], Sequence[str]]] = load_words
+        self._source_order = order
+        # 만들기 전에 들어온 사전 변경분 (removed, added)
+        self._pending_deltas: List[Tuple[Sequence[str], Sequence[str]]] = []
+        self._initials: Optional[List[str]] = None
+        self._words: List[str] = []
+
+    def _ensure_built(self):
+        if self._initials is not None:
+            return
+        words = self._load_words()
+        order = self._source_order
+        if order is None:
+            order = compute_initials_order(words)
+        self._words = [words[idx] for idx in order]
+        self._initials = [get_initial_consonants(w) for w in self._words]
+        self._load_words = None
+        self._source_order = None
+
+        pending, self._pending_deltas = self._pending_deltas, []
+        for removed, added in pending:
+            self.apply_delta(removed, added)
+
+    def apply_delta(self, removed: Sequence[str], added: Sequence[str]):
+        """표제어 삭제·추가 반영 (아직 만들지 않았으면 만들 때 반영)"""
+        if self._initials is None:
+            self._pending_deltas.append((removed, added))
+            return
+
+        initials, words = self._initials, self._words
+        for word in removed:
+            key = get_initial_consonants(word)
+            idx = bisect.bisect_left(initials, key)
+            while idx < len(initials) and initials[idx] == key:
+                if words[idx] == word:
+                    del initials[idx]
+                    del words[idx]
+                    break
+                idx += 1
+        for word in added:
+            if not word:
+                continue
+            key = get_initial_consonants(word)
+            idx = bisect.bisect_left(initials, key)
+            while idx < len(initials) and initials[idx] == key and words[idx] < word:
+                idx += 1
+            initials.insert(idx, key)
+            words.insert(idx, word)
+
+    def iter_matches(self, query: str) -> Iterator[str]:
+        """검색어와 자리마다 음절이 같거나 초성이 같은 단어로 시작하는 표제어"""
+        if not query:
+            return
+        self._ensure_built()
+        key = get_initial_consonants(query)
+        lo = bisect.bisect_left(self._initials, key)
+        hi = bisect.bisect_left(self._initials, key + _UPPER_SENTINEL, lo)
+
+        fixed = [(pos, ch) for pos, ch in enumerate(query) if is_hangul_syllable(ch)]
+        for idx in range(lo, hi):
+            word = self._words[idx]
+            if all(word[pos] == ch for pos, ch in fixed):
+                yield word
+
+    def search(self, query: str, limit: int,
+               rank_key: Optional[Callable[[str], Any]] = None) -> List[str]:
+        """일치하는 표제어 중 순위 상위 limit개 (기본 순위: 짧은 단어, 가나다순)"""
+        if rank_key is None:
+            rank_key = _default_rank_key
+        return heapq.nsmallest(limit, self.iter_matches(query), key=rank_key)
+
+
+def _default_rank_key(word: str):
+    return (len(word), word)
+
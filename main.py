@@ -1,108 +1,737 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
+import argparse
+import atexit
+import bisect
+import contextlib
+import cProfile
+import heapq
 import json
+import math
+import os
+import pstats
+import queue
 import random
+import sqlite3
+import sys
 import threading
-from typing import Dict, List, Optional, Set, Tuple
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+from itertools import accumulate
+from typing import (Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, MutableMapping,
+                    Optional, Sequence, Set, Tuple)
+
+from hangul import compose, decompose, get_initial_consonants, is_hangul_syllable
+from headword_dawg import DawgHeadwords, DawgWordsData, HeadwordDawg, WordIds
+from dictionary_delta import (WORDS_DELTA_PATH, WORDS_VERSION_PATH, apply_delta_to_words,
+                              compute_file_version, load_delta, load_words_version, save_version)
+from field_codes import encode_words, load_words_file
+from game_journal import GameJournal, JournalNode
+from initials_index import INITIALS_INDEX_PATH, InitialsIndex, load_initials_index, save_initials_index
+from opening_book import OPENING_BOOK_PATH, OpeningBook, load_opening_book, save_opening_book
+from stats_store import DEFAULT_PLAYER, STATS_DB_PATH, StatsStore
+from suggestion_index import SuggestionIndex
+from rule_profiles import (DEFAULT_RULE_PROFILE, RULE_PROFILES, RULE_PROFILES_PATH, RuleProfile,
+                           RuleTables, build_rule_tables, compute_profile_data, load_profile_data,
+                           save_profile_data)
+from word_rules import NOT_IN_DICTIONARY, check_word
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 표준 라이브러리 구현으로 동작
+    np = None
 
 # -------------------------------------------------------------------------
-# 한글 유니코드 분해/합성 및 두음법칙 유틸리티
+# 봇 후보 문턱값 필터링 및 가중치 추첨
+#   NumPy가 있으면 벡터 연산, 없으면 array/bisect로 같은 순서의 연산을 수행해
+#   같은 시드에서 항상 같은 결과(random.choices와 동일한 추첨)를 낸다.
 # -------------------------------------------------------------------------
-HANGUL_BASE = 0xAC00
-CHOS = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-JUNGS = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
-JONGS = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+NUMPY_MIN_CANDIDATES = 64
 
-CHO_N = 2
-CHO_R = 5
-CHO_YIEUNG = 11
 
-# ㄴ/ㄹ이 단어 첫머리에 올 때 'ㅇ'으로 떨어지는 모음군(ㅣ계열·y계열·ㅖ·ㅒ·ㅟ·(보수적으로)ㅢ)
-IY_JUNG_IDX = {20, 2, 6, 12, 17, 7, 16, 3, 19}
+def _should_use_numpy(size: int, use_numpy: Optional[bool]) -> bool:
+    if np is None or use_numpy is False:
+        return False
+    return use_numpy is True or size >= NUMPY_MIN_CANDIDATES
+
+
+def threshold_candidate_indices(euems: Sequence[int], min_threshold: int,
+                                exclude_zero: bool,
+                                use_numpy: Optional[bool] = None) -> Tuple[List[int], int]:
+    """이음 수 문턱값을 통과한 후보 인덱스와 문턱값 때문에 제외된 후보 수 반환"""
+    if _should_use_numpy(len(euems), use_numpy):
+        values = np.asarray(euems, dtype=np.int64)
+        eligible = values != 0 if exclude_zero else np.ones(values.shape, dtype=bool)
+        above = values >= min_threshold
+        kept = np.flatnonzero(eligible & above)
+        return kept.tolist(), int(np.count_nonzero(eligible & ~above))
+
+    kept_indices: List[int] = []
+    rejected = 0
+    for idx, euem in enumerate(euems):
+        if exclude_zero and euem == 0:
+            continue
+        if euem < min_threshold:
+            rejected += 1
+            continue
+        kept_indices.append(idx)
+    return kept_indices, rejected
+
+
+def candidate_cum_weights(euems: Sequence[int], difficulty_factor: float,
+                          use_numpy: Optional[bool] = None) -> Sequence[float]:
+    """난이도에 따른 후보별 가중치의 누적합"""
+    if _should_use_numpy(len(euems), use_numpy):
+        values = np.asarray(euems, dtype=np.int64)
+        min_euem = values.min()
+        max_euem = values.max()
+        if max_euem == min_euem:
+            weights = np.ones(values.shape, dtype=np.float64)
+        else:
+            normalized = (values - min_euem) / (max_euem - min_euem)
+            high_pref = (1.0 - difficulty_factor) * normalized
+            low_pref = difficulty_factor * (1.0 - normalized)
+            weights = high_pref + low_pref + 0.05
+        return np.cumsum(weights)
+
+    min_euem = min(euems)
+    max_euem = max(euems)
+    if max_euem == min_euem:
+        weights = array('d', [1.0]) * len(euems)
+    else:
+        span = max_euem - min_euem
+        weights = array('d')
+        for euem in euems:
+            normalized = (euem - min_euem) / span
+            high_pref = (1.0 - difficulty_factor) * normalized
+            low_pref = difficulty_factor * (1.0 - normalized)
+            weights.append(high_pref + low_pref + 0.05)
+    return list(accumulate(weights))
+
+
+def weighted_choice_index(euems: Sequence[int], difficulty_factor: float,
+                          rand: Callable[[], float] = random.random,
+                          use_numpy: Optional[bool] = None) -> int:
+    """random.choices(k=1)과 같은 방식(누적합 + 이분 탐색)으로 후보 인덱스 추첨"""
+    cum_weights = candidate_cum_weights(euems, difficulty_factor, use_numpy)
+    last = len(euems) - 1
+    point = rand() * float(cum_weights[-1])
+    if isinstance(cum_weights, list):
+        return bisect.bisect_right(cum_weights, point, 0, last)
+    return min(int(np.searchsorted(cum_weights, point, side='right')), last)
+
+
+# -------------------------------------------------------------------------
+# 성능 계측 (환경 변수 WORDCHAINER_TELEMETRY=1 로 활성화)
+# -------------------------------------------------------------------------
+TELEMETRY_ENV_VAR = "WORDCHAINER_TELEMETRY"
+TELEMETRY_OUTPUT_PATH = "telemetry.jsonl"
+
+_NULL_TIMER = contextlib.nullcontext()
+
+
+class _TelemetryTimer:
+    __slots__ = ("telemetry", "name", "start")
+
+    def __init__(self, telemetry: "Telemetry", name: str):
+        self.telemetry = telemetry
+        self.name = name
+        self.start = 0.0
 
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
 
-def is_hangul_syllable(ch: str) -> bool:
-    if not ch:
+    def __exit__(self, exc_type, exc, tb):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        self.telemetry.record_time(self.name, elapsed_ms)
         return False
-    o = ord(ch)
-    return 0xAC00 <= o <= 0xD7A3
 
 
-def decompose(ch: str) -> Optional[Tuple[int, int, int]]:
-    if not is_hangul_syllable(ch):
-        return None
-    code = ord(ch) - HANGUL_BASE
-    cho = code // 588
-    jung = (code % 588) // 28
-    jong = code % 28
-    return cho, jung, jong
+class Telemetry:
+    """핫패스 구간별 소요 시간과 카운터를 턴 단위로 수집"""
+
+    def __init__(self, enabled: bool = False, output_path: str = TELEMETRY_OUTPUT_PATH):
+        self.enabled = enabled
+        self.output_path = output_path
+        self._lock = threading.Lock()
+        # name -> [호출 수, 누적 ms, 최대 ms]
+        self.timings: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.turn_records: List[Dict[str, Any]] = []
+        self.turn_index = 0
+        self._turn_timings: Dict[str, float] = {}
+        self._turn_counters: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "Telemetry":
+        flag = os.environ.get(TELEMETRY_ENV_VAR, "").strip().lower()
+        return cls(enabled=flag not in ("", "0", "false", "no", "off"))
+
+    def timer(self, name: str):
+        """구간 시간 측정용 컨텍스트 매니저 (비활성 시 공유 no-op 반환)"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _TelemetryTimer(self, name)
+
+    def record_time(self, name: str, elapsed_ms: float):
+        with self._lock:
+            stat = self.timings.get(name)
+            if stat is None:
+                self.timings[name] = [1, elapsed_ms, elapsed_ms]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed_ms
+                if elapsed_ms > stat[2]:
+                    stat[2] = elapsed_ms
+            self._turn_timings[name] = self._turn_timings.get(name, 0.0) + elapsed_ms
+
+    def count(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+            self._turn_counters[name] = self._turn_counters.get(name, 0) + amount
+
+    def end_turn(self, speaker: str, word: Optional[str] = None):
+        """현재 턴 동안 모인 측정값을 턴 기록으로 확정"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.turn_index += 1
+            self.turn_records.append({
+                "type": "turn",
+                "turn": self.turn_index,
+                "speaker": speaker,
+                "word": word,
+                "timings_ms": {k: round(v, 3) for k, v in self._turn_timings.items()},
+                "counters": dict(self._turn_counters),
+            })
+            self._turn_timings = {}
+            self._turn_counters = {}
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "type": "summary",
+                "timings_ms": {
+                    name: {
+                        "calls": int(calls),
+                        "total": round(total, 3),
+                        "avg": round(total / calls, 3) if calls else 0.0,
+                        "max": round(peak, 3),
+                    }
+                    for name, (calls, total, peak) in sorted(self.timings.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def format_report(self) -> str:
+        data = self.summary()
+        lines = [f"{'구간':<32}{'호출':>7}{'평균ms':>10}{'최대ms':>10}{'합계ms':>11}"]
+        for name, stat in data["timings_ms"].items():
+            lines.append(
+                f"{name:<32}{stat['calls']:>7}{stat['avg']:>10.2f}"
+                f"{stat['max']:>10.2f}{stat['total']:>11.1f}"
+            )
+        lines.append("")
+        for name, value in data["counters"].items():
+            lines.append(f"{name:<32}{value:>10}")
+        return "\n".join(lines)
+
+    def dump(self):
+        """턴 기록과 요약을 JSON-lines 형식으로 덧붙여 저장"""
+        if not self.enabled:
+            return
+        summary = self.summary()
+        with self._lock:
+            records = list(self.turn_records)
+            self.turn_records.clear()
+        try:
+            with open(self.output_path, 'a', encoding='utf-8') as f:
+                session = {"type": "session", "timestamp": time.time()}
+                f.write(json.dumps(session, ensure_ascii=False) + "\n")
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+
+
+# -------------------------------------------------------------------------
+# 프로파일링 캡처 모드 (--profile / --trace-memory)
+# -------------------------------------------------------------------------
+PROFILE_OUTPUT_DIR = "profiles"
+TRACEMALLOC_FRAMES = 10
+TRACEMALLOC_TOP_N = 25
+
+
+class SessionProfiler:
+    """세션을 cProfile/tracemalloc으로 감싸고 게임 종료마다 결과 파일 저장"""
+
+    def __init__(self, profile: bool = False, trace_memory: bool = False,
+                 output_dir: str = PROFILE_OUTPUT_DIR):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.output_dir = output_dir
+        self.session_id = time.strftime("%Y%m%d-%H%M%S")
+        self.game_index = 0
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        # 봇 작업 스레드에서 수집한 프로파일 (cProfile은 스레드별로 동작)
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def active(self) -> bool:
+        return self.profile or self.trace_memory
+
+    def start(self):
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        if self.trace_memory:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self):
+        """세션 종료 시 남은 기록을 저장하고 수집 중지"""
+        self.capture("exit")
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def mark_game_start(self):
+        """새 게임의 메모리 비교 기준점 설정"""
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.take_snapshot()
+
+    def runcall(self, func, *args, **kwargs):
+        """다른 스레드에서 실행되는 함수를 별도 프로파일로 측정"""
+        if not self.profile:
+            return func(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._thread_profiles.append(profiler)
+
+    def capture(self, reason: str) -> List[str]:
+        """현재까지의 측정 결과를 파일로 저장하고 다음 게임을 위해 초기화"""
+        if not self.active:
+            return []
 
+        self.game_index += 1
+        base_name = f"{self.session_id}_game{self.game_index:03d}_{reason}"
+        written: List[str] = []
 
-def compose(cho: int, jung: int, jong: int) -> str:
-    return chr(HANGUL_BASE + cho * 588 + jung * 28 + jong)
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            if self.profile and self._profiler is not None:
+                written.append(self._write_pstats(base_name))
+            if self.trace_memory and tracemalloc.is_tracing():
+                written.append(self._write_memory_report(base_name, reason))
+        except OSError:
+            pass
 
+        return written
+
+    def _write_pstats(self, base_name: str) -> str:
+        self._profiler.disable()
+        stats = pstats.Stats(self._profiler)
+        with self._lock:
+            thread_profiles = self._thread_profiles
+            self._thread_profiles = []
+        for profiler in thread_profiles:
+            stats.add(profiler)
+
+        path = os.path.join(self.output_dir, base_name + ".pstats")
+        stats.dump_stats(path)
+
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        return path
+
+    def _write_memory_report(self, base_name: str, reason: str) -> str:
+        snapshot = tracemalloc.take_snapshot()
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+
+        lines = [
+            f"# 게임 {self.game_index} ({reason})",
+            f"현재 추적 메모리: {current / 1024:.1f} KiB",
+            f"최대 추적 메모리: {peak / 1024:.1f} KiB",
+            "",
+            f"## 상위 할당 위치 (상위 {TRACEMALLOC_TOP_N}개)",
+        ]
+        for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP_N]:
+            lines.append(str(stat))
+
+        if self._baseline is not None:
+            lines.append("")
+            lines.append(f"## 게임 시작 대비 증가량 (상위 {TRACEMALLOC_TOP_N}개)")
+            for stat in snapshot.compare_to(self._baseline, "lineno")[:TRACEMALLOC_TOP_N]:
+                lines.append(str(stat))
+
+        path = os.path.join(self.output_dir, base_name + "_memory.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+        tracemalloc.reset_peak()
+        self._baseline = snapshot
+        return path
+
+
+# 표제어 압축 집합 (있으면 포함 여부 확인에 사용, 없으면 words.json 키 사용)
+HEADWORD_DAWG_PATH = "words.dawg"
+
+# 채팅창에 보관할 최대 줄 수 (초과 시 오래된 줄부터 삭제)
+CHAT_MAX_LINES = 500
+
+# 미리 렌더링한 단어 정보 문서를 보관할 개수
+WORD_INFO_CACHE_SIZE = 256
+
+
+class WordInfoCache:
+    """렌더링된 단어 정보 문서(Text.insert 인자 튜플)의 스레드 안전 LRU 캐시
+
+    사전이 바뀌면 세대가 올라가며, 이전 세대의 내용으로 렌더링한 문서는 넣지 않는다.
+    """
+
+    def __init__(self, maxsize: int = WORD_INFO_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._documents: "OrderedDict[str, Tuple[Any, ...]]" = OrderedDict()
+        self.generation = 0
+
+    def __contains__(self, word: str) -> bool:
+        with self._lock:
+            return word in self._documents
+
+    def get(self, word: str) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            document = self._documents.get(word)
+            if document is not None:
+                self._documents.move_to_end(word)
+            return document
+
+    def put(self, word: str, document: Tuple[Any, ...], generation: Optional[int] = None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._documents[word] = document
+            self._documents.move_to_end(word)
+            while len(self._documents) > self.maxsize:
+                self._documents.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self.generation += 1
+
+    def invalidate(self, words: Iterable[str]):
+        """바뀐 단어의 문서를 버리고 세대를 올림 (렌더링 중이던 이전 내용이 들어오지 않도록)"""
+        with self._lock:
+            for word in words:
+                self._documents.pop(word, None)
+            self.generation += 1
+
+
+# 봇 후보 풀을 보관할 개수
+BOT_POOL_CACHE_SIZE = 128
+
+
+class BotCandidatePoolCache:
+    """봇 후보 풀의 스레드 안전 LRU 캐시 (적중/실패 횟수 집계)
+
+    키에 후보 음절 범위와 겹치는 사용 단어 집합이 들어가므로,
+    캐시된 풀에는 사용된 단어가 들어 있을 수 없다.
+    """
+
+    def __init__(self, maxsize: int = BOT_POOL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pools: "OrderedDict[Tuple[Any, ...], Tuple[array, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pools)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[array, int]]:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._pools.move_to_end(key)
+            return pool
+
+    def put(self, key: Tuple[Any, ...], pool: Tuple[array, int]):
+        with self._lock:
+            self._pools[key] = pool
+            self._pools.move_to_end(key)
+            while len(self._pools) > self.maxsize:
+                self._pools.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._pools.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._pools)}
+
+
+# 사용자 턴 동안 미리 계산할 사용자 응답의 끝 음절 수 (가능한 응답이 많이 끝나는 음절부터)
+BOT_SPECULATION_SYLLABLES = 12
+# 봇이 단어를 내기까지의 최소 대기 시간 (계산은 제출 즉시 시작)
+BOT_MIN_THINK_MS = 1000
+# 봇 턴 시작 시 중단한 미리 계산 스레드가 끝나기를 기다리는 최대 시간 (초)
+BOT_SPECULATION_JOIN_TIMEOUT = 0.5
+
+
+class BotSpeculation:
+    """사용자 턴 동안 백그라운드에서 미리 계산하는 다음 봇 턴 준비 작업
+
+    사용자가 낼 수 있는 응답의 끝 음절마다 봇 후보 풀을 풀 캐시에 채우고, 풀 단어의 끝 음절별로
+    기준 사용 단어 집합(응답 직전)에서 그 뒤에 올 수 있는 미사용 단어 수를 모은다.
+    봇은 실제 응답으로 늘어난 사용 단어만큼 빼서 안전성 검사에 쓴다.
+
+    스레드는 시작할 때의 사용 단어·이음 수 사본만 읽고, 끝 음절별 단어 수는 실행이 끝날 때
+    (중단돼도) 읽기 전용 매핑 followup_counts로 한 번만 내놓는다. 봇 턴은 스레드가 끝나기를 기다린 뒤 읽는다.
+    """
+
+    def __init__(self, dueum_mode: str, base_used: FrozenSet[str],
+                 base_euems: Optional[array] = None):
+        self.dueum_mode = dueum_mode
+        self.base_used = base_used
+        # 시작 시점의 단어 번호별 현재 이음 수 사본 (사용자 응답의 이음 수 0 제한을 확인할 때만 필요)
+        self.base_euems = base_euems
+        self.followup_counts: Optional[Mapping[str, int]] = None
+        self.syllables_done = 0
+        self.thread: Optional[threading.Thread] = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def publish(self, followup_counts: Dict[str, int]):
+        self.followup_counts = MappingProxyType(followup_counts)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """스레드가 끝날 때까지 대기 (끝났으면 True)"""
+        thread = self.thread
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
 
-def get_initial_consonants(word: str) -> str:
-    initials: List[str] = []
 
-    for ch in word:
-        decomp = decompose(ch)
-        if decomp is None:
-            initials.append(ch)
-        else:
-            cho, _, _ = decomp
-            initials.append(CHOS[cho])
+# -------------------------------------------------------------------------
+# 접두사 색인 (입력 중 실시간 검증·자동 완성)
+# -------------------------------------------------------------------------
+# 입력창 아래에 보여 줄 자동 완성 단어 수
+ENTRY_COMPLETION_LIMIT = 5
+
+# 단어 정보 패널의 초성 검색 결과 수
+WORD_SEARCH_LIMIT = 30
+# 사전에 없는 단어를 냈을 때 보여 줄 비슷한 단어 수
+WORD_SUGGEST_LIMIT = 5
+
+_PREFIX_UPPER_SENTINEL = chr(0x10FFFF)
+
+
+class PrefixIndex:
+    """첫 음절별로 분할·정렬한 표제어 배열 (이분 탐색으로 접두사 구간 조회)"""
+
+    def __init__(self, words: Iterable[str]):
+        partitions: Dict[str, List[str]] = {}
+        for word in words:
+            if word:
+                partitions.setdefault(word[0], []).append(word)
+        for partition in partitions.values():
+            partition.sort()
+        self._partitions = partitions
+
+    def prefix_range(self, prefix: str) -> Tuple[List[str], int, int]:
+        """접두사로 시작하는 표제어가 차지하는 (배열, 시작, 끝) 구간"""
+        if not prefix:
+            return [], 0, 0
+        partition = self._partitions.get(prefix[0])
+        if not partition:
+            return [], 0, 0
+        lo = bisect.bisect_left(partition, prefix)
+        hi = bisect.bisect_left(partition, prefix + _PREFIX_UPPER_SENTINEL, lo)
+        return partition, lo, hi
+
+    def add(self, word: str):
+        if word:
+            bisect.insort(self._partitions.setdefault(word[0], []), word)
+
+    def remove(self, word: str):
+        partition = self._partitions.get(word[:1])
+        if not partition:
+            return
+        idx = bisect.bisect_left(partition, word)
+        if idx < len(partition) and partition[idx] == word:
+            del partition[idx]
 
-    return ''.join(initials)
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        partition, lo, hi = self.prefix_range(prefix)
+        for idx in range(lo, hi):
+            yield partition[idx]
 
+    def has_prefix(self, prefix: str) -> bool:
+        _, lo, hi = self.prefix_range(prefix)
+        return hi > lo
 
-def dueum_transform(syll: str) -> Optional[str]:
-    """두음법칙에 따른 음절 변환."""
-    decomp = decompose(syll)
-    if decomp is None:
-        return None
+    def count_prefix(self, prefix: str) -> int:
+        _, lo, hi = self.prefix_range(prefix)
+        return hi - lo
 
-    cho, jung, jong = decomp
-    if cho == CHO_N:
-        if jung in IY_JUNG_IDX:
-            return compose(CHO_YIEUNG, jung, jong)
-        return None
+    def __len__(self) -> int:
+        return sum(len(partition) for partition in self._partitions.values())
 
-    if cho == CHO_R:
-        if jung in IY_JUNG_IDX:
-            return compose(CHO_YIEUNG, jung, jong)
-        return compose(CHO_N, jung, jong)
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        partition, lo, hi = self.prefix_range(word)
+        return lo < hi and partition[lo] == word
 
-    return None
 
-class WordChainGame:
+# -------------------------------------------------------------------------
+# UI 갱신 스케줄러
+#   상태·타이머·진행 막대·채팅 변경을 바로 반영하지 않고 모아 두었다가
+#   Tk가 유휴 상태가 될 때 한 번에 반영 (같은 위젯 옵션은 마지막 값만 적용)
+# -------------------------------------------------------------------------
+class UiUpdateScheduler:
+    """위젯 옵션 변경과 지연 작업을 합쳐 유휴 시점에 한 번 반영 (Tk 메인 스레드 전용)"""
+
     def __init__(self, root):
         self.root = root
+        self.pending_options: Dict[Any, Dict[str, Any]] = {}
+        self.pending_tasks: Dict[str, Callable[[], None]] = {}
+        self.flush_after_id: Optional[str] = None
+
+    def configure(self, widget, **options):
+        """widget.config(**options)를 다음 반영 시점으로 미룸"""
+        self.pending_options.setdefault(widget, {}).update(options)
+        self._schedule()
+
+    def defer(self, key: str, task: Callable[[], None]):
+        """같은 key의 작업은 반영 시점에 한 번만 실행"""
+        self.pending_tasks[key] = task
+        self._schedule()
+
+    def _schedule(self):
+        if self.flush_after_id is None:
+            self.flush_after_id = self.root.after_idle(self._on_idle)
+
+    def _on_idle(self):
+        self.flush_after_id = None
+        self.flush()
+
+    def flush(self):
+        """대기 중인 변경을 즉시 반영"""
+        if self.flush_after_id is not None:
+            self.root.after_cancel(self.flush_after_id)
+            self.flush_after_id = None
+
+        tasks, self.pending_tasks = self.pending_tasks, {}
+        options, self.pending_options = self.pending_options, {}
+        for task in tasks.values():
+            task()
+        for widget, widget_options in options.items():
+            widget.config(**widget_options)
+
+
+class WordChainGame:
+    def __init__(self, root, profiler: Optional[SessionProfiler] = None,
+                 chat_max_lines: int = CHAT_MAX_LINES, player: str = DEFAULT_PLAYER,
+                 stats_path: str = STATS_DB_PATH):
+        self.root = root
+        self.profiler = profiler
         self.root.title("끝말잇기 게임")
         self.root.geometry("900x700")
         self.root.configure(bg="#f5f5f5")
         self.try_maximize_window()
         
         # 게임 데이터
-        self.words_data: Dict = {}
-        self.words_by_first_char: Dict[str, List[str]] = {}
-        self.words_by_last_char_variants: Dict[str, Set[str]] = {}
+        # 표기 → 항목 목록 (words.dawg가 있으면 DAWG 단어 번호로 보관하는 DawgWordsData)
+        self.words_data: MutableMapping[str, List[Dict[str, Any]]] = {}
+        # 사전 버전 (변경분의 기준 버전과 비교)과 words.json 파일 해시 (부가 파일의 짝 확인)
+        self.words_version = ""
+        self.words_file_version = ""
+        # 표제어 집합·접두사 조회 (words.dawg가 있으면 DawgHeadwords, 없으면 PrefixIndex)
+        self.headwords: Any = PrefixIndex(())
+        # 표제어 ↔ 단어 번호 (아래 색인과 이음 수 배열은 문자열 대신 이 번호를 씀)
+        self.word_ids = WordIds()
+        # 두음법칙 방식별 색인 (사전 로드 시 한 번 생성, 게임마다 규칙 프로필에 맞게 교체)
+        self.rule_tables: Dict[str, RuleTables] = {}
+        self.rule_profile: RuleProfile = RULE_PROFILES[DEFAULT_RULE_PROFILE]
+        self.opening_book: Optional[OpeningBook] = None
+        self.words_by_last_char_variants: Dict[str, array] = {}
+        # 첫 음절별 단어 번호, 초기 이음 수 내림차순 정렬
+        self.words_ranked_by_first_char: Dict[str, array] = {}
+        # 단어 번호별 초기 이음 수 (규칙 프로필의 색인, 읽기 전용)
+        self.initial_euems = array('i')
+        # 단어 번호별 현재 이음 수 (게임 시작 시 프로필의 초기값 복사, apply_dueum_decrease 시 감소)
+        self.word_max_euem = array('i')
+        self.euem_version = 0
+        self.possible_words_memo: Optional[Tuple[Tuple[Any, ...], List[str]]] = None
+        self.initials_index = InitialsIndex(tuple)
+        self.suggestion_index = SuggestionIndex(self.headwords.iter_prefix)
         self.used_words: Set[str] = set()
         self.game_history: List[Tuple[str, str]] = []  # (speaker, word)
         self.current_last_char: str = ""
         self.bot_difficulty: int = 3  # 1-5, 초기 슬라이더 값(3)에 대응
 
-        self.word_tag_counter = 0
+        self.chat_max_lines = max(1, int(chat_max_lines))
+        self.word_info_cache = WordInfoCache()
+        self.bot_pool_cache = BotCandidatePoolCache()
+        # (단어, 항목 사본, 캐시 세대): 사본은 Tk 스레드에서 만들어 사전 변경과 겹치지 않게 함
+        self.word_info_prefetch_queue: "queue.Queue[Tuple[str, List[Dict[str, Any]], int]]" = queue.Queue()
+        self.word_info_prefetch_thread: Optional[threading.Thread] = None
+        self.dictionary_save_thread: Optional[threading.Thread] = None
         self.base_turn_time_limit = 30
         self.turn_time_limit = self.base_turn_time_limit
         self.timer_seconds_remaining = 0
+        # 턴 종료 시각 (time.monotonic 기준, 타이머가 멈춰 있으면 None)
+        self.timer_deadline: Optional[float] = None
         self.timer_after_id: Optional[str] = None
+        self.ui = UiUpdateScheduler(self.root)
+        self.pending_chat_segments: List[Any] = []  # (문자열, 태그, ...) 순서
         self.pending_bot_after_id: Optional[str] = None
         self.bot_turn_sequence = 0
+        self.bot_speculation: Optional[BotSpeculation] = None
         self.game_active = False
         self.hint_used_in_game = False
-
-        self.stats_file = "game_stats.json"
+        self.takeback_used_in_game = False
+        # 무르기·분석 모드용 수순 기록 (게임 시작 시 비움)
+        self.game_journal = GameJournal()
+        self.analysis_mode = False
+
+        self.stats_path = stats_path
+        self.stats_store: Optional[StatsStore] = None
+        self.player = player
         self.win_count = 0
         self.loss_count = 0
         self.stats_by_difficulty = {
@@ -111,6 +740,14 @@ class WordChainGame:
         self.difficulty_stats_rows = {}
         self.active_game_difficulty: Optional[int] = None
 
+        self.telemetry = Telemetry.from_env()
+        self.debug_panel: Optional[tk.Toplevel] = None
+        self.debug_panel_text: Optional[tk.Text] = None
+        self.debug_panel_after_id: Optional[str] = None
+        if self.telemetry.enabled:
+            atexit.register(self.telemetry.dump)
+            self.root.bind('<F12>', self.toggle_debug_panel)
+
         self.load_stats()
 
         self.setup_ui()
@@ -186,6 +823,19 @@ class WordChainGame:
 
         difficulty_scale.config(command=self.on_difficulty_change)
         self.on_difficulty_change(self.difficulty_var.get())
+
+        # 규칙 선택 (다음 게임 시작 시 적용)
+        rule_frame = tk.Frame(left_panel, bg="white", relief=tk.RAISED, bd=1)
+        rule_frame.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(rule_frame, text="규칙:", font=("맑은 고딕", 18),
+                bg="white").pack(side=tk.LEFT, padx=10, pady=10)
+
+        self.rule_profile_var = tk.StringVar(value=self.rule_profile.label)
+        rule_menu = tk.OptionMenu(rule_frame, self.rule_profile_var,
+                                  *(profile.label for profile in RULE_PROFILES.values()))
+        rule_menu.config(font=("맑은 고딕", 14), bg="white", highlightthickness=0)
+        rule_menu.pack(side=tk.LEFT, padx=10, pady=10)
         
         # 게임 상태
         status_frame = tk.Frame(left_panel, bg="white", relief=tk.RAISED, bd=1)
@@ -236,6 +886,7 @@ class WordChainGame:
                                lambda e: self.chat_text.config(cursor="hand2"))
         self.chat_text.tag_bind("word_link", "<Leave>",
                                lambda e: self.chat_text.config(cursor=""))
+        self.chat_text.tag_bind("word_link", "<Button-1>", self.on_word_link_click)
         
         # 입력 영역
         input_frame = tk.Frame(left_panel, bg="white", relief=tk.RAISED, bd=1)
@@ -246,6 +897,7 @@ class WordChainGame:
         self.word_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, 
                             padx=10, pady=10)
         self.word_entry.bind('<Return>', lambda e: self.submit_word())
+        self.word_entry.bind('<KeyRelease>', self.on_word_entry_change)
 
         self.word_entry.config(state=tk.DISABLED)
         
@@ -255,6 +907,12 @@ class WordChainGame:
                               relief=tk.FLAT, padx=20,
                               command=self.submit_word)
         submit_btn.pack(side=tk.RIGHT, padx=10, pady=10)
+
+        self.entry_feedback_label = tk.Label(left_panel, text="",
+                                             font=("맑은 고딕", 14),
+                                             bg="#f5f5f5", fg="#7f8c8d",
+                                             anchor=tk.W, justify=tk.LEFT)
+        self.entry_feedback_label.pack(fill=tk.X, padx=5, pady=(5, 0))
         
         # 오른쪽 패널 (단어 정보)
         right_panel = tk.Frame(main_container, bg="white",
@@ -269,6 +927,19 @@ class WordChainGame:
                  font=("맑은 고딕", 16, "bold"),
                  bg="#eef5ff", fg="#2c3e50").pack(anchor=tk.W, padx=10, pady=(10, 5))
 
+        # 플레이어 프로필 (목록에서 고르거나 새 이름 입력 후 Enter)
+        player_frame = tk.Frame(stats_panel, bg="#eef5ff")
+        player_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
+        tk.Label(player_frame, text="플레이어:", font=("맑은 고딕", 12),
+                 bg="#eef5ff", fg="#2c3e50").pack(side=tk.LEFT)
+        self.player_var = tk.StringVar(value=self.player)
+        self.player_combo = ttk.Combobox(player_frame, textvariable=self.player_var,
+                                         font=("맑은 고딕", 12), width=14)
+        self.player_combo.pack(side=tk.LEFT, padx=(5, 0))
+        self.player_combo.bind("<<ComboboxSelected>>", self.on_player_selected)
+        self.player_combo.bind("<Return>", self.on_player_selected)
+        self.refresh_player_list()
+
         self.difficulty_stats_rows = {}
         for level in range(1, 6):
             row_frame = tk.Frame(stats_panel, bg="#eef5ff")
@@ -293,7 +964,23 @@ class WordChainGame:
         tk.Label(right_panel, text="단어 정보",
                 font=("맑은 고딕", 20, "bold"),
                 bg="white").pack(anchor=tk.W, padx=10, pady=10)
-        
+
+        # 초성·접두사 검색 (예: ㅅㄱ, 사ㄱ)
+        search_frame = tk.Frame(right_panel, bg="white")
+        search_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
+
+        self.word_search_entry = tk.Entry(search_frame, font=("맑은 고딕", 14),
+                                          relief=tk.FLAT, bg="#fafafa")
+        self.word_search_entry.pack(fill=tk.X)
+        self.word_search_entry.bind('<KeyRelease>', self.on_word_search_change)
+        self.word_search_entry.bind('<Return>', lambda e: self.show_first_search_result())
+
+        self.word_search_results = tk.Listbox(search_frame, font=("맑은 고딕", 13),
+                                              height=6, relief=tk.FLAT, bg="#fafafa",
+                                              activestyle=tk.NONE, exportselection=False)
+        self.word_search_results.pack(fill=tk.X, pady=(5, 0))
+        self.word_search_results.bind('<<ListboxSelect>>', self.on_word_search_select)
+
         self.info_text = scrolledtext.ScrolledText(right_panel,
                                                    font=("맑은 고딕", 14),
                                                    bg="#fafafa",
@@ -335,83 +1022,142 @@ class WordChainGame:
                                 relief=tk.FLAT, padx=30, pady=10,
                                 command=self.forfeit_game)
         forfeit_btn.pack(side=tk.LEFT, padx=5)
+
+        # 무르기·분석 모드 (게임 중 무르기는 승리 기록 제외)
+        undo_btn = tk.Button(button_frame, text="◀ 무르기",
+                             font=("맑은 고딕", 16),
+                             bg="#95a5a6", fg="white",
+                             relief=tk.FLAT, padx=15, pady=10,
+                             command=self.step_back)
+        undo_btn.pack(side=tk.LEFT, padx=5)
+
+        redo_btn = tk.Button(button_frame, text="앞으로 ▶",
+                             font=("맑은 고딕", 16),
+                             bg="#95a5a6", fg="white",
+                             relief=tk.FLAT, padx=15, pady=10,
+                             command=self.step_forward)
+        redo_btn.pack(side=tk.LEFT, padx=5)
+
+        self.analysis_btn = tk.Button(button_frame, text="분석",
+                                      font=("맑은 고딕", 16, "bold"),
+                                      bg="#8e44ad", fg="white",
+                                      relief=tk.FLAT, padx=15, pady=10,
+                                      command=self.toggle_analysis)
+        self.analysis_btn.pack(side=tk.LEFT, padx=5)
+        self.root.bind('<Control-z>', self.step_back)
+        self.root.bind('<Control-y>', self.step_forward)
         self.update_hint_status_label()
         
     def load_words(self):
         """words.json 파일 로드"""
         try:
-            with open('words.json', 'r', encoding='utf-8') as f:
-                self.words_data = json.load(f)
-            self.build_word_indexes()
+            with self.telemetry.timer("load_words"):
+                words_data = load_words_file('words.json')
+                self.words_version, self.words_file_version = load_words_version('words.json')
+                dawg = self.load_headword_dawg()
+                self.words_data = words_data
+                del words_data
+                self.build_word_indexes(dawg)
+                delta_summary = self.apply_dictionary_delta()
+            self.word_info_cache.clear()
             self.add_system_message(f"✓ 사전 로드 완료: {len(self.words_data)}개 단어")
+            if delta_summary is not None:
+                self.add_system_message(
+                    f"✓ 사전 변경분 적용: 추가 {len(delta_summary['added'])}, "
+                    f"삭제 {len(delta_summary['removed'])}, 수정 {len(delta_summary['changed'])}")
+                # 다음 실행은 고친 사전과 부가 파일을 바로 불러오도록 저장
+                self.start_patched_dictionary_save()
         except FileNotFoundError:
             self.show_warning_message("words.json 파일을 찾을 수 없습니다.")
-        except json.JSONDecodeError:
+        except ValueError:
             self.show_warning_message("JSON 파일 형식이 올바르지 않습니다.")
 
+    def load_headword_dawg(self, path: str = HEADWORD_DAWG_PATH) -> Optional[HeadwordDawg]:
+        """압축 표제어 집합(words.dawg) 로드 (없거나 다른 버전의 words.json으로 만들었으면 None)"""
+        try:
+            dawg = HeadwordDawg.load(path)
+        except (OSError, ValueError):
+            return None
+
+        if dawg.version != self.words_file_version:
+            self.show_warning_message(f"{path}가 words.json과 일치하지 않아 사용하지 않습니다.")
+            return None
+        return dawg
+
+    def is_headword(self, word: str) -> bool:
+        """사전 표제어 여부"""
+        return word in self.headwords
+
+    def get_word_euem(self, word: str) -> int:
+        """단어의 현재 이음 수 (표제어가 아니면 0)"""
+        word_id = self.word_ids.get(word)
+        if not 0 <= word_id < len(self.word_max_euem):
+            return 0
+        return max(0, self.word_max_euem[word_id])
+
     def load_stats(self):
-        """게임 전적 로드"""
+        """게임 전적 저장소 열기 (열 수 없으면 이번 실행 동안만 메모리에 집계)"""
         try:
-            with open(self.stats_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.win_count = int(data.get('wins', 0))
-            self.loss_count = int(data.get('losses', 0))
-            self.stats_by_difficulty = {
-                level: {"wins": 0, "losses": 0} for level in range(1, 6)
-            }
+            self.stats_store = StatsStore(self.stats_path)
+        except sqlite3.Error:
+            self.stats_store = None
+        self.reload_stats()
 
-            by_difficulty = data.get('by_difficulty', {})
-            if isinstance(by_difficulty, dict):
-                for key, value in by_difficulty.items():
-                    try:
-                        level = int(key)
-                    except (TypeError, ValueError):
-                        continue
-
-                    if not isinstance(value, dict):
-                        continue
-
-                    try:
-                        wins = int(value.get('wins', 0))
-                    except (TypeError, ValueError):
-                        wins = 0
-
-                    try:
-                        losses = int(value.get('losses', 0))
-                    except (TypeError, ValueError):
-                        losses = 0
-
-                    if level not in self.stats_by_difficulty:
-                        self.stats_by_difficulty[level] = {"wins": 0, "losses": 0}
-
-                    self.stats_by_difficulty[level]['wins'] = max(wins, 0)
-                    self.stats_by_difficulty[level]['losses'] = max(losses, 0)
-        except (FileNotFoundError, json.JSONDecodeError, ValueError, TypeError):
+    def reload_stats(self):
+        """현재 플레이어의 전체·난이도별 승패를 집계 쿼리로 다시 읽음"""
+        self.stats_by_difficulty = {
+            level: {"wins": 0, "losses": 0} for level in range(1, 6)
+        }
+        if self.stats_store is None:
             self.win_count = 0
             self.loss_count = 0
-            self.stats_by_difficulty = {
-                level: {"wins": 0, "losses": 0} for level in range(1, 6)
-            }
-
-    def save_stats(self):
-        """게임 전적 저장"""
+            return
         try:
-            by_difficulty = {
-                str(level): {
-                    'wins': stats.get('wins', 0),
-                    'losses': stats.get('losses', 0)
-                }
-                for level, stats in sorted(self.stats_by_difficulty.items())
-            }
+            self.win_count, self.loss_count = self.stats_store.totals(self.player)
+            self.stats_by_difficulty.update(self.stats_store.stats_by_difficulty(self.player))
+        except sqlite3.Error:
+            self.win_count = 0
+            self.loss_count = 0
 
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'wins': self.win_count,
-                    'losses': self.loss_count,
-                    'by_difficulty': by_difficulty
-                }, f, ensure_ascii=False, indent=2)
-        except OSError:
-            pass
+    def switch_player(self, name: str) -> bool:
+        """전적을 기록할 플레이어 변경 (게임 중에는 바꿀 수 없음)"""
+        name = name.strip()
+        if not name or name == self.player:
+            return False
+        if self.game_active:
+            self.show_warning_message("게임 중에는 플레이어를 바꿀 수 없습니다.")
+            return False
+
+        self.player = name
+        if self.stats_store is not None:
+            try:
+                self.stats_store.add_player(name)
+            except sqlite3.Error:
+                pass
+        self.reload_stats()
+        self.refresh_player_list()
+        self.refresh_difficulty_stats_panel()
+        self.add_system_message(f"플레이어: {name}")
+        return True
+
+    def refresh_player_list(self):
+        combo = getattr(self, 'player_combo', None)
+        if combo is None:
+            return
+        players: List[str] = []
+        if self.stats_store is not None:
+            try:
+                players = self.stats_store.players()
+            except sqlite3.Error:
+                players = []
+        if self.player not in players:
+            players.append(self.player)
+        combo.config(values=players)
+        self.player_var.set(self.player)
+
+    def on_player_selected(self, event=None):
+        if not self.switch_player(self.player_var.get()):
+            self.player_var.set(self.player)
 
     def refresh_difficulty_stats_panel(self):
         rows = getattr(self, 'difficulty_stats_rows', None)
@@ -431,15 +1177,16 @@ class WordChainGame:
             level_label.config(bg=bg_color)
             value_label.config(bg=bg_color)
 
-    def update_stats(self, wins: int = 0, losses: int = 0, difficulty: Optional[int] = None):
-        if wins > 0 and self.hint_used_in_game:
-            wins = 0
-
+    def update_stats(self, wins: int = 0, losses: int = 0, difficulty: Optional[int] = None,
+                     reason: Optional[str] = None):
         if wins == 0 and losses == 0:
             self.active_game_difficulty = None
             return
 
-        self.win_count += wins
+        # 힌트·무르기를 쓴 판도 기록하되, 이겼으면 승리 수에는 넣지 않음
+        assisted = self.hint_used_in_game or self.takeback_used_in_game
+        counted_wins = 0 if assisted else wins
+        self.win_count += counted_wins
         self.loss_count += losses
 
         if difficulty is None:
@@ -454,27 +1201,83 @@ class WordChainGame:
             if difficulty_int not in self.stats_by_difficulty:
                 self.stats_by_difficulty[difficulty_int] = {"wins": 0, "losses": 0}
 
-            self.stats_by_difficulty[difficulty_int]['wins'] += wins
+            self.stats_by_difficulty[difficulty_int]['wins'] += counted_wins
             self.stats_by_difficulty[difficulty_int]['losses'] += losses
 
+        self.record_game(wins > 0, difficulty_int, reason, assisted)
         self.refresh_difficulty_stats_panel()
-        self.save_stats()
         self.active_game_difficulty = None
 
+    def record_game(self, won: bool, difficulty: Optional[int], reason: Optional[str],
+                    assisted: bool = False):
+        """끝난 게임 한 판을 전적 저장소에 기록"""
+        if self.stats_store is None:
+            return
+        try:
+            self.stats_store.record_game(self.player, won, difficulty, reason=reason,
+                                         rule_profile=self.rule_profile.key,
+                                         turns=len(self.game_history), assisted=assisted)
+        except sqlite3.Error:
+            pass
+
+    def toggle_debug_panel(self, _event=None):
+        """성능 계측 결과를 보여주는 숨김 디버그 패널 토글 (F12)"""
+        if self.debug_panel is not None:
+            self.close_debug_panel()
+            return
+
+        self.debug_panel = tk.Toplevel(self.root)
+        self.debug_panel.title("성능 계측")
+        self.debug_panel.geometry("640x420")
+        self.debug_panel.protocol("WM_DELETE_WINDOW", self.close_debug_panel)
+
+        self.debug_panel_text = tk.Text(self.debug_panel,
+                                        font=("Consolas", 11),
+                                        bg="#1e1e1e", fg="#d4d4d4",
+                                        relief=tk.FLAT)
+        self.debug_panel_text.pack(fill=tk.BOTH, expand=True)
+        self.refresh_debug_panel()
+
+    def close_debug_panel(self):
+        if self.debug_panel_after_id is not None:
+            self.root.after_cancel(self.debug_panel_after_id)
+            self.debug_panel_after_id = None
+        if self.debug_panel is not None:
+            self.debug_panel.destroy()
+        self.debug_panel = None
+        self.debug_panel_text = None
+
+    def refresh_debug_panel(self):
+        self.debug_panel_after_id = None
+        if self.debug_panel_text is None:
+            return
+
+        self.debug_panel_text.config(state=tk.NORMAL)
+        self.debug_panel_text.delete(1.0, tk.END)
+        self.debug_panel_text.insert(tk.END, self.telemetry.format_report())
+        self.debug_panel_text.config(state=tk.DISABLED)
+        self.debug_panel_after_id = self.root.after(1000, self.refresh_debug_panel)
+
     def update_hint_status_label(self):
         if not hasattr(self, 'hint_notice_label'):
             return
 
-        if self.hint_used_in_game:
+        if self.takeback_used_in_game:
+            text = "무르기 사용됨: 이번 게임에서는 승리 기록이 올라가지 않습니다."
+            color = "#c0392b"
+        elif self.hint_used_in_game:
             text = "힌트 사용됨: 이번 게임에서는 승리 기록이 올라가지 않습니다."
             color = "#c0392b"
         else:
             text = "힌트 사용 시 승리 기록이 올라가지 않습니다."
             color = "#7f8c8d"
 
-        self.hint_notice_label.config(text=text, fg=color)
+        self.ui.configure(self.hint_notice_label, text=text, fg=color)
 
     def use_hint(self, limit: int = 10):
+        if self.analysis_mode:
+            self.show_possible_user_words(limit=limit)
+            return
         if not self.game_active:
             self.add_system_message("게임을 시작한 후에 힌트를 사용할 수 있습니다.")
             return
@@ -488,24 +1291,152 @@ class WordChainGame:
 
         self.show_possible_user_words(limit=limit, initials_only=True)
 
-    def build_word_indexes(self):
-        """단어 검색 속도를 높이기 위해 색인 생성"""
-        words_by_first_char: Dict[str, List[str]] = {}
-        words_by_last_char_variants: Dict[str, Set[str]] = {}
-
-        for word in self.words_data.keys():
-            if not word:
-                continue
-
-            first_char = self.get_first_char(word)
-            words_by_first_char.setdefault(first_char, []).append(word)
-
-            last_char = self.get_last_char(word)
-            for variant in self.get_dueum_variants(last_char):
-                words_by_last_char_variants.setdefault(variant, set()).add(word)
+    def build_word_indexes(self, dawg: Optional[HeadwordDawg] = None):
+        """단어 검색 속도를 높이기 위해 색인 생성 (dawg가 있으면 표제어 집합으로 사용)"""
+        with self.telemetry.timer("build_word_indexes"):
+            self._build_word_indexes(dawg)
+
+    def _build_word_indexes(self, dawg: Optional[HeadwordDawg]):
+        # 미리 계산한 파일은 words.json 순서의 번호를 쓰므로 그 순서의 목록과 단어 번호를 잠시 둠
+        words = list(self.words_data.keys())
+        self.word_ids = WordIds(dawg)
+        index_ids = self.word_ids.assign(words)
+
+        initials_order = load_initials_index(INITIALS_INDEX_PATH, words, self.words_file_version)
+        if dawg is None:
+            self.headwords = PrefixIndex(words)
+            self.initials_index = InitialsIndex(lambda: words, initials_order)
+        else:
+            self.headwords = DawgHeadwords(dawg)
+            # 문자열 키 dict를 버리고 항목은 DAWG 단어 번호로 보관
+            self.words_data = DawgWordsData(dawg, self.words_data, index_ids)
+            # 초성 색인은 처음 검색할 때 DAWG에서 단어를 꺼내 만듦 (번호 = DAWG 순서)
+            if initials_order is not None:
+                initials_order = array('i', [index_ids[idx] for idx in initials_order])
+            self.initials_index = InitialsIndex(lambda: [w for _, w in dawg.iter_prefix("")],
+                                                initials_order)
+        self.suggestion_index = SuggestionIndex(self.headwords.iter_prefix)
+
+        # 규칙 프로필별 이음 수·색인: extractor가 미리 계산한 파일이 있으면 사용
+        profile_data = load_profile_data(RULE_PROFILES_PATH, words, self.words_file_version)
+        self.rule_tables = build_rule_tables(self.word_ids, words, index_ids, profile_data)
+        del profile_data
+        self.opening_book = OpeningBook(self.word_ids, self.rule_tables,
+                                        load_opening_book(OPENING_BOOK_PATH, words,
+                                                          self.words_file_version),
+                                        index_ids)
+        self.bot_pool_cache.clear()
+        self.apply_rule_profile(self.rule_profile)
+
+    def apply_dictionary_delta(self, path: str = WORDS_DELTA_PATH) -> Optional[Dict[str, List[str]]]:
+        """
+        words.json이 변경분의 기준 버전이면 변경분을 적용하고 색인을 제자리에서 고침
+        (적용하지 않았으면 None)
+        """
+        delta = load_delta(path)
+        if delta is None:
+            return None
+        if self.words_version != delta["base_version"]:
+            return None
+
+        # 미리 계산 스레드가 바꾸는 중인 색인을 읽지 않도록 끝날 때까지 기다림
+        self.cancel_bot_speculation(wait=True)
+        with self.telemetry.timer("apply_dictionary_delta"):
+            summary = apply_delta_to_words(self.words_data, delta)
+            removed, added = summary["removed"], summary["added"]
+            # 뜻풀이가 바뀐 단어의 문서 (이음 수는 문서에 없음)
+            self.word_info_cache.invalidate(removed + added + summary["changed"])
+
+            if isinstance(delta.get("version"), str):
+                self.words_version = delta["version"]
+
+            for word in removed:
+                self.headwords.remove(word)
+            for word in added:
+                self.headwords.add(word)
+
+            self.initials_index.apply_delta(removed, added)
+            self.suggestion_index.apply_delta(removed, added)
+            for tables in self.rule_tables.values():
+                tables.apply_delta(removed, added)
+            # 미리 만든 오프닝 북은 기준 사전의 이음 수로 정렬했으므로 버리고 조회할 때 만듦
+            # (save_patched_dictionary가 새 북을 저장하므로 다음 실행부터는 다시 미리 만든 북을 씀)
+            self.opening_book = OpeningBook(self.word_ids, self.rule_tables)
+            self.bot_pool_cache.clear()
+            self.apply_rule_profile(self.rule_profile)
+            # 이음 수를 초기값으로 되돌렸으므로 이전 수의 기록으로는 무를 수 없음
+            self.game_journal.clear()
+        return summary
+
+    def start_patched_dictionary_save(self):
+        """변경분을 적용한 사전 저장을 백그라운드에서 시작 (창을 닫아도 저장을 마친 뒤 종료)"""
+        self.dictionary_save_thread = threading.Thread(target=self._save_patched_dictionary_worker)
+        self.dictionary_save_thread.start()
+
+    def _save_patched_dictionary_worker(self):
+        if self.save_patched_dictionary():
+            return
+        message = "변경분을 적용한 사전을 저장하지 못해 실행할 때마다 다시 적용합니다."
+        with contextlib.suppress(RuntimeError, tk.TclError):
+            self.root.after(0, lambda: self.add_system_message(message))
+
+    def save_patched_dictionary(self, path: str = 'words.json') -> bool:
+        """
+        변경분을 적용한 사전을 path에, 부가 파일을 그 파일 해시로 저장 (저장하지 못했으면 False)
+        사전 버전은 words_version.json에 파일 해시와 함께 적어 다음 변경분의 기준 버전으로 쓴다.
+        모두 임시 파일에 쓴 뒤 바꿔 끼우고 path는 마지막에 바꾸므로, 도중에 멈추면
+        다음 실행에서 기준 사전에 변경분을 다시 적용한다.
+        """
+        words = list(self.words_data.keys())
+        targets = [RULE_PROFILES_PATH, OPENING_BOOK_PATH, INITIALS_INDEX_PATH, WORDS_VERSION_PATH]
+        if self.word_ids.dawg is not None:
+            targets.append(HEADWORD_DAWG_PATH)
+        targets.append(path)
+        try:
+            with self.telemetry.timer("save_patched_dictionary"):
+                with open(path + ".tmp", "w", encoding="utf-8") as f:
+                    f.write(json.dumps(encode_words(self.words_data), ensure_ascii=False,
+                                       separators=(",", ":")))
+                file_version = compute_file_version(path + ".tmp")
+                if self.word_ids.dawg is not None:
+                    HeadwordDawg.build(words, version=file_version).save(HEADWORD_DAWG_PATH + ".tmp")
+                profile_data = compute_profile_data(words, file_version)
+                save_profile_data(RULE_PROFILES_PATH + ".tmp", profile_data)
+                save_opening_book(OPENING_BOOK_PATH + ".tmp", words, profile_data)
+                del profile_data
+                save_initials_index(INITIALS_INDEX_PATH + ".tmp", words, file_version)
+                save_version(WORDS_VERSION_PATH + ".tmp", self.words_version, len(words),
+                             file_version=file_version)
+                for target in targets:
+                    os.replace(target + ".tmp", target)
+        except OSError:
+            for target in targets:
+                with contextlib.suppress(OSError):
+                    os.remove(target + ".tmp")
+            return False
+        self.words_file_version = file_version
+        return True
+
+    def apply_rule_profile(self, profile: RuleProfile):
+        """규칙 프로필 적용 (미리 만든 색인으로 교체하고 이음 수를 초기값으로 되돌림)"""
+        tables = self.rule_tables.get(profile.dueum_mode)
+        self.rule_profile = profile
+        if tables is None:
+            return
 
-        self.words_by_first_char = words_by_first_char
-        self.words_by_last_char_variants = words_by_last_char_variants
+        self.words_by_last_char_variants = tables.words_by_last_char_variants
+        self.words_ranked_by_first_char = tables.words_ranked_by_first_char
+        self.initial_euems = tables.link_counts
+        self.word_max_euem = tables.link_counts[:]
+        self.euem_version += 1
+
+    def get_selected_rule_profile(self) -> RuleProfile:
+        """규칙 선택 메뉴에서 고른 프로필"""
+        label = self.rule_profile_var.get()
+        for profile in RULE_PROFILES.values():
+            if profile.label == label:
+                return profile
+        return RULE_PROFILES[DEFAULT_RULE_PROFILE]
     
     def on_difficulty_change(self, value):
         """난이도 변경 처리"""
@@ -532,27 +1463,28 @@ class WordChainGame:
 
         old_limit = self.turn_time_limit
         self.turn_time_limit = new_limit
+        self.ui.configure(self.timer_progress, maximum=new_limit)
 
-        if self.timer_seconds_remaining > 0:
+        if self.timer_deadline is not None:
+            now = time.monotonic()
+            remaining = self.timer_deadline - now
             if new_limit > old_limit:
-                self.timer_seconds_remaining = min(
-                    new_limit,
-                    self.timer_seconds_remaining + (new_limit - old_limit)
-                )
+                remaining = min(new_limit, remaining + (new_limit - old_limit))
             else:
-                self.timer_seconds_remaining = min(self.timer_seconds_remaining, new_limit)
-            self.timer_progress.config(maximum=new_limit)
-            self.timer_progress['value'] = min(self.timer_seconds_remaining, new_limit)
-            self.update_timer_display()
-        else:
-            self.timer_progress.config(maximum=new_limit)
+                remaining = min(remaining, new_limit)
+            self.timer_deadline = now + remaining
+            self.update_timer()
 
     def start_game(self):
         """게임 시작"""
         self.reset_game()
+        if self.profiler is not None:
+            self.profiler.mark_game_start()
         self.active_game_difficulty = self.bot_difficulty
-        self.add_system_message(f"{self.bot_difficulty}단계 봇과의 게임이 시작되었습니다! 아무 단어나 입력하세요.")
-        self.status_label.config(text="당신의 차례입니다", fg="#27ae60")
+        self.add_system_message(
+            f"{self.bot_difficulty}단계 봇과의 게임이 시작되었습니다! (규칙: {self.rule_profile.label}) "
+            "아무 단어나 입력하세요.")
+        self.ui.configure(self.status_label, text="당신의 차례입니다", fg="#27ae60")
         self.word_entry.config(state=tk.NORMAL)
         self.word_entry.focus()
         self.game_active = True
@@ -560,20 +1492,29 @@ class WordChainGame:
 
     def reset_game(self):
         """게임 초기화"""
+        with self.telemetry.timer("reset_game"):
+            self._reset_game()
+
+    def _reset_game(self):
         self.game_active = False
         self.active_game_difficulty = None
         self.cancel_pending_bot_turn()
         self.invalidate_bot_turn()
+        self.cancel_bot_speculation()
         self.used_words.clear()
         self.game_history.clear()
         self.current_last_char = ""
-        self.word_tag_counter = 0
         self.hint_used_in_game = False
+        self.takeback_used_in_game = False
+        self.game_journal.clear()
+        self.analysis_mode = False
         self.update_hint_status_label()
+        self.update_analysis_button()
 
         self.stop_timer()
         self.reset_timer_display()
 
+        self.pending_chat_segments.clear()
         self.chat_text.config(state=tk.NORMAL)
         self.chat_text.delete(1.0, tk.END)
         self.chat_text.config(state=tk.DISABLED)
@@ -584,108 +1525,223 @@ class WordChainGame:
         
         self.word_entry.delete(0, tk.END)
         self.word_entry.config(state=tk.NORMAL)
+        self.set_entry_feedback("")
         
-        # 이음 수 원래대로 복원
-        try:
-            with open('words.json', 'r', encoding='utf-8') as f:
-                self.words_data = json.load(f)
-            self.build_word_indexes()
-        except:
-            pass
+        # 선택한 규칙 프로필 적용 및 이음 수 원래대로 복원
+        self.apply_rule_profile(self.get_selected_rule_profile())
     
-    def add_system_message(self, message):
-        """시스템 메시지 추가"""
+    def queue_chat(self, *segments: Any):
+        """채팅 (문자열, 태그) 구간을 모아 두었다가 다음 UI 반영 때 한 번에 삽입"""
+        self.pending_chat_segments.extend(segments)
+        self.ui.defer("chat", self.flush_chat)
+
+    def flush_chat(self):
+        if not self.pending_chat_segments:
+            return
+
+        segments, self.pending_chat_segments = self.pending_chat_segments, []
         self.chat_text.config(state=tk.NORMAL)
-        self.chat_text.insert(tk.END, f"[시스템] {message}\n", "system")
+        self.chat_text.insert(tk.END, *segments)
+        self.trim_chat_log()
         self.chat_text.see(tk.END)
         self.chat_text.config(state=tk.DISABLED)
 
+    def add_system_message(self, message):
+        """시스템 메시지 추가"""
+        self.queue_chat(f"[시스템] {message}\n", "system")
+
     def add_system_message_with_word_links(self, prefix: str, words: List[str]):
         """클릭 가능한 단어 목록이 포함된 시스템 메시지 추가"""
         if not words:
             self.add_system_message(prefix.strip())
             return
 
-        self.chat_text.config(state=tk.NORMAL)
-        self.chat_text.insert(tk.END, "[시스템] ", "system")
-        self.chat_text.insert(tk.END, prefix, "system")
-
+        segments: List[Any] = ["[시스템] " + prefix, "system"]
         for idx, word in enumerate(words):
             if idx > 0:
-                self.chat_text.insert(tk.END, ", ", "system")
-
-            tag_name = f"word_link_{self.word_tag_counter}"
-            self.word_tag_counter += 1
+                segments += [", ", "system"]
+            segments += [word, ("system", "word_link")]
+        segments += ["\n", ()]
 
-            self.chat_text.insert(
-                tk.END,
-                word,
-                ("system", tag_name, "word_link"),
-            )
-            self.chat_text.tag_bind(
-                tag_name,
-                "<Button-1>",
-                lambda e, w=word: self.show_word_info(w),
-            )
-
-        self.chat_text.insert(tk.END, "\n")
-        self.chat_text.see(tk.END)
-        self.chat_text.config(state=tk.DISABLED)
+        self.prefetch_word_info(words)
+        self.queue_chat(*segments)
 
     def show_warning_message(self, message: str):
         """경고 메시지를 화면에 출력"""
         self.add_system_message(f"⚠️ {message}")
-        self.status_label.config(text=message, fg="#c0392b")
+        self.ui.configure(self.status_label, text=message, fg="#c0392b")
     
     def add_word_message(self, speaker, word):
         """단어 메시지 추가 (클릭 가능)"""
-        self.chat_text.config(state=tk.NORMAL)
-        
         if speaker == "user":
-            self.chat_text.insert(tk.END, "당신: ", "user")
+            speaker_segment = ("당신: ", "user")
         else:
-            self.chat_text.insert(tk.END, "봇: ", "bot")
-        
-        # 클릭 가능한 단어
-        tag_name = f"word_link_{self.word_tag_counter}"
-        self.word_tag_counter += 1
-        self.chat_text.insert(tk.END, word, (tag_name, "word_link"))
-
-        # 클릭 이벤트 바인딩
-        self.chat_text.tag_bind(tag_name, "<Button-1>",
-                               lambda e, w=word: self.show_word_info(w))
-        
-        self.chat_text.insert(tk.END, "\n")
-        self.chat_text.see(tk.END)
-        self.chat_text.config(state=tk.DISABLED)
+            speaker_segment = ("봇: ", "bot")
+
+        # 클릭 가능한 단어 (공용 word_link 태그, 클릭 위치로 단어 조회)
+        self.prefetch_word_info([word])
+        self.queue_chat(*speaker_segment, word, "word_link", "\n", ())
+
+    def trim_chat_log(self):
+        """보관 한도를 넘은 오래된 채팅 줄 삭제 (flush_chat에서 chat_text가 편집 가능 상태일 때 호출)"""
+        line_count = int(self.chat_text.index('end-1c').split('.')[0]) - 1
+        excess = line_count - self.chat_max_lines
+        if excess > 0:
+            self.chat_text.delete('1.0', f'{excess + 1}.0')
+
+    def get_word_link_at(self, index: str) -> Optional[str]:
+        """채팅창 위치에 있는 word_link 구간의 단어 반환"""
+        if "word_link" not in self.chat_text.tag_names(index):
+            return None
+
+        link_range = self.chat_text.tag_prevrange("word_link", f"{index}+1c")
+        if not link_range:
+            return None
+        return self.chat_text.get(*link_range)
+
+    def on_word_link_click(self, event):
+        word = self.get_word_link_at(f"@{event.x},{event.y}")
+        if word:
+            self.show_word_info(word)
     
+    def search_words(self, query: str, limit: int = WORD_SEARCH_LIMIT) -> List[str]:
+        """초성·접두사 검색 (짧은 단어, 현재 이음 수가 큰 단어, 가나다순)"""
+        query = query.strip()
+        if not query:
+            return []
+        with self.telemetry.timer("search_words"):
+            return self.initials_index.search(
+                query, limit, rank_key=lambda w: (len(w), -self.get_word_euem(w), w))
+
+    def suggest_words(self, word: str, limit: int = WORD_SUGGEST_LIMIT) -> List[str]:
+        """사전에 없는 단어와 자모가 비슷하면서 지금 낼 수 있는 단어 (가까운 순)"""
+        if self.current_last_char:
+            first_chars: Iterable[str] = self.rule_profile.allowed_start_chars(self.current_last_char)
+        else:
+            # 첫 단어는 아무 음절로나 시작할 수 있으므로 입력한 첫 음절로 시작하는 단어만 찾음
+            first_chars = (word[0],)
+        used_words = self.used_words
+        bans_zero_link = self.rule_profile.bans_zero_link(len(self.game_history))
+
+        def accept(candidate: str) -> bool:
+            if candidate in used_words or len(candidate) < 2:
+                return False
+            return not (bans_zero_link and self.get_word_euem(candidate) == 0)
+
+        with self.telemetry.timer("suggest_words"):
+            return self.suggestion_index.suggest(word, first_chars, limit, accept=accept)
+
+    def on_word_search_change(self, event=None):
+        """검색어가 바뀌면 유휴 시점에 한 번만 검색"""
+        if event is not None and event.keysym == "Return":
+            return
+        self.ui.defer("word_search", self.refresh_word_search)
+
+    def refresh_word_search(self):
+        results = self.search_words(self.word_search_entry.get())
+        self.word_search_results.delete(0, tk.END)
+        if results:
+            self.word_search_results.insert(tk.END, *results)
+
+    def on_word_search_select(self, event=None):
+        selection = self.word_search_results.curselection()
+        if selection:
+            self.show_word_info(self.word_search_results.get(selection[0]))
+
+    def show_first_search_result(self):
+        self.ui.flush()
+        if self.word_search_results.size() > 0:
+            self.show_word_info(self.word_search_results.get(0))
+
     def show_word_info(self, word):
         """단어 정보 표시"""
+        with self.telemetry.timer("show_word_info"):
+            self._show_word_info(word)
+
+    def _show_word_info(self, word):
+        document = self.get_word_info_document(word)
+
         self.info_text.config(state=tk.NORMAL)
         self.info_text.delete(1.0, tk.END)
-        
-        if word in self.words_data:
-            self.info_text.insert(tk.END, f"📖 {word}\n\n", "title")
-            
-            for idx, entry in enumerate(self.words_data[word], 1):
-                self.info_text.insert(tk.END, f"[의미 {idx}]\n", "header")
-                self.info_text.insert(tk.END, f"발음: {entry.get('발음', '-')}\n")
-                self.info_text.insert(tk.END, f"구분: {entry.get('고유어 여부', '-')}\n")
-                self.info_text.insert(tk.END, f"뜻: {entry.get('뜻풀이', '-')}\n")
-                
-                if '전문 분야' in entry:
-                    self.info_text.insert(tk.END, f"분야: {entry['전문 분야']}\n")
-                
-                if '용례' in entry and entry['용례']:
-                    self.info_text.insert(tk.END, f"\n용례:\n{entry['용례']}\n")
-                
-                if idx < len(self.words_data[word]):
-                    self.info_text.insert(tk.END, "\n" + "-"*40 + "\n\n")
-        else:
-            self.info_text.insert(tk.END, f"'{word}' 단어 정보를 찾을 수 없습니다.")
-        
+        self.info_text.insert(tk.END, *document)
         self.info_text.config(state=tk.DISABLED)
-    
+
+    def render_word_info(self, word: str,
+                         entries: Optional[List[Dict[str, Any]]] = None) -> Tuple[Any, ...]:
+        """단어 정보를 한 번의 Text.insert 호출용 (문자열, 태그, ...) 튜플로 렌더링
+        (entries를 주면 words_data 대신 그 항목으로 렌더링)"""
+        if entries is None:
+            entries = self.words_data.get(word)
+        if entries is None:
+            return (f"'{word}' 단어 정보를 찾을 수 없습니다.", ())
+
+        segments: List[Tuple[str, Any]] = []
+
+        def emit(text: str, tags: Any = ()):
+            # 같은 태그의 연속 구간은 하나의 문자열로 합침
+            if segments and segments[-1][1] == tags:
+                segments[-1] = (segments[-1][0] + text, tags)
+            else:
+                segments.append((text, tags))
+
+        emit(f"📖 {word}\n\n", "title")
+
+        for idx, entry in enumerate(entries, 1):
+            emit(f"[의미 {idx}]\n", "header")
+            emit(f"발음: {entry.get('발음', '-')}\n")
+            emit(f"구분: {entry.get('고유어 여부', '-')}\n")
+            emit(f"뜻: {entry.get('뜻풀이', '-')}\n")
+
+            if '전문 분야' in entry:
+                emit(f"분야: {entry['전문 분야']}\n")
+
+            if '용례' in entry and entry['용례']:
+                emit(f"\n용례:\n{entry['용례']}\n")
+
+            if idx < len(entries):
+                emit("\n" + "-"*40 + "\n\n")
+
+        return tuple(item for segment in segments for item in segment)
+
+    def get_word_info_document(self, word: str) -> Tuple[Any, ...]:
+        document = self.word_info_cache.get(word)
+        if document is None:
+            document = self.render_word_info(word)
+            if word in self.words_data:
+                self.word_info_cache.put(word, document)
+        return document
+
+    def prefetch_word_info(self, words: List[str]):
+        """채팅에 등장한 단어의 정보 문서를 백그라운드 스레드에서 미리 렌더링"""
+        generation = self.word_info_cache.generation
+        for word in words:
+            entries = self.words_data.get(word)
+            if entries is not None and word not in self.word_info_cache:
+                self.word_info_prefetch_queue.put(
+                    (word, [dict(entry) for entry in entries], generation))
+
+        thread = self.word_info_prefetch_thread
+        if thread is None or not thread.is_alive():
+            self.word_info_prefetch_thread = threading.Thread(
+                target=self._word_info_prefetch_worker,
+                daemon=True
+            )
+            self.word_info_prefetch_thread.start()
+
+    def _word_info_prefetch_worker(self):
+        # words_data는 읽지 않고 큐에 담긴 항목 사본만 사용
+        while True:
+            word, entries, generation = self.word_info_prefetch_queue.get()
+            if word in self.word_info_cache:
+                continue
+            try:
+                document = self.render_word_info(word, entries)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # 형식이 잘못된 항목: 클릭했을 때 Tk 스레드에서 다시 렌더링
+                self.telemetry.count("word_info.prefetch_errors")
+                continue
+            self.word_info_cache.put(word, document, generation)
+
     def get_first_char(self, word):
         """단어의 첫 글자"""
         return word[0] if word else ""
@@ -694,16 +1750,9 @@ class WordChainGame:
         """마지막 글자"""
         return word[-1]
 
-    def get_dueum_variants(self, syllable: str) -> Set[str]:
-        """두음법칙을 적용한 가능한 시작 음절 집합"""
-        if not syllable:
-            return set()
-
-        variants = {syllable}
-        transformed = dueum_transform(syllable)
-        if transformed:
-            variants.add(transformed)
-        return variants
+    def get_dueum_variants(self, syllable: str) -> FrozenSet[str]:
+        """현재 규칙 프로필의 두음법칙을 적용한 가능한 시작 음절 집합"""
+        return self.rule_profile.allowed_start_chars(syllable)
 
     def count_available_followups(self, last_char: str,
                                   exclude_word: Optional[str] = None,
@@ -714,42 +1763,73 @@ class WordChainGame:
 
         allowed_chars = self.get_dueum_variants(last_char)
         used = self.used_words if used_words is None else used_words
-        available_words: Set[str] = set()
-
-        for char in allowed_chars:
-            for word in self.words_by_first_char.get(char, []):
-                if word == exclude_word or word in used:
-                    continue
-                available_words.add(word)
-
-        return len(available_words)
+        count = self.count_unused_words_starting_with(allowed_chars, used)
+        if exclude_word is not None and exclude_word not in used \
+                and self.get_first_char(exclude_word) in allowed_chars \
+                and exclude_word in self.words_data:
+            count -= 1
+        return count
+
+    def count_unused_words_starting_with(self, allowed_chars: FrozenSet[str],
+                                         used_words: Set[str]) -> int:
+        """허용 음절로 시작하는 미사용 단어 수 (첫 음절별 단어 수 - 그 범위의 사용 단어 수)"""
+        total = sum(self.headwords.count_prefix(char) for char in allowed_chars)
+        return total - sum(1 for word in used_words if self.get_first_char(word) in allowed_chars)
 
     def get_possible_user_words(self, limit: int = 10) -> List[str]:
         """현재 상태에서 사용자가 말할 수 있었던 단어 목록을 반환"""
-        if not self.current_last_char:
+        if not self.current_last_char or limit <= 0:
             return []
 
-        allowed_chars = self.get_dueum_variants(self.current_last_char)
-        candidates: List[Tuple[str, int]] = []
-        seen: Set[str] = set()
+        # 같은 턴(음절·진행 턴·이음 수 상태)의 반복 요청은 이전 결과 재사용
+        memo_key = (self.current_last_char, len(self.game_history), self.euem_version, limit)
+        if self.possible_words_memo is not None and self.possible_words_memo[0] == memo_key:
+            return list(self.possible_words_memo[1])
+
+        # 게임 시작 후 N턴까지는 이음 수가 0인 단어 사용 불가 규칙 적용
+        suggestions = self.get_top_words(
+            self.get_dueum_variants(self.current_last_char),
+            limit,
+            self.used_words,
+            exclude_zero_euem=self.rule_profile.bans_zero_link(len(self.game_history)),
+        )
+        self.possible_words_memo = (memo_key, suggestions)
+        return list(suggestions)
+
+    def get_top_words(self, allowed_chars: FrozenSet[str], limit: int, used_words: Set[str],
+                      exclude_zero_euem: bool = False) -> List[str]:
+        """허용 음절로 시작하는 미사용 단어 중 현재 이음 수 상위 limit개 (동률은 가나다순)
+
+        현재 이음 수는 사전 로드 시점 값보다 커지지 않으므로, 초기 이음 수 내림차순
+        목록을 훑다가 초기값이 지금까지의 limit번째 값보다 작아지면 탐색을 멈춘다.
+        """
+        threshold_heap: List[int] = []  # 지금까지의 상위 limit개 이음 수 (최소 힙)
+        candidates: List[Tuple[int, str]] = []
+        initial_euems = self.initial_euems
+        word_max_euem = self.word_max_euem
 
         for char in allowed_chars:
-            for word in self.words_by_first_char.get(char, []):
-                if word in self.used_words or word in seen:
+            for word_id in self.words_ranked_by_first_char.get(char, ()):
+                if len(threshold_heap) == limit and initial_euems[word_id] < threshold_heap[0]:
+                    break
+                euem = word_max_euem[word_id]
+                if exclude_zero_euem and euem == 0:
+                    continue
+                word = self.word_ids.word(word_id)
+                if word in used_words:
                     continue
-                seen.add(word)
-
-                entries = self.words_data[word]
-                max_euem = max(entry.get('이음 수', 0) for entry in entries)
 
-                # 게임 시작 후 4턴까지는 이음 수가 0인 단어 사용 불가 규칙 적용
-                if len(self.game_history) < 4 and max_euem == 0:
+                if len(threshold_heap) < limit:
+                    heapq.heappush(threshold_heap, euem)
+                elif euem > threshold_heap[0]:
+                    heapq.heapreplace(threshold_heap, euem)
+                elif euem < threshold_heap[0]:
                     continue
 
-                candidates.append((word, max_euem))
+                candidates.append((euem, word))
 
-        candidates.sort(key=lambda item: (-item[1], item[0]))
-        return [word for word, _ in candidates[:limit]]
+        top = heapq.nsmallest(limit, candidates, key=lambda item: (-item[0], item[1]))
+        return [word for _, word in top]
 
     def show_possible_user_words(self, limit: int = 10, initials_only: bool = False):
         """사용자가 말할 수 있었던 단어 예시를 시스템 메시지로 출력"""
@@ -773,16 +1853,58 @@ class WordChainGame:
         prefix = f"사용자가 말할 수 있었던 단어 예시 (최대 {limit}개 표시됨): "
         self.add_system_message_with_word_links(prefix, suggestions)
 
-    def apply_dueum_decrease(self, char):
-        """해당 글자와 두음 변환 결과로 끝나는 모든 단어의 이음 수 -1"""
+    def apply_dueum_decrease(self, char) -> List[Tuple[int, int]]:
+        """해당 글자와 두음 변환 결과로 끝나는 모든 단어의 이음 수 -1 (줄어든 단어 번호와 줄기 전 값 반환)"""
+        changes: List[Tuple[int, int]] = []
         if not char:
-            return
-
-        for word in self.words_by_last_char_variants.get(char, set()):
-            entries = self.words_data.get(word, [])
-            for entry in entries:
-                if '이음 수' in entry:
-                    entry['이음 수'] = max(0, entry['이음 수'] - 1)
+            return changes
+
+        with self.telemetry.timer("apply_dueum_decrease"):
+            word_max_euem = self.word_max_euem
+            for word_id in self.words_by_last_char_variants.get(char, ()):
+                euem = word_max_euem[word_id]
+                if euem > 0:
+                    word_max_euem[word_id] = euem - 1
+                    changes.append((word_id, euem))
+            self.euem_version += 1
+        return changes
+
+    def play_move(self, speaker: str, word: str, first_char: str, last_char: str):
+        """한 수를 게임 상태에 반영하고 무르기용 기록에 남김"""
+        prev_last_char = self.current_last_char
+        self.used_words.add(word)
+        self.game_history.append((speaker, word))
+        self.current_last_char = last_char
+        changes = self.apply_dueum_decrease(first_char)
+        self.game_journal.push(speaker, word, prev_last_char, last_char, changes)
+
+    def _unplay_move(self) -> Optional[JournalNode]:
+        """마지막 수를 되돌림 (그 수로 바뀐 단어만 고침, 되돌린 수가 없으면 None)"""
+        node = self.game_journal.back()
+        if node is None:
+            return None
+        self.used_words.discard(node.word)
+        self.game_history.pop()
+        self.current_last_char = node.prev_last_char
+        word_max_euem = self.word_max_euem
+        for word_id, euem in node.euem_changes:
+            word_max_euem[word_id] = euem
+        self.euem_version += 1
+        return node
+
+    def _replay_move(self, word: Optional[str] = None) -> Optional[JournalNode]:
+        """되돌렸던 수를 다시 적용 (word를 주면 그 변화, 아니면 마지막으로 따라간 수)"""
+        node = self.game_journal.forward(word)
+        if node is None:
+            return None
+        self.used_words.add(node.word)
+        self.game_history.append((node.speaker, node.word))
+        self.current_last_char = node.last_char
+        word_max_euem = self.word_max_euem
+        for word_id, euem in node.euem_changes:
+            word_max_euem[word_id] = euem - 1
+        self.euem_version += 1
+        return node
 
     def cancel_pending_bot_turn(self):
         """대기 중인 봇 실행 예약 취소"""
@@ -795,148 +1917,324 @@ class WordChainGame:
         self.bot_turn_sequence += 1
         return self.bot_turn_sequence
 
+    def is_playable_word(self, word: str) -> bool:
+        """현재 턴에 제출하면 통과하는 단어인지 (submit_word와 같은 규칙)"""
+        if len(word) < 2 or not is_hangul_syllable(word[-1]):
+            return False
+        if word in self.used_words or not self.is_headword(word):
+            return False
+        if self.rule_profile.bans_zero_link(len(self.game_history)) \
+                and self.get_word_euem(word) == 0:
+            return False
+        if self.current_last_char:
+            return self.get_first_char(word) in self.get_dueum_variants(self.current_last_char)
+        return True
+
+    def find_entry_matches(self, text: str, limit: int = 0) -> Tuple[str, List[str]]:
+        """입력 중인 문자열의 상태와 자동 완성 후보 반환
+
+        상태: 'empty', 'exact'(그대로 제출 가능), 'prefix'(이어서 입력하면 가능),
+        'bad_start'(시작 음절 불일치), 'none'(가능한 단어 없음)
+        """
+        # 조합 중인 낱자(ㄱ~ㅣ)는 아직 음절이 아니므로 제외
+        while text and 0x3131 <= ord(text[-1]) <= 0x318E:
+            text = text[:-1]
+        if not text:
+            return "empty", []
+
+        if self.current_last_char and \
+                text[0] not in self.get_dueum_variants(self.current_last_char):
+            return "bad_start", []
+
+        prefixes = [text]
+        # 입력기 조합 중에는 마지막 음절의 받침이 다음 음절 초성으로 넘어갈 수 있음
+        decomp = decompose(text[-1])
+        if decomp is not None and decomp[2] != 0:
+            prefixes.append(text[:-1] + compose(decomp[0], decomp[1], 0))
+
+        status = "exact" if self.is_playable_word(text) else "none"
+        completions: List[str] = []
+        for prefix in prefixes:
+            for word in self.headwords.iter_prefix(prefix):
+                if word == text or not self.is_playable_word(word):
+                    continue
+                if status == "none":
+                    status = "prefix"
+                if len(completions) >= limit:
+                    break
+                completions.append(word)
+            if status != "none" and len(completions) >= limit:
+                break
+
+        return status, completions
+
+    def set_entry_feedback(self, text: str, color: str = "#7f8c8d"):
+        if hasattr(self, 'entry_feedback_label'):
+            self.ui.configure(self.entry_feedback_label, text=text, fg=color)
+
+    def on_word_entry_change(self, event=None):
+        """입력창 내용이 바뀔 때마다 접두사 색인으로 실시간 검증"""
+        if event is not None and event.keysym == "Return":
+            return
+        if not self.game_active and not self.analysis_mode:
+            self.set_entry_feedback("")
+            return
+
+        limit = ENTRY_COMPLETION_LIMIT if self.hint_used_in_game or self.analysis_mode else 0
+        status, completions = self.find_entry_matches(self.word_entry.get().strip(), limit)
+
+        if status == "empty":
+            message, color = "", "#7f8c8d"
+        elif status == "bad_start":
+            message, color = f"✗ '{self.current_last_char}'(으)로 시작해야 합니다", "#c0392b"
+        elif status == "none":
+            message, color = "✗ 이어지는 사용 가능한 단어가 없습니다", "#c0392b"
+        elif status == "exact":
+            message, color = "✓ 제출할 수 있는 단어입니다", "#27ae60"
+        else:
+            message, color = "… 계속 입력하세요", "#2c5aa0"
+
+        if completions:
+            message += f"  |  자동 완성: {', '.join(completions)}"
+        self.set_entry_feedback(message, color)
+
+    def check_submission(self, word: str) -> bool:
+        """제출 단어 검증 (위반이면 경고와, 사전에 없는 단어면 비슷한 단어 제안을 보여 주고 False)"""
+        violation = check_word(word, self.rule_profile, self.is_headword,
+                               self.get_word_euem, self.used_words,
+                               len(self.game_history), self.current_last_char)
+        if violation is None:
+            return True
+
+        self.show_warning_message(violation.message)
+        if violation.code == NOT_IN_DICTIONARY:
+            suggestions = self.suggest_words(word)
+            if suggestions:
+                self.add_system_message_with_word_links("혹시 이 단어인가요? ", suggestions)
+        return False
+
     def submit_word(self):
         """사용자 단어 제출"""
+        if self.analysis_mode:
+            self.submit_analysis_word()
+            return
         if not self.game_active:
             return
 
         word = self.word_entry.get().strip()
         self.word_entry.delete(0, tk.END)
+        self.set_entry_feedback("")
 
         if not word:
             return
         
         # 단어 검증
-        if not is_hangul_syllable(word[0]) or not is_hangul_syllable(word[-1]):
-            self.show_warning_message(f"{word}(은)는 잘못된 단어입니다: 한글로 시작하고 끝나야 합니다.")
-            return
-        
-        if len(word) < 2:
-            self.show_warning_message(f"{word}(은)는 잘못된 단어입니다: 최소 2글자 이상이어야 합니다.")
+        if not self.check_submission(word):
             return
 
-        if word not in self.words_data:
-            self.show_warning_message(f"{word}(은)는 잘못된 단어입니다: 사전에 없는 단어이거나 명사가 아닙니다.")
-            return
-
-        max_euem = max((entry.get('이음 수', 0)
-                         for entry in self.words_data[word]), default=0)
-        if len(self.game_history) < 4 and max_euem == 0:
-            self.show_warning_message(
-                f"{word}(은)는 잘못된 단어입니다: 게임 시작 후 4턴까지는 이음 수가 0인 단어를 사용할 수 없습니다.")
-            return
-
-        if word in self.used_words:
-            self.show_warning_message(f"{word}(은)는 잘못된 단어입니다: 이미 사용된 단어입니다.")
-            return
-
-        first_char = self.get_first_char(word)
-
-        # 첫 단어가 아니면 끝말잇기 규칙 검사
-        if self.current_last_char:
-            allowed_chars = self.get_dueum_variants(self.current_last_char)
-            if first_char not in allowed_chars:
-                self.show_warning_message(
-                    f"{word}(은)는 잘못된 단어입니다: '{self.current_last_char}'(으)로 시작하는 단어를 입력하세요.")
-                return
-        
-        # 단어 추가
-        self.used_words.add(word)
-        self.game_history.append(("user", word))
+        # 단어 추가 (마지막 글자 갱신, 이음 수 감소)
+        self.play_move("user", word, self.get_first_char(word), self.get_last_char(word))
         self.add_word_message("user", word)
-
         self.stop_timer()
-
-        # 마지막 글자 업데이트
-        last_char = self.get_last_char(word)
-        self.current_last_char = last_char
-        
-        # 이음 수 감소
-        self.apply_dueum_decrease(first_char)
+        self.telemetry.end_turn("user", word)
         
-        # 봇 차례
-        self.status_label.config(text="봇이 생각 중...", fg="#e67e22")
+        # 봇 차례 (계산은 바로 시작하고, 결과는 최소 대기 시간이 지난 뒤 표시)
+        self.ui.configure(self.status_label, text="봇이 생각 중...", fg="#e67e22")
         self.word_entry.config(state=tk.DISABLED)
         self.cancel_pending_bot_turn()
+        # 미리 계산은 멈추고 지금까지 만든 결과만 사용
+        self.cancel_bot_speculation(keep_results=True)
         turn_id = self.invalidate_bot_turn()
-        self.pending_bot_after_id = self.root.after(
-            1000, lambda: self.bot_turn(turn_id)
-        )
+        self.bot_turn(turn_id, time.monotonic() + BOT_MIN_THINK_MS / 1000)
 
-    def bot_turn(self, turn_id: int):
-        """봇의 차례를 백그라운드 스레드로 처리"""
-        self.pending_bot_after_id = None
+    def bot_turn(self, turn_id: int, ready_at: float = 0.0):
+        """봇의 차례를 백그라운드 스레드로 처리 (결과는 ready_at(time.monotonic 기준) 이후 표시)"""
         if turn_id != self.bot_turn_sequence or not self.game_active:
             return
 
         threading.Thread(
             target=self._bot_turn_worker,
-            args=(turn_id,),
+            args=(turn_id, ready_at),
             daemon=True
         ).start()
 
-    def _bot_turn_worker(self, turn_id: int):
+    def _bot_turn_worker(self, turn_id: int, ready_at: float):
         if turn_id != self.bot_turn_sequence or not self.game_active:
             return
 
-        result = self._compute_bot_decision()
+        with self.telemetry.timer("_compute_bot_decision"):
+            if self.profiler is not None:
+                result = self.profiler.runcall(self._compute_bot_decision)
+            else:
+                result = self._compute_bot_decision()
 
         if turn_id != self.bot_turn_sequence or not self.game_active:
             return
 
-        self.root.after(0, lambda: self._apply_bot_result(turn_id, result))
+        self.root.after(0, lambda: self._schedule_bot_result(turn_id, result, ready_at))
 
-    def _compute_bot_decision(self) -> Dict[str, Optional[str]]:
-        possible_words: List[Tuple[str, int]] = []
-        used_words_snapshot = set(self.used_words)
-        game_history_snapshot = list(self.game_history)
-        last_required_char = self.current_last_char
+    def _schedule_bot_result(self, turn_id: int, result: Dict[str, Optional[str]], ready_at: float):
+        if turn_id != self.bot_turn_sequence or not self.game_active:
+            return
 
-        if not game_history_snapshot:
-            return {"type": "no_word"}
+        delay_ms = max(0, int((ready_at - time.monotonic()) * 1000))
+        self.pending_bot_after_id = self.root.after(
+            delay_ms, lambda: self._apply_bot_result(turn_id, result)
+        )
 
-        allowed_chars: Optional[Set[str]] = None
-        if last_required_char:
-            allowed_chars = self.get_dueum_variants(last_required_char)
+    def bot_min_threshold(self) -> int:
+        """봇 후보의 최소 이음 수 (난이도가 높을수록 낮음)"""
+        return max(0, 3200 - (self.get_effective_difficulty() * 400))
+
+    # ---------------------------------------------------------------------
+    # 사용자 턴 동안 봇 준비 작업 미리 계산
+    # ---------------------------------------------------------------------
+    def start_bot_speculation(self):
+        """사용자가 낼 수 있는 응답의 끝 음절마다 다음 봇 턴의 후보 풀과 안전성 데이터를 미리 계산"""
+        self.cancel_bot_speculation()
+        if not self.game_active or not self.current_last_char:
+            return
 
-        for word, entries in self.words_data.items():
-            if word in used_words_snapshot:
-                continue
+        profile = self.rule_profile
+        turns_played = len(self.game_history)
+        # 사용자가 단어를 내면 메인 스레드가 이음 수를 바로 줄이므로 스레드에는 사본을 넘김
+        base_euems = self.word_max_euem[:] if profile.bans_zero_link(turns_played) else None
+        speculation = BotSpeculation(profile.dueum_mode, frozenset(self.used_words), base_euems)
+        self.bot_speculation = speculation
+        speculation.thread = threading.Thread(
+            target=self._run_bot_speculation,
+            args=(speculation, profile, self.current_last_char, turns_played,
+                  self.bot_min_threshold()),
+            daemon=True
+        )
+        speculation.thread.start()
+
+    def cancel_bot_speculation(self, keep_results: bool = False, wait: bool = False):
+        """
+        미리 계산 중단 (keep_results이면 지금까지의 결과는 이번 봇 턴에 사용,
+        wait이면 스레드가 끝날 때까지 대기: 사전·색인을 바꾸기 전에 사용)
+        """
+        speculation = self.bot_speculation
+        if speculation is None:
+            return
+        speculation.cancel()
+        if wait:
+            speculation.join()
+        if not keep_results:
+            self.bot_speculation = None
+
+    def _run_bot_speculation(self, speculation: BotSpeculation, profile: RuleProfile,
+                             last_char: str, turns_played: int, min_threshold: int):
+        followup_counts: Dict[str, int] = {}
+        try:
+            with self.telemetry.timer("bot.speculation"):
+                self._speculate_followup_counts(speculation, profile, last_char, turns_played,
+                                                min_threshold, followup_counts)
+        finally:
+            # 중단됐어도 다 센 음절의 값은 맞으므로 내놓음
+            speculation.publish(followup_counts)
+
+    def _speculate_followup_counts(self, speculation: BotSpeculation, profile: RuleProfile,
+                                   last_char: str, turns_played: int, min_threshold: int,
+                                   followup_counts: Dict[str, int]):
+        tables = self.rule_tables.get(profile.dueum_mode)
+        if tables is None:
+            return
+        used_words = speculation.base_used
+        # 사용자가 낼 수 있는 응답의 끝 음절별 단어 수
+        base_euems = speculation.base_euems
+        reply_exclude_zero = base_euems is not None
+        ending_counts: Dict[str, int] = {}
+        for char in profile.allowed_start_chars(last_char):
+            if speculation.cancelled:
+                return
+            for word_id in tables.words_ranked_by_first_char.get(char, ()):
+                if reply_exclude_zero and base_euems[word_id] == 0:
+                    continue
+                word = self.word_ids.word(word_id)
+                if word in used_words:
+                    continue
+                ending = self.get_last_char(word)
+                ending_counts[ending] = ending_counts.get(ending, 0) + 1
 
-            first_char = self.get_first_char(word)
-            if allowed_chars is not None and first_char not in allowed_chars:
+        endings = sorted(ending_counts, key=lambda c: (-ending_counts[c], c))
+        bot_exclude_zero = profile.bans_zero_link(turns_played + 1)
+        for ending in endings[:BOT_SPECULATION_SYLLABLES]:
+            if speculation.cancelled:
+                return
+            # 초반에는 봇이 오프닝 북을 먼저 조회하므로 그 항목만 만들어 둠
+            if bot_exclude_zero and self.opening_book is not None and self.opening_book.candidates(
+                    profile.dueum_mode, ending, min_threshold) is not None:
+                speculation.syllables_done += 1
                 continue
 
-            max_euem = max(entry.get('이음 수', 0) for entry in entries)
-            if len(game_history_snapshot) < 4 and max_euem == 0:
-                continue
+            pool_ids, _ = self._get_candidate_pool(
+                profile, profile.allowed_start_chars(ending), min_threshold, bot_exclude_zero,
+                used_words
+            )
+            for idx, word_id in enumerate(pool_ids):
+                if idx % 256 == 0 and speculation.cancelled:
+                    return
+                word_last_char = self.get_last_char(self.word_ids.word(word_id))
+                if word_last_char not in followup_counts:
+                    followup_counts[word_last_char] = self.count_unused_words_starting_with(
+                        profile.allowed_start_chars(word_last_char), used_words)
+            speculation.syllables_done += 1
+            self.telemetry.count("bot.speculated_syllables")
+
+    def _speculated_followup_counts(self, rule_profile: RuleProfile,
+                                    used_words: Set[str]) -> Dict[str, int]:
+        """미리 계산한 끝 음절별 미사용 후속 단어 수를 현재 사용 단어 기준으로 보정 (쓸 수 없으면 빈 dict)"""
+        speculation = self.bot_speculation
+        if speculation is None or speculation.dueum_mode != rule_profile.dueum_mode \
+                or not speculation.base_used <= used_words or speculation.followup_counts is None:
+            return {}
+
+        # 미리 계산한 뒤에 사용된 단어(보통 사용자 응답 하나)의 첫 음절
+        new_first_chars = [self.get_first_char(word) for word in used_words
+                           if word not in speculation.base_used]
+        counts: Dict[str, int] = {}
+        for last_char, count in speculation.followup_counts.items():
+            allowed_chars = rule_profile.allowed_start_chars(last_char)
+            counts[last_char] = count - sum(1 for char in new_first_chars if char in allowed_chars)
+        if counts:
+            self.telemetry.count("bot.speculation_hits")
+        return counts
 
-            min_threshold = max(0, 3200 - (self.get_effective_difficulty() * 400))
-            if max_euem < min_threshold:
-                continue
+    def _compute_bot_decision(self) -> Dict[str, Optional[str]]:
+        # 중단한 미리 계산 스레드가 끝난 뒤에 공유 색인(오프닝 북·풀 캐시)을 읽음
+        speculation = self.bot_speculation
+        if speculation is not None and not speculation.join(BOT_SPECULATION_JOIN_TIMEOUT):
+            self.telemetry.count("bot.speculation_join_timeouts")
 
-            possible_words.append((word, max_euem))
+        used_words_snapshot = set(self.used_words)
+        game_history_snapshot = list(self.game_history)
+        last_required_char = self.current_last_char
+        rule_profile = self.rule_profile
 
-        if not possible_words:
+        if not game_history_snapshot:
             return {"type": "no_word"}
 
-        safe_words: List[Tuple[str, int]] = []
-        for word, euem in possible_words:
-            last_char = self.get_last_char(word)
-            remaining = self.count_available_followups(
-                last_char, exclude_word=word, used_words=used_words_snapshot
+        min_threshold = self.bot_min_threshold()
+        exclude_zero = rule_profile.bans_zero_link(len(game_history_snapshot))
+
+        # 초반(이음 수 0 단어 금지 구간)에는 오프닝 북을 먼저 조회
+        candidates: Optional[Tuple[List[str], array]] = None
+        if exclude_zero and last_required_char:
+            candidates = self._opening_book_candidates(
+                rule_profile, last_required_char, min_threshold, used_words_snapshot
+            )
+        if candidates is None:
+            candidates = self._scan_bot_candidates(
+                rule_profile, last_required_char, min_threshold, exclude_zero, used_words_snapshot
             )
-            if remaining > 0:
-                safe_words.append((word, euem))
 
-        if safe_words:
-            possible_words = safe_words
+        possible_words, possible_euems = candidates
+        if not possible_words:
+            return {"type": "no_word"}
 
         last_user_word = game_history_snapshot[-1][1]
-        last_euem = max(
-            entry.get('이음 수', 0)
-            for entry in self.words_data[last_user_word]
-        )
+        last_euem = self.get_word_euem(last_user_word)
 
         base_prob = 1.0
         if last_euem < 1000:
@@ -958,29 +2256,20 @@ class WordChainGame:
         if should_fail:
             return {"type": "fail", "base_prob": base_prob}
 
-        min_euem = min(euem for _, euem in possible_words)
-        max_euem_val = max(euem for _, euem in possible_words)
-        difficulty_factor = self.get_effective_difficulty() / 10.0
+        with self.telemetry.timer("bot.weighting"):
+            difficulty_factor = self.get_effective_difficulty() / 10.0
 
-        if self.get_effective_difficulty() >= 10:
-            min_candidates = [
-                word for word, euem in possible_words if euem == min_euem
-            ]
-            selected_word = random.choice(min_candidates)
-        else:
-            if max_euem_val == min_euem:
-                weights = [1.0 for _ in possible_words]
+            if self.get_effective_difficulty() >= 10:
+                min_euem = min(possible_euems)
+                min_candidates = [
+                    word for word, euem in zip(possible_words, possible_euems)
+                    if euem == min_euem
+                ]
+                selected_word = random.choice(min_candidates)
             else:
-                weights = []
-                for _, euem in possible_words:
-                    normalized = (euem - min_euem) / (max_euem_val - min_euem)
-                    high_pref = (1.0 - difficulty_factor) * normalized
-                    low_pref = difficulty_factor * (1.0 - normalized)
-                    weights.append(high_pref + low_pref + 0.05)
-
-            selected_word = random.choices(
-                [word for word, _ in possible_words], weights=weights, k=1
-            )[0]
+                selected_word = possible_words[
+                    weighted_choice_index(possible_euems, difficulty_factor)
+                ]
 
         return {
             "type": "word",
@@ -989,7 +2278,139 @@ class WordChainGame:
             "last_char": self.get_last_char(selected_word),
         }
 
+    def _get_candidate_pool(self, rule_profile: RuleProfile,
+                            allowed_chars: Optional[FrozenSet[str]], min_threshold: int,
+                            exclude_zero: bool,
+                            used_words: Set[str]) -> Tuple[array, int]:
+        """허용 음절로 시작하는 미사용 단어 중 초기 이음 수가 문턱값을 넘는 단어 번호
+        (허용 음절 순·음절별 초기 이음 수 내림차순, 허용 음절 제한이 없으면 모든 첫 음절)와
+        초기 이음 수 때문에 미리 제외한 단어 수
+
+        현재 이음 수는 초기값보다 커지지 않으므로 풀은 현재 후보의 상위 집합이다.
+        풀의 내용은 허용 음절 범위 안의 사용 단어에만 의존하므로 그 집합을 키에 넣어
+        게임 안팎에서 같은 상태를 다시 만나면 재사용한다.
+        """
+        footprint = frozenset(
+            word for word in used_words
+            if allowed_chars is None or self.get_first_char(word) in allowed_chars
+        )
+        key = (rule_profile.dueum_mode, allowed_chars, min_threshold, exclude_zero, footprint)
+        pool = self.bot_pool_cache.get(key)
+        if pool is not None:
+            self.telemetry.count("bot.pool_cache_hits")
+            return pool
+
+        self.telemetry.count("bot.pool_cache_misses")
+        tables = self.rule_tables.get(rule_profile.dueum_mode)
+        if tables is None:
+            # 사전을 불러오기 전: 초기 이음 수가 없으므로 빈 풀 (캐시하지 않음)
+            return array('i'), 0
+        initial_euems = tables.link_counts
+        ranked = tables.words_ranked_by_first_char
+        footprint_ids = {self.word_ids.get(word) for word in footprint}
+        # 이음 수 0 단어 금지이면 문턱값이 0이어도 1 이상만
+        cutoff = max(min_threshold, 1) if exclude_zero else min_threshold
+        pool_ids = array('i')
+        rejected = 0
+        # frozenset 순회 순서는 실행마다 다르므로 정렬
+        for char in sorted(ranked if allowed_chars is None else allowed_chars):
+            ranked_ids = ranked.get(char, ())
+            for pos, word_id in enumerate(ranked_ids):
+                if initial_euems[word_id] < cutoff:
+                    # 초기 이음 수 내림차순이므로 나머지도 모두 문턱값 미만
+                    rejected += sum(1 for rest in ranked_ids[pos:] if rest not in footprint_ids)
+                    break
+                if word_id not in footprint_ids:
+                    pool_ids.append(word_id)
+
+        pool = (pool_ids, rejected)
+        self.bot_pool_cache.put(key, pool)
+        return pool
+
+    def _scan_bot_candidates(self, rule_profile: RuleProfile, last_char: str, min_threshold: int,
+                             exclude_zero: bool,
+                             used_words: Set[str]) -> Tuple[List[str], array]:
+        """봇 후보 단어와 현재 이음 수 반환 (문턱값·안전성 검사 적용)"""
+        allowed_chars: Optional[FrozenSet[str]] = None
+        if last_char:
+            allowed_chars = rule_profile.allowed_start_chars(last_char)
+
+        with self.telemetry.timer("bot.candidate_scan"):
+            candidate_ids, pool_rejected = self._get_candidate_pool(
+                rule_profile, allowed_chars, min_threshold, exclude_zero, used_words
+            )
+            word_max_euem = self.word_max_euem
+            candidate_euems = array('q', [word_max_euem[word_id] for word_id in candidate_ids])
+            kept_indices, rejected_by_threshold = threshold_candidate_indices(
+                candidate_euems,
+                min_threshold,
+                exclude_zero=exclude_zero,
+            )
+
+        self.telemetry.count("bot.candidates_examined", len(candidate_ids) + pool_rejected)
+        self.telemetry.count("bot.rejected_by_threshold", pool_rejected + rejected_by_threshold)
+
+        if not kept_indices:
+            return [], array('q')
+
+        with self.telemetry.timer("bot.safety_filter"):
+            # 끝 음절별 미사용 후속 단어 수 (사용자 턴에 미리 계산했으면 그 값을 보정해 사용)
+            followup_counts = self._speculated_followup_counts(rule_profile, used_words)
+            kept_words = [self.word_ids.word(candidate_ids[idx]) for idx in kept_indices]
+            safe_positions: List[int] = []
+            for pos, word in enumerate(kept_words):
+                last_char = self.get_last_char(word)
+                allowed_chars = rule_profile.allowed_start_chars(last_char)
+                remaining = followup_counts.get(last_char)
+                if remaining is None:
+                    remaining = self.count_unused_words_starting_with(allowed_chars, used_words)
+                    followup_counts[last_char] = remaining
+                # 후보 자신(미사용)은 제외
+                if self.get_first_char(word) in allowed_chars:
+                    remaining -= 1
+                if remaining > 0:
+                    safe_positions.append(pos)
+
+        if not safe_positions:
+            return kept_words, array('q', [candidate_euems[idx] for idx in kept_indices])
+
+        return ([kept_words[pos] for pos in safe_positions],
+                array('q', [candidate_euems[kept_indices[pos]] for pos in safe_positions]))
+
+    def _opening_book_candidates(self, rule_profile: RuleProfile, last_char: str,
+                                 min_threshold: int,
+                                 used_words: Set[str]) -> Optional[Tuple[List[str], array]]:
+        """오프닝 북에서 봇 후보 조회 (북을 쓸 수 없으면 None)
+
+        이음 수 0 단어 금지 구간 전용. 사용된 단어마다 이음 수가 정확히 한 번씩 줄어들므로
+        현재 이음 수는 남은 후속 단어 수와 같고, 1 이상인 후보는 안전성 검사도 통과한다.
+        """
+        if self.opening_book is None:
+            return None
+
+        with self.telemetry.timer("bot.opening_book"):
+            ranked = self.opening_book.candidates(rule_profile.dueum_mode, last_char, min_threshold)
+            if ranked is None:
+                return None
+
+            word_max_euem = self.word_max_euem
+            used_ids = {self.word_ids.get(word) for word in used_words}
+            possible_words: List[str] = []
+            possible_euems = array('q')
+            for word_id in ranked:
+                if word_id in used_ids:
+                    continue
+                euem = word_max_euem[word_id]
+                if euem == 0 or euem < min_threshold:
+                    continue
+                possible_words.append(self.word_ids.word(word_id))
+                possible_euems.append(euem)
+
+        self.telemetry.count("bot.opening_book_hits")
+        return possible_words, possible_euems
+
     def _apply_bot_result(self, turn_id: int, result: Dict[str, Optional[str]]):
+        self.pending_bot_after_id = None
         if turn_id != self.bot_turn_sequence or not self.game_active:
             return
 
@@ -997,12 +2418,13 @@ class WordChainGame:
 
         if outcome == "no_word":
             self.add_system_message("봇이 말할 수 있는 단어가 없습니다. 당신의 승리!")
-            self.status_label.config(text="게임 종료 - 당신의 승리! 🎉", fg="#27ae60")
+            self.ui.configure(self.status_label, text="게임 종료 - 당신의 승리! 🎉", fg="#27ae60")
             self.word_entry.config(state=tk.DISABLED)
             self.game_active = False
             self.stop_timer()
             self.reset_timer_display()
-            self.update_stats(wins=1)
+            self.update_stats(wins=1, reason="bot_no_word")
+            self.capture_game_profile("bot_no_word")
             return
 
         if outcome == "fail":
@@ -1010,12 +2432,13 @@ class WordChainGame:
             self.add_system_message(
                 f"봇이 단어를 찾지 못했습니다. 당신의 승리!"
             )
-            self.status_label.config(text="게임 종료 - 당신의 승리! 🎉", fg="#27ae60")
+            self.ui.configure(self.status_label, text="게임 종료 - 당신의 승리! 🎉", fg="#27ae60")
             self.word_entry.config(state=tk.DISABLED)
             self.game_active = False
             self.stop_timer()
             self.reset_timer_display()
-            self.update_stats(wins=1)
+            self.update_stats(wins=1, reason="bot_fail")
+            self.capture_game_profile("bot_fail")
             return
 
         if outcome != "word":
@@ -1028,14 +2451,12 @@ class WordChainGame:
         selected_first_char = result.get("first_char", "")
         last_char = result.get("last_char", "")
 
-        self.used_words.add(selected_word)
-        self.game_history.append(("bot", selected_word))
+        self.play_move("bot", selected_word, selected_first_char, last_char)
         self.add_word_message("bot", selected_word)
+        self.telemetry.end_turn("bot", selected_word)
 
-        self.current_last_char = last_char
-        self.apply_dueum_decrease(selected_first_char)
-
-        self.status_label.config(
+        self.ui.configure(
+            self.status_label,
             text=f"'{last_char}'(으)로 시작하는 단어를 입력하세요",
             fg="#2c5aa0"
         )
@@ -1043,50 +2464,64 @@ class WordChainGame:
         self.word_entry.focus()
         if self.game_active:
             self.start_timer()
+            self.start_bot_speculation()
+
+    def capture_game_profile(self, reason: str):
+        """프로파일링 모드에서 게임 종료 시점까지의 측정 결과 저장"""
+        if self.profiler is None:
+            return
+
+        for path in self.profiler.capture(reason):
+            self.add_system_message(f"프로파일 저장: {path}")
 
     def start_timer(self):
         """사용자 턴 타이머 시작"""
         self.stop_timer()
         self.update_turn_time_limit()
-        self.timer_seconds_remaining = self.turn_time_limit
-        self.timer_progress.config(maximum=self.turn_time_limit)
-        self.timer_progress['value'] = self.turn_time_limit
-        self.update_timer_display()
-        self.timer_after_id = self.root.after(1000, self.update_timer)
+        self.ui.configure(self.timer_progress, maximum=self.turn_time_limit)
+        self.timer_deadline = time.monotonic() + self.turn_time_limit
+        self.update_timer()
 
     def stop_timer(self):
         """타이머 중지"""
+        self.timer_deadline = None
         if self.timer_after_id is not None:
             self.root.after_cancel(self.timer_after_id)
             self.timer_after_id = None
 
     def update_timer(self):
-        """타이머 갱신"""
-        if self.timer_seconds_remaining <= 0:
+        """타이머 갱신 (남은 시간은 monotonic 마감 시각에서 계산하므로 지연이 누적되지 않음)"""
+        if self.timer_after_id is not None:
+            self.root.after_cancel(self.timer_after_id)
+            self.timer_after_id = None
+        if self.timer_deadline is None:
             return
 
-        self.timer_seconds_remaining -= 1
-        self.timer_progress['value'] = self.timer_seconds_remaining
+        remaining = self.timer_deadline - time.monotonic()
+        self.timer_seconds_remaining = max(0, math.ceil(remaining))
+        self.ui.configure(self.timer_progress, value=self.timer_seconds_remaining)
         self.update_timer_display()
 
-        if self.timer_seconds_remaining <= 0:
-            self.timer_progress['value'] = 0
+        if remaining <= 0:
+            self.timer_deadline = None
             self.handle_time_out()
         else:
-            self.timer_after_id = self.root.after(1000, self.update_timer)
+            # 표시되는 초가 바뀌는 시점에 다시 갱신
+            delay = remaining - (self.timer_seconds_remaining - 1)
+            self.timer_after_id = self.root.after(max(1, math.ceil(delay * 1000)), self.update_timer)
 
     def update_timer_display(self):
         """타이머 라벨 텍스트 갱신"""
         if self.timer_seconds_remaining > 0:
-            self.timer_label.config(text=f"남은 시간: {self.timer_seconds_remaining:02d}초")
+            self.ui.configure(self.timer_label, text=f"남은 시간: {self.timer_seconds_remaining:02d}초")
         else:
-            self.timer_label.config(text="남은 시간: 00초")
+            self.ui.configure(self.timer_label, text="남은 시간: 00초")
 
     def reset_timer_display(self):
         """타이머 표시 초기화"""
         self.timer_seconds_remaining = 0
-        self.timer_label.config(text="남은 시간: --")
-        self.timer_progress['value'] = 0
+        self.ui.configure(self.timer_label, text="남은 시간: --")
+        self.ui.configure(self.timer_progress, value=0)
 
     def handle_time_out(self):
         """사용자 시간 초과 처리"""
@@ -1096,12 +2531,14 @@ class WordChainGame:
         self.game_active = False
         self.cancel_pending_bot_turn()
         self.invalidate_bot_turn()
+        self.cancel_bot_speculation()
         self.stop_timer()
         self.word_entry.config(state=tk.DISABLED)
-        self.status_label.config(text="게임 종료 - 시간 초과! ⏰", fg="#c0392b")
+        self.ui.configure(self.status_label, text="게임 종료 - 시간 초과! ⏰", fg="#c0392b")
         self.add_system_message("시간 초과! 봇의 승리입니다.")
         self.show_possible_user_words()
-        self.update_stats(losses=1)
+        self.update_stats(losses=1, reason="timeout")
+        self.capture_game_profile("timeout")
 
     def forfeit_game(self):
         """사용자 기권 처리"""
@@ -1111,16 +2548,175 @@ class WordChainGame:
         self.game_active = False
         self.cancel_pending_bot_turn()
         self.invalidate_bot_turn()
+        self.cancel_bot_speculation()
         self.stop_timer()
         self.word_entry.config(state=tk.DISABLED)
-        self.status_label.config(text="게임 종료 - 당신의 패배", fg="#c0392b")
+        self.ui.configure(self.status_label, text="게임 종료 - 당신의 패배", fg="#c0392b")
         self.add_system_message("당신이 기권했습니다. 봇의 승리!")
         self.show_possible_user_words()
         self.reset_timer_display()
-        self.update_stats(losses=1)
+        self.update_stats(losses=1, reason="forfeit")
+        self.capture_game_profile("forfeit")
+
+    # ---------------------------------------------------------------------
+    # 무르기·분석 모드 (수순 기록으로 바뀐 단어만 되돌리거나 다시 적용)
+    # ---------------------------------------------------------------------
+    def step_back(self, _event=None):
+        """무르기 (게임 중에는 봇의 응답과 내 직전 단어, 분석 모드에서는 한 수)"""
+        if not self.analysis_mode:
+            self.take_back()
+            return
+
+        node = self._unplay_move()
+        if node is None:
+            self.add_system_message("분석: 첫 수 이전입니다.")
+            return
+        self.add_system_message(f"분석: '{node.word}' 무르기")
+        self.show_analysis_position()
+
+    def step_forward(self, _event=None):
+        """분석 모드에서 되돌렸던 수를 다시 둠"""
+        if not self.analysis_mode:
+            return
+
+        node = self._replay_move()
+        if node is None:
+            self.add_system_message("분석: 마지막 수입니다.")
+            return
+        self.add_word_message(node.speaker, node.word)
+        self.show_analysis_position()
+
+    def take_back(self):
+        """게임 중 무르기 (내 차례에만, 이번 게임의 승리 기록은 올라가지 않음)"""
+        if not self.game_active:
+            self.add_system_message("게임 중이거나 분석 모드일 때 무를 수 있습니다.")
+            return
+        if not self.game_history or self.game_history[-1][0] != "bot":
+            self.add_system_message("봇이 응답한 뒤 당신의 차례에 무를 수 있습니다.")
+            return
+
+        self.cancel_pending_bot_turn()
+        self.invalidate_bot_turn()
+        self.cancel_bot_speculation()
+        self.stop_timer()
+
+        undone = [node.word for node in (self._unplay_move(), self._unplay_move()) if node is not None]
+        first_use = not self.takeback_used_in_game
+        self.takeback_used_in_game = True
+        self.update_hint_status_label()
+        if first_use:
+            self.add_system_message("무르기를 사용하면 이번 게임의 승리 기록은 올라가지 않습니다.")
+        self.add_system_message(f"무르기: {', '.join(reversed(undone))}")
+
+        if self.current_last_char:
+            self.ui.configure(self.status_label,
+                              text=f"'{self.current_last_char}'(으)로 시작하는 단어를 입력하세요",
+                              fg="#2c5aa0")
+        else:
+            self.ui.configure(self.status_label, text="당신의 차례입니다", fg="#27ae60")
+        self.word_entry.config(state=tk.NORMAL)
+        self.word_entry.focus()
+        self.start_timer()
+        self.start_bot_speculation()
+
+    def toggle_analysis(self):
+        """분석 모드 켜기/끄기 (게임이 끝난 뒤 수순을 오가며 다른 수를 둬 볼 수 있음)"""
+        if self.analysis_mode:
+            self.analysis_mode = False
+            self.update_analysis_button()
+            self.word_entry.config(state=tk.DISABLED)
+            self.set_entry_feedback("")
+            self.ui.configure(self.status_label, text="분석 모드 종료", fg="#7f8c8d")
+            self.add_system_message("분석 모드를 마쳤습니다.")
+            return
+
+        if self.game_active:
+            self.add_system_message("게임이 끝난 뒤에 분석할 수 있습니다.")
+            return
+
+        self.analysis_mode = True
+        self.update_analysis_button()
+        self.word_entry.config(state=tk.NORMAL)
+        self.word_entry.focus()
+        self.add_system_message(
+            "분석 모드: 무르기(Ctrl+Z)·앞으로(Ctrl+Y)로 수순을 오가고, "
+            "단어를 입력하면 그 자리에서 다른 수를 둘 수 있습니다. (차례는 당신·봇 순으로 번갈아 듦)")
+        self.show_analysis_position()
+
+    def update_analysis_button(self):
+        button = getattr(self, 'analysis_btn', None)
+        if button is None:
+            return
+        self.ui.configure(button, text="분석 종료" if self.analysis_mode else "분석")
+
+    def analysis_speaker(self) -> str:
+        """분석 모드에서 다음 수를 둘 차례 (게임은 항상 사용자가 먼저 시작)"""
+        return "user" if len(self.game_history) % 2 == 0 else "bot"
+
+    def submit_analysis_word(self):
+        """분석 모드에서 현재 위치에 다음 수를 둠 (이미 둔 적 없는 단어면 새 변화)"""
+        word = self.word_entry.get().strip()
+        self.word_entry.delete(0, tk.END)
+        self.set_entry_feedback("")
+        if not word or not self.check_submission(word):
+            return
+
+        position = self.game_journal.current
+        if position.children and position.find_child(word) is None:
+            self.add_system_message(f"분석: {position.ply + 1}번째 수에서 새 변화")
+        speaker = self.analysis_speaker()
+        self.play_move(speaker, word, self.get_first_char(word), self.get_last_char(word))
+        self.add_word_message(speaker, word)
+        self.show_analysis_position()
+
+    def show_analysis_position(self):
+        """분석 모드의 현재 위치 (몇 번째 수, 누구 차례, 이 자리에서 갈라지는 수)"""
+        speaker = "당신" if self.analysis_speaker() == "user" else "봇"
+        ply = self.game_journal.ply
+        if self.current_last_char:
+            text = f"분석 {ply}수 - {speaker} 차례: '{self.current_last_char}'(으)로 시작하는 단어"
+        else:
+            text = f"분석 {ply}수 - {speaker} 차례: 첫 단어"
+        self.ui.configure(self.status_label, text=text, fg="#8e44ad")
+
+        alternatives = [node.word for node in self.game_journal.alternatives()]
+        if len(alternatives) > 1:
+            self.add_system_message_with_word_links("이 자리에서 둔 수: ", alternatives)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="끝말잇기 게임")
+    parser.add_argument("--profile", action="store_true",
+                        help="cProfile로 세션을 측정하고 게임마다 .pstats 파일 저장")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="tracemalloc으로 메모리 할당을 추적하고 게임마다 보고서 저장")
+    parser.add_argument("--profile-dir", default=PROFILE_OUTPUT_DIR,
+                        help=f"프로파일 결과 저장 폴더 (기본값: {PROFILE_OUTPUT_DIR})")
+    parser.add_argument("--player", default=DEFAULT_PLAYER,
+                        help=f"전적을 기록할 플레이어 이름 (기본값: {DEFAULT_PLAYER})")
+    parser.add_argument("--stats-db", default=STATS_DB_PATH,
+                        help=f"전적 DB 파일 (기본값: {STATS_DB_PATH})")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+
+    profiler: Optional[SessionProfiler] = None
+    if args.profile or args.trace_memory:
+        profiler = SessionProfiler(profile=args.profile,
+                                   trace_memory=args.trace_memory,
+                                   output_dir=args.profile_dir)
+        profiler.start()
 
-if __name__ == "__main__":
     root = tk.Tk()
-    app = WordChainGame(root)
-    root.mainloop()
+    app = WordChainGame(root, profiler=profiler, player=args.player, stats_path=args.stats_db)
+    try:
+        root.mainloop()
+    finally:
+        if profiler is not None:
+            profiler.stop()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
     
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+게임 초반(이음 수 0 단어 금지 구간) 봇 후보 오프닝 북
+
+- 시작 음절(이전 단어의 마지막 음절)마다, 그 음절 뒤에 올 수 있는 이음 수 1 이상 단어를
+  초기 이음 수 내림차순·가나다순으로 미리 정렬해 둔다 (두음법칙 방식별, 메모리에는 단어 번호로).
+- 이음 수는 게임 중 줄어들기만 하므로 초기 이음 수가 문턱값 이상인 앞부분이
+  현재 후보의 상위 집합이 된다. 봇은 이 앞부분만 현재 이음 수로 다시 걸러 쓴다.
+  난이도별 문턱값은 정렬된 목록에서 이분 탐색으로 자르는 위치가 된다.
+- dev/extract_words_to_json.py가 opening_book.json으로 미리 만들어 두고,
+  파일이 없으면 음절을 처음 조회할 때 rule_profiles의 색인을 병합해 만든다.
+
+opening_book.json 형식:
+    {"version": 사전 버전, "words_count": N, "dueum_modes": {방식: {시작 음절: [단어 번호, ...]}}}
+    단어 번호는 words.json 키 순서 기준. version(만들 때 쓴 words.json의 버전)이 다르면 쓰지 않는다.
+"""
+
+import bisect
+import heapq
+import json
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from hangul import DUEUM_MODES, get_dueum_variants
+from headword_dawg import WordIds
+from rule_profiles import RuleTables
+
+OPENING_BOOK_PATH = "opening_book.json"
+
+
+def compute_opening_book_data(words: Sequence[str],
+                              profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    """rule_profiles 데이터(방식별 이음 수·정렬 순서)로 방식별 오프닝 북 생성 (버전도 물려받음)"""
+    last_chars = sorted({w[-1] for w in words if w})
+    modes: Dict[str, Any] = {}
+    for mode in DUEUM_MODES:
+        mode_data = profile_data["dueum_modes"][mode]
+        link_counts = mode_data["link_counts"]
+
+        # 첫 음절별 이음 수 1 이상 단어 번호 (ranked_order 순서 유지)
+        ranked_by_first: Dict[str, List[int]] = {}
+        for idx in mode_data["ranked_order"]:
+            if link_counts[idx] > 0:
+                ranked_by_first.setdefault(words[idx][0], []).append(idx)
+
+        book: Dict[str, List[int]] = {}
+        for syllable in last_chars:
+            ranked = list(heapq.merge(
+                *(ranked_by_first.get(c, ()) for c in sorted(get_dueum_variants(syllable, mode))),
+                key=lambda idx: (-link_counts[idx], words[idx]),
+            ))
+            if ranked:
+                book[syllable] = ranked
+        modes[mode] = book
+    return {"version": profile_data.get("version", ""), "words_count": len(words), "dueum_modes": modes}
+
+
+def save_opening_book(path: str, words: Sequence[str], profile_data: Dict[str, Any]):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(compute_opening_book_data(words, profile_data),
+                           ensure_ascii=False, separators=(",", ":")))
+
+
+def load_opening_book(path: str, words: Sequence[str], version: str) -> Optional[Dict[str, Any]]:
+    """미리 만든 오프닝 북 (없거나 다른 버전의 words.json으로 만들었으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(data, dict) or not version or data.get("version") != version
+            or data.get("words_count") != len(words)
+            or not isinstance(data.get("dueum_modes"), dict)):
+        return None
+    return data
+
+
+class OpeningBook:
+    """(두음법칙 방식, 시작 음절) → 초기 이음 수 내림차순 후보 단어 번호 (처음 조회할 때 이분 탐색용 값을 붙임)"""
+
+    def __init__(self, word_ids: WordIds, rule_tables: Dict[str, RuleTables],
+                 data: Optional[Dict[str, Any]] = None, index_ids: Sequence[int] = ()):
+        """index_ids: data의 단어 번호(words.json 순서)를 word_ids 번호로 바꾸는 표"""
+        self.word_ids = word_ids
+        self.rule_tables = rule_tables
+        # JSON 정수 목록은 불러오자마자 단어 번호 배열로 바꿔 둠
+        self.raw_modes: Dict[str, Dict[str, array]] = {}
+        if data:
+            for mode, book in data["dueum_modes"].items():
+                self.raw_modes[mode] = {
+                    syllable: array("i", [index_ids[idx] for idx in raw])
+                    for syllable, raw in book.items()
+                }
+        # (방식, 음절) → (단어 번호, 음수로 바꾼 초기 이음 수: 오름차순이라 이분 탐색 가능)
+        self.entries: Dict[Tuple[str, str], Tuple[array, array]] = {}
+
+    def _entry(self, dueum_mode: str, syllable: str) -> Optional[Tuple[array, array]]:
+        key = (dueum_mode, syllable)
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry
+
+        tables = self.rule_tables.get(dueum_mode)
+        if tables is None:
+            return None
+
+        link_counts = tables.link_counts
+        ranked_ids = self.raw_modes.get(dueum_mode, {}).get(syllable)
+        if ranked_ids is None:
+            # 미리 만든 북이 없으면 첫 음절별 정렬 목록을 병합
+            ranked_ids = array("i", [
+                word_id for word_id in heapq.merge(
+                    *(tables.words_ranked_by_first_char.get(c, ())
+                      for c in get_dueum_variants(syllable, dueum_mode)),
+                    key=lambda i: (-link_counts[i], i),
+                )
+                if link_counts[word_id] > 0
+            ])
+
+        entry = (ranked_ids, array("i", [-link_counts[word_id] for word_id in ranked_ids]))
+        self.entries[key] = entry
+        return entry
+
+    def candidates(self, dueum_mode: str, syllable: str, min_euem: int) -> Optional[array]:
+        """초기 이음 수가 min_euem(최소 1) 이상인 후보 번호 (상위 집합, 호출자가 현재 값으로 다시 거름)"""
+        entry = self._entry(dueum_mode, syllable)
+        if entry is None:
+            return None
+
+        ranked_ids, negated_euems = entry
+        cut = bisect.bisect_right(negated_euems, -max(1, min_euem))
+        return ranked_ids[:cut]
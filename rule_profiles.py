@@ -0,0 +1,242 @@
+"""
+끝말잇기 규칙 변형(프로필)과 프로필별 사전 색인
+
+- 프로필은 두음법칙 적용 방식과 '게임 시작 후 N턴까지 이음 수 0 단어 금지' 규칙의 조합이다.
+- 이음 수와 색인은 두음법칙 방식에만 의존하므로 방식별로 한 번씩만 계산한다.
+  dev/extract_words_to_json.py가 rule_profiles.json으로 미리 계산해 두면
+  main.py는 불러올 때 그대로 색인을 만들고, 게임마다 포인터만 바꿔 끼운다.
+- 색인은 단어 문자열 대신 단어 번호(headword_dawg.WordIds)를 array로 보관한다.
+
+rule_profiles.json 형식:
+    {"version": 사전 버전, "words_count": N,
+     "dueum_modes": {방식: {"link_counts": [...], "ranked_order": [...]}}}
+    version      : 만들 때 쓴 words.json의 버전 (dictionary_delta.compute_file_version).
+                   다르면 단어 번호가 가리키는 단어가 다를 수 있으므로 쓰지 않는다.
+    link_counts  : words.json 키 순서와 같은 순서의 이음 수
+    ranked_order : 단어 번호를 (첫 음절, 이음 수 내림차순, 단어) 순으로 정렬한 목록
+"""
+
+import json
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from hangul import DUEUM_MODES, DUEUM_OFF, DUEUM_STANDARD, DUEUM_STRICT, get_dueum_variants
+from headword_dawg import WordIds
+
+RULE_PROFILES_PATH = "rule_profiles.json"
+
+
+@dataclass(frozen=True)
+class RuleProfile:
+    key: str
+    label: str
+    dueum_mode: str = DUEUM_STANDARD
+    # 게임 시작 후 이 턴 수까지는 이음 수가 0인 단어(한방 단어) 사용 불가
+    opening_ban_turns: int = 4
+
+    def allowed_start_chars(self, last_char: str) -> FrozenSet[str]:
+        """이전 단어의 마지막 음절 뒤에 올 수 있는 시작 음절 집합"""
+        return get_dueum_variants(last_char, self.dueum_mode)
+
+    def bans_zero_link(self, turns_played: int) -> bool:
+        """지금까지 진행된 턴 수 기준으로 이음 수 0 단어가 금지되는지"""
+        return turns_played < self.opening_ban_turns
+
+
+RULE_PROFILES: Dict[str, RuleProfile] = {
+    profile.key: profile for profile in (
+        RuleProfile("standard", "표준"),
+        RuleProfile("no_dueum", "두음법칙 없음", dueum_mode=DUEUM_OFF),
+        RuleProfile("strict_dueum", "엄격한 두음법칙", dueum_mode=DUEUM_STRICT),
+        RuleProfile("free_opening", "첫 턴부터 한방 단어 허용", opening_ban_turns=0),
+    )
+}
+DEFAULT_RULE_PROFILE = "standard"
+
+
+# -------------------------------------------------------------------------
+# 두음법칙 방식별 이음 수 / 색인
+# -------------------------------------------------------------------------
+def compute_link_counts(words: Sequence[str], dueum_mode: str = DUEUM_STANDARD) -> List[int]:
+    """
+    각 표기의 이음 수 (words 순서).
+      T = 마지막 음절로 시작할 수 있는 음절 집합 (dueum_mode 기준)
+      count = Σ(T의 음절로 시작하는 표기 수) - [자기 자신이 T 중 하나로 시작하면 1]
+    """
+    start_count: Dict[str, int] = {}
+    for w in words:
+        if w:
+            start_count[w[0]] = start_count.get(w[0], 0) + 1
+
+    counts: List[int] = []
+    for w in words:
+        if not w:
+            counts.append(0)
+            continue
+        candidates = get_dueum_variants(w[-1], dueum_mode)
+        total = sum(start_count.get(c, 0) for c in candidates)
+        if w[0] in candidates:
+            total -= 1
+        counts.append(total)
+    return counts
+
+
+def compute_ranked_order(words: Sequence[str], link_counts: Sequence[int]) -> List[int]:
+    """단어 번호를 (첫 음절, 이음 수 내림차순, 단어) 순으로 정렬"""
+    return sorted(
+        (idx for idx, w in enumerate(words) if w),
+        key=lambda idx: (words[idx][0], -link_counts[idx], words[idx]),
+    )
+
+
+def compute_profile_data(words: Sequence[str], version: str = "") -> Dict[str, Any]:
+    """rule_profiles.json에 저장할 방식별 이음 수와 정렬 순서 (version: words.json의 버전)"""
+    modes: Dict[str, Any] = {}
+    for mode in DUEUM_MODES:
+        link_counts = compute_link_counts(words, mode)
+        modes[mode] = {
+            "link_counts": link_counts,
+            "ranked_order": compute_ranked_order(words, link_counts),
+        }
+    return {"version": version, "words_count": len(words), "dueum_modes": modes}
+
+
+def save_profile_data(path: str, data: Dict[str, Any]):
+    """compute_profile_data 결과 저장"""
+    # json.dump은 파일에 조각조각 쓰느라 C 인코더를 쓰지 않으므로 문자열로 한 번에 만듦
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(data, separators=(",", ":")))
+
+
+def load_profile_data(path: str, words: Sequence[str], version: str) -> Optional[Dict[str, Any]]:
+    """미리 계산된 프로필 데이터 (없거나 다른 버전의 words.json으로 만들었으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(data, dict) or not version or data.get("version") != version
+            or data.get("words_count") != len(words)):
+        return None
+    modes = data.get("dueum_modes", {})
+    for mode in DUEUM_MODES:
+        mode_data = modes.get(mode)
+        if (not mode_data
+                or len(mode_data.get("link_counts", ())) != len(words)
+                or len(mode_data.get("ranked_order", ())) > len(words)):
+            return None
+    return data
+
+
+class RuleTables:
+    """두음법칙 방식 하나에 대한 게임 색인 (사전 로드 시 한 번 만들고 게임 간 공유, 읽기 전용)
+
+    단어는 문자열 대신 WordIds의 단어 번호로 보관한다. 표제어가 아닌 번호의 이음 수는 -1.
+    """
+
+    __slots__ = ("dueum_mode", "word_ids", "link_counts", "words_by_last_char_variants",
+                 "words_ranked_by_first_char")
+
+    def __init__(self, dueum_mode: str, word_ids: WordIds, words: Sequence[str],
+                 index_ids: Sequence[int], link_counts: Sequence[int], ranked_order: Sequence[int]):
+        """words·link_counts·ranked_order는 words.json 순서, index_ids는 그 순서의 단어 번호"""
+        self.dueum_mode = dueum_mode
+        self.word_ids = word_ids
+        # 단어 번호별 초기 이음 수 (게임마다 복사해서 감소시킴)
+        self.link_counts = array("i", [-1]) * len(word_ids)
+        for word_id, count in zip(index_ids, link_counts):
+            if word_id >= 0:
+                self.link_counts[word_id] = count
+        # 시작 음절 → 그 음절로 이어질 수 있는 단어(마지막 음절 기준)의 번호
+        self.words_by_last_char_variants: Dict[str, array] = {}
+        for w, word_id in zip(words, index_ids):
+            if word_id < 0:
+                continue
+            for variant in get_dueum_variants(w[-1], dueum_mode):
+                self.words_by_last_char_variants.setdefault(variant, array("i")).append(word_id)
+        # 첫 음절별 단어 번호, 초기 이음 수 내림차순·단어 번호(처음 불러온 사전에서는 가나다순) 오름차순
+        self.words_ranked_by_first_char: Dict[str, array] = {}
+        for idx in ranked_order:
+            self.words_ranked_by_first_char.setdefault(words[idx][0], array("i")).append(index_ids[idx])
+
+    def apply_delta(self, removed: Sequence[str], added: Sequence[str]):
+        """
+        표제어 삭제·추가를 색인에 제자리 반영 (전체 재계산 없이 영향받는 단어의 이음 수만 고침)
+        단어 w가 추가·삭제되면 w의 첫 음절 뒤에 올 수 있는 단어들(끝 음절 기준)의 이음 수가 ±1
+        """
+        word_ids = self.word_ids
+        link_counts = self.link_counts
+        by_last = self.words_by_last_char_variants
+        ranked = self.words_ranked_by_first_char
+        start_count = {c: len(ids) for c, ids in ranked.items()}
+        touched: Set[str] = set()
+        touched_ids: Set[int] = set()
+
+        for w in removed:
+            word_id = word_ids.get(w)
+            if not 0 <= word_id < len(link_counts) or link_counts[word_id] < 0:
+                continue
+            link_counts[word_id] = -1
+            for variant in get_dueum_variants(w[-1], self.dueum_mode):
+                by_last[variant].remove(word_id)
+            start_count[w[0]] -= 1
+            touched.add(w[0])
+            for other in by_last.get(w[0], ()):
+                link_counts[other] -= 1
+                touched_ids.add(other)
+
+        new_ids: List[Tuple[str, int]] = []
+        for w in added:
+            if not w:
+                continue
+            word_id = word_ids.add(w)
+            if word_id >= len(link_counts):
+                link_counts.extend(array("i", [-1]) * (len(word_ids) - len(link_counts)))
+            elif link_counts[word_id] >= 0:
+                continue
+            variants = get_dueum_variants(w[-1], self.dueum_mode)
+            for variant in variants:
+                by_last.setdefault(variant, array("i")).append(word_id)
+            start_count[w[0]] = start_count.get(w[0], 0) + 1
+            for other in by_last.get(w[0], ()):
+                if other != word_id and link_counts[other] >= 0:
+                    link_counts[other] += 1
+                    touched_ids.add(other)
+            link_counts[word_id] = (sum(start_count.get(c, 0) for c in variants)
+                                    - (1 if w[0] in variants else 0))
+            new_ids.append((w[0], word_id))
+            touched.add(w[0])
+
+        # 이음 수가 바뀐 단어가 있는 첫 음절 목록만 다시 정렬
+        touched.update(word_ids.word(word_id)[0] for word_id in touched_ids)
+        added_by_first: Dict[str, List[int]] = {}
+        for first_char, word_id in new_ids:
+            added_by_first.setdefault(first_char, []).append(word_id)
+        for c in touched:
+            members = [word_id for word_id in ranked.get(c, ()) if link_counts[word_id] >= 0]
+            members.extend(added_by_first.get(c, ()))
+            if members:
+                ranked[c] = array("i", sorted(members, key=lambda i: (-link_counts[i], i)))
+            else:
+                ranked.pop(c, None)
+
+
+def build_rule_tables(word_ids: WordIds, words: Sequence[str], index_ids: Sequence[int],
+                      profile_data: Optional[Dict[str, Any]] = None) -> Dict[str, RuleTables]:
+    """
+    방식별 색인 생성 (profile_data가 없으면 이음 수와 정렬 순서를 직접 계산)
+    words는 words.json 순서의 표제어, index_ids는 word_ids.assign(words)
+    """
+    tables: Dict[str, RuleTables] = {}
+    for mode in DUEUM_MODES:
+        if profile_data is not None:
+            mode_data = profile_data["dueum_modes"][mode]
+            link_counts = mode_data["link_counts"]
+            ranked_order = mode_data["ranked_order"]
+        else:
+            link_counts = compute_link_counts(words, mode)
+            ranked_order = compute_ranked_order(words, link_counts)
+        tables[mode] = RuleTables(mode, word_ids, words, index_ids, link_counts, ranked_order)
+    return tables
@@ -0,0 +1,155 @@
+"""
+게임 전적 저장소 (SQLite, 플레이어 프로필별 게임 기록)
+
+- 게임 한 판이 games 테이블의 한 행이다. 플레이어·난이도별 승패는 (player, difficulty, won, assisted)
+  색인만 읽는 집계 쿼리로 구하므로 기록이 수십만 판이어도 빠르다.
+- 힌트 등 도움을 받은 판도 assisted = 1로 기록한다. 결과(won)는 그대로 두고,
+  승패 집계에서 도움받은 승리만 승리로 세지 않는다 (패배는 그대로 셈).
+- 여러 사람이 같은 단말을 쓰면 플레이어 이름으로 기록을 나눈다. 기본 플레이어는 DEFAULT_PLAYER.
+- DB를 처음 만들 때 이전 형식의 game_stats.json이 있으면 기본 플레이어의 기록으로 옮긴다.
+  (판별 기록이 없으므로 난이도별 승패 수만큼 결과만 있는 행을 만든다)
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+STATS_DB_PATH = "game_stats.db"
+LEGACY_STATS_PATH = "game_stats.json"
+DEFAULT_PLAYER = "기본"
+LEGACY_IMPORT_REASON = "imported"
+
+# PRAGMA user_version: 0은 새 DB (이전 기록 옮기기 전)
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT PRIMARY KEY,
+    created_at REAL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty INTEGER,
+    won INTEGER NOT NULL,
+    assisted INTEGER NOT NULL DEFAULT 0,
+    reason TEXT,
+    rule_profile TEXT,
+    turns INTEGER,
+    played_at REAL
+);
+CREATE INDEX IF NOT EXISTS games_by_player_difficulty ON games (player, difficulty, won, assisted);
+"""
+
+# 집계에서 승리로 세는 판 (도움받은 승리 제외)
+_COUNTED_WIN = "won = 1 AND assisted = 0"
+
+# 난이도 → {"wins": 승리 수, "losses": 패배 수}
+DifficultyStats = Dict[int, Dict[str, int]]
+
+
+def read_legacy_stats(path: str) -> Tuple[int, int, DifficultyStats]:
+    """이전 형식 game_stats.json의 (전체 승리, 전체 패배, 난이도별 승패)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    wins = max(int(data.get("wins", 0)), 0)
+    losses = max(int(data.get("losses", 0)), 0)
+
+    by_difficulty: DifficultyStats = {}
+    raw = data.get("by_difficulty", {})
+    if isinstance(raw, dict):
+        for key, value in raw.items():
+            try:
+                level = int(key)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(value, dict):
+                continue
+            counts = {}
+            for name in ("wins", "losses"):
+                try:
+                    counts[name] = max(int(value.get(name, 0)), 0)
+                except (TypeError, ValueError):
+                    counts[name] = 0
+            by_difficulty[level] = counts
+    return wins, losses, by_difficulty
+
+
+class StatsStore:
+    """플레이어별 게임 기록 (한 판 = 한 행)"""
+
+    def __init__(self, path: str = STATS_DB_PATH, legacy_path: Optional[str] = LEGACY_STATS_PATH):
+        self.path = path
+        # 같은 단말의 여러 인스턴스가 함께 쓸 수 있도록 잠금 대기
+        self._conn = sqlite3.connect(path, timeout=5.0)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+                if legacy_path:
+                    self._import_legacy(legacy_path)
+                self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self):
+        self._conn.close()
+
+    def _import_legacy(self, legacy_path: str):
+        try:
+            wins, losses, by_difficulty = read_legacy_stats(legacy_path)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+
+        rows: List[Tuple[Optional[int], int]] = []
+        for level, counts in sorted(by_difficulty.items()):
+            rows += [(level, 1)] * counts["wins"]
+            rows += [(level, 0)] * counts["losses"]
+        # 난이도 없이 합계에만 있던 판
+        rows += [(None, 1)] * max(0, wins - sum(c["wins"] for c in by_difficulty.values()))
+        rows += [(None, 0)] * max(0, losses - sum(c["losses"] for c in by_difficulty.values()))
+        if not rows:
+            return
+
+        self._add_player(DEFAULT_PLAYER)
+        self._conn.executemany(
+            "INSERT INTO games (player, difficulty, won, reason) VALUES (?, ?, ?, ?)",
+            ((DEFAULT_PLAYER, level, won, LEGACY_IMPORT_REASON) for level, won in rows))
+
+    def _add_player(self, name: str):
+        self._conn.execute("INSERT OR IGNORE INTO players (name, created_at) VALUES (?, ?)",
+                           (name, time.time()))
+
+    def add_player(self, name: str):
+        with self._conn:
+            self._add_player(name)
+
+    def players(self) -> List[str]:
+        return [row[0] for row in self._conn.execute("SELECT name FROM players ORDER BY name")]
+
+    def record_game(self, player: str, won: bool, difficulty: Optional[int] = None,
+                    reason: Optional[str] = None, rule_profile: Optional[str] = None,
+                    turns: Optional[int] = None, played_at: Optional[float] = None,
+                    assisted: bool = False):
+        """한 판 기록 (assisted: 힌트 등 도움을 받은 판, 이긴 판이면 집계에서 승리로 세지 않음)"""
+        with self._conn:
+            self._add_player(player)
+            self._conn.execute(
+                "INSERT INTO games (player, difficulty, won, assisted, reason, rule_profile, turns, "
+                "played_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (player, difficulty, 1 if won else 0, 1 if assisted else 0, reason, rule_profile,
+                 turns, time.time() if played_at is None else played_at))
+
+    def totals(self, player: str) -> Tuple[int, int]:
+        """(전체 승리, 전체 패배)"""
+        wins, losses = self._conn.execute(
+            f"SELECT COALESCE(SUM({_COUNTED_WIN}), 0), COALESCE(SUM(won = 0), 0) FROM games "
+            "WHERE player = ?", (player,)
+        ).fetchone()
+        return wins, losses
+
+    def stats_by_difficulty(self, player: str) -> DifficultyStats:
+        """난이도별 승패 (난이도가 기록되지 않은 판 제외)"""
+        return {
+            level: {"wins": wins, "losses": losses}
+            for level, wins, losses in self._conn.execute(
+                f"SELECT difficulty, SUM({_COUNTED_WIN}), SUM(won = 0) FROM games "
+                "WHERE player = ? AND difficulty IS NOT NULL GROUP BY difficulty", (player,))
+        }
@@ -0,0 +1,189 @@
+"""
+사전에 없는 단어를 냈을 때 보여 줄 비슷한 표제어 ("혹시 이 단어인가요?") 색인
+
+- 표제어를 자모 입력 순서 문자열로 풀어(겹자모는 두 타로: 'ㅘ' → 'ㅗㅏ', 'ㄳ' → 'ㄱㅅ')
+  자모 편집 거리로 비교한다. 받침이 다음 음절 초성으로 넘어간 오타('각아' ↔ '가가')도 거리 1이다.
+- 첫 음절별로 자모 바이그램 역색인을 처음 검색할 때 표제어 집합에서 그 음절 범위만 읽어 만든다. 끝말잇기에서 낼 수 있는 단어는
+  첫 음절이 정해져 있으므로 허용 첫 음절의 색인만 찾는다. 검색어와 바이그램을 충분히 공유하는
+  단어만 골라 거리를 계산하므로 표제어 수만 개짜리 음절에서도 몇 ms 안에 끝난다.
+- 사전 변경분은 이미 만든 색인에만 반영한다(추가는 덧붙이고, 삭제는 표시만 해 둔다).
+  아직 만들지 않은 음절은 나중에 변경이 반영된 표제어 집합에서 읽는다.
+"""
+
+import heapq
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from hangul import CHOS, HANGUL_BASE, HANGUL_SYLLABLE_COUNT, JONGS, JUNGS, decompose
+
+SUGGEST_MAX_DISTANCE = 2
+# 이 글자 수 이하인 짧은 검색어는 자모 거리 1까지만 (두 글자 단어가 전혀 다른 단어로 제안되지 않도록)
+SHORT_QUERY_LENGTH = 2
+
+_COMPOUND_JAMO = {
+    'ㄲ': 'ㄱㄱ', 'ㄸ': 'ㄷㄷ', 'ㅃ': 'ㅂㅂ', 'ㅆ': 'ㅅㅅ', 'ㅉ': 'ㅈㅈ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+
+def _split_jamo(jamo: str) -> str:
+    return _COMPOUND_JAMO.get(jamo, jamo)
+
+
+def _build_jamo_table() -> Dict[int, str]:
+    table = {}
+    for offset in range(HANGUL_SYLLABLE_COUNT):
+        ch = chr(HANGUL_BASE + offset)
+        cho, jung, jong = decompose(ch)
+        table[ord(ch)] = _split_jamo(CHOS[cho]) + _split_jamo(JUNGS[jung]) + _split_jamo(JONGS[jong])
+    return table
+
+
+_JAMO_TABLE = _build_jamo_table()
+
+
+def to_jamo(word: str) -> str:
+    """한글 음절을 자모 입력 순서로 푼 문자열 (그 외 문자는 그대로)"""
+    return word.translate(_JAMO_TABLE)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """레벤슈타인 거리 (max_distance를 넘으면 max_distance + 1)"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(cost)
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+def _bigrams(key: str) -> Set[str]:
+    padded = "^" + key + "$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class _BigramGroup:
+    """첫 음절이 같은 표제어의 자모 바이그램 역색인"""
+
+    __slots__ = ("words", "keys", "postings")
+
+    def __init__(self, words: Iterable[str]):
+        self.words: List[str] = []
+        self.keys: List[str] = []
+        self.postings: Dict[str, List[int]] = {}
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        idx = len(self.words)
+        key = to_jamo(word)
+        self.words.append(word)
+        self.keys.append(key)
+        for gram in _bigrams(key):
+            self.postings.setdefault(gram, []).append(idx)
+
+    def search(self, key: str, max_distance: int) -> Iterator[Tuple[int, str]]:
+        """key(자모 문자열)와의 거리가 max_distance 이하인 (거리, 단어)"""
+        grams = _bigrams(key)
+        # 편집 한 번은 검색어 바이그램을 많아야 두 종류 없앰
+        min_shared = len(grams) - 2 * max_distance
+        if min_shared > 0:
+            shared = Counter()
+            for gram in grams:
+                postings = self.postings.get(gram)
+                if not postings:
+                    continue
+                if len(postings) == len(self.words):
+                    # 모든 단어에 있는 바이그램(첫 음절 등)은 세지 않고 문턱값에서 뺌
+                    min_shared -= 1
+                    continue
+                shared.update(postings)
+            if min_shared > 0:
+                candidates: Iterable[int] = (idx for idx, count in shared.items()
+                                             if count >= min_shared)
+            else:
+                candidates = range(len(self.words))
+        else:
+            candidates = range(len(self.words))
+
+        keys = self.keys
+        length = len(key)
+        for idx in candidates:
+            other = keys[idx]
+            if abs(len(other) - length) > max_distance:
+                continue
+            distance = edit_distance(key, other, max_distance)
+            if distance <= max_distance:
+                yield distance, self.words[idx]
+
+
+class SuggestionIndex:
+    """첫 음절별 자모 바이그램 역색인 (첫 음절마다 처음 검색할 때 만듦)"""
+
+    def __init__(self, words_starting_with: Callable[[str], Iterable[str]]):
+        # 첫 음절 → 그 음절로 시작하는 표제어 (표제어 집합의 iter_prefix)
+        self._words_starting_with = words_starting_with
+        self._groups: Dict[str, _BigramGroup] = {}
+        # 색인에 남아 있지만 사전에서 삭제된 단어
+        self._removed: Set[str] = set()
+
+    def _group(self, first_char: str) -> Optional[_BigramGroup]:
+        group = self._groups.get(first_char)
+        if group is None:
+            group = _BigramGroup(self._words_starting_with(first_char))
+            if not group.words:
+                return None
+            self._groups[first_char] = group
+        return group
+
+    def apply_delta(self, removed: Sequence[str], added: Sequence[str]):
+        """표제어 삭제·추가 반영"""
+        for word in removed:
+            if word and word[0] in self._groups:
+                self._removed.add(word)
+        for word in added:
+            if not word:
+                continue
+            group = self._groups.get(word[0])
+            if group is None:
+                continue
+            if word in self._removed:
+                # 삭제 표시만 했던 단어는 색인에 그대로 남아 있음
+                self._removed.discard(word)
+            else:
+                group.add(word)
+
+    def suggest(self, query: str, first_chars: Iterable[str], limit: int,
+                accept: Optional[Callable[[str], bool]] = None,
+                max_distance: int = SUGGEST_MAX_DISTANCE) -> List[str]:
+        """
+        first_chars로 시작하는 표제어 중 query와 자모 거리가 가까운 순 limit개
+        (같은 거리면 글자 수 차이가 작은 단어, 가나다순. accept가 False인 단어는 제외)
+        """
+        key = to_jamo(query)
+        if len(query) <= SHORT_QUERY_LENGTH:
+            max_distance = min(max_distance, 1)
+
+        found: List[Tuple[int, int, str]] = []
+        for first_char in set(first_chars):
+            group = self._group(first_char)
+            if group is None:
+                continue
+            for distance, word in group.search(key, max_distance):
+                if word == query or word in self._removed:
+                    continue
+                if accept is not None and not accept(word):
+                    continue
+                found.append((distance, abs(len(word) - len(query)), word))
+        return [word for _, _, word in heapq.nsmallest(limit, found)]
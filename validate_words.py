@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+단어 목록·게임 기록을 게임 규칙(word_rules.py, submit_word와 동일)으로 일괄 검사하는 CLI
+
+입력: 파일 경로들 또는 표준 입력('-', 기본값), UTF-8, 한 줄에 단어 하나
+  --mode words      (기본) 줄마다 독립적으로, 새 게임의 첫 단어로 검사
+  --mode transcript 빈 줄로 구분된 게임 기록. 각 게임 안에서 차례대로 검사하고
+                    통과한 단어만 기록에 반영 (게임에서 거절된 입력처럼 취급).
+                    줄이 '화자<TAB>단어' 형식이면 화자를 함께 출력
+출력: 입력 한 줄마다 JSON 한 줄 (표준 출력)
+  {"source": ..., "line": N, "word": ..., "ok": true, "link_count": K}
+  {"source": ..., "line": N, "word": ..., "ok": false, "reason": 코드, "message": 경고 문구}
+  transcript 모드에서는 "game", "turn"(통과한 단어 기준 턴 번호), "speaker"가 추가된다.
+종료 코드: 모두 통과하면 0, 거절된 입력이 있으면 1, 사전·입력을 읽을 수 없으면(UTF-8이 아닌 입력 포함) 2
+
+입력은 --chunk-size 줄(transcript 모드는 게임 단위) 묶음으로 흘려보내며,
+--workers N이면 묶음을 프로세스 N개에 나눠 검사하되 동시에 처리 중인 묶음 수를 제한해
+입력 크기와 관계없이 메모리 사용량이 일정하다. 출력 순서는 입력 순서와 같다.
+
+사용 예:
+    python validate_words.py words.txt
+    python validate_words.py --mode transcript --rule-profile no_dueum games/*.txt
+    cat huge_list.txt | python validate_words.py --workers 4 > result.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dictionary_delta import compute_file_version
+from field_codes import FIELD_CODES_KEY
+from rule_profiles import (DEFAULT_RULE_PROFILE, RULE_PROFILES, RULE_PROFILES_PATH, RuleProfile,
+                           compute_link_counts, load_profile_data)
+from word_rules import RuleGame
+
+DEFAULT_WORDS_PATH = "words.json"
+DEFAULT_CHUNK_SIZE = 2000
+# 작업자 하나당 동시에 처리 중일 수 있는 묶음 수
+IN_FLIGHT_PER_WORKER = 2
+
+# (출처, 줄 번호, 원본 줄)
+InputLine = Tuple[str, int, str]
+
+
+def load_link_counts(words_path: str, profile: RuleProfile) -> Dict[str, int]:
+    """단어 → 초기 이음 수 (프로필의 두음법칙 방식 기준, rule_profiles.json이 옆에 있으면 사용)"""
+    with open(words_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.pop(FIELD_CODES_KEY, None)
+    words = list(data.keys())
+
+    profiles_path = os.path.join(os.path.dirname(os.path.abspath(words_path)), RULE_PROFILES_PATH)
+    profile_data = load_profile_data(profiles_path, words, compute_file_version(words_path))
+    if profile_data is not None:
+        link_counts = profile_data["dueum_modes"][profile.dueum_mode]["link_counts"]
+    else:
+        link_counts = compute_link_counts(words, profile.dueum_mode)
+    return {w: count for w, count in zip(words, link_counts) if w}
+
+
+# -------------------------------------------------------------------------
+# 검사 (작업자 프로세스에서도 실행)
+# -------------------------------------------------------------------------
+_profile: Optional[RuleProfile] = None
+_link_counts: Dict[str, int] = {}
+
+
+def _init_worker(words_path: str, profile_key: str):
+    """작업자 초기화 (fork로 부모의 사전을 물려받았으면 다시 읽지 않음)"""
+    global _profile, _link_counts
+    if _profile is None or _profile.key != profile_key:
+        _profile = RULE_PROFILES[profile_key]
+        _link_counts = load_link_counts(words_path, _profile)
+
+
+def _result(source: str, line_no: int, word: str, game: RuleGame) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"source": source, "line": line_no, "word": word}
+    if not word:
+        result.update(ok=False, reason="empty", message="빈 줄입니다.")
+        return result
+
+    violation = game.check(word)
+    if violation is None:
+        result.update(ok=True, link_count=game.link_count(word))
+    else:
+        result.update(ok=False, reason=violation.code, message=violation.message)
+    return result
+
+
+def validate_words_chunk(lines: List[InputLine]) -> List[Dict[str, Any]]:
+    """줄마다 새 게임의 첫 단어로 검사"""
+    return [
+        _result(source, line_no, text.strip(), RuleGame(_profile, _link_counts))
+        for source, line_no, text in lines
+    ]
+
+
+def validate_transcript(game_no: int, lines: List[InputLine]) -> List[Dict[str, Any]]:
+    """게임 기록 하나를 차례대로 검사"""
+    game = RuleGame(_profile, _link_counts)
+    output: List[Dict[str, Any]] = []
+    for source, line_no, text in lines:
+        speaker, _, word = text.rpartition("\t")
+        word = word.strip()
+        result = _result(source, line_no, word, game)
+        result["game"] = game_no
+        if speaker:
+            result["speaker"] = speaker.strip()
+        if result["ok"]:
+            game.play(word)
+            result["turn"] = game.turns_played
+        output.append(result)
+    return output
+
+
+def _validate_task(task: Tuple[str, Any]) -> Tuple[List[str], int]:
+    """작업 하나를 검사해 (JSON 줄 목록, 거절 수) 반환"""
+    kind, payload = task
+    if kind == "transcript":
+        results = validate_transcript(*payload)
+    else:
+        results = validate_words_chunk(payload)
+    rejected = sum(1 for result in results if not result["ok"])
+    return [json.dumps(result, ensure_ascii=False) for result in results], rejected
+
+
+# -------------------------------------------------------------------------
+# 입력 스트림
+# -------------------------------------------------------------------------
+def _iter_stream_lines(path: str, stream: Iterable[str]) -> Iterator[InputLine]:
+    try:
+        for line_no, text in enumerate(stream, 1):
+            yield path, line_no, text.rstrip("\r\n")
+    except UnicodeDecodeError as e:
+        # 버퍼 단위로 디코딩하므로 정확한 줄 번호 대신 바이트 위치를 알림
+        raise ValueError(f"{path}: UTF-8로 읽을 수 없습니다 ({e})") from e
+
+
+def iter_input_lines(paths: Iterable[str]) -> Iterator[InputLine]:
+    for path in paths:
+        if path == "-":
+            yield from _iter_stream_lines(path, sys.stdin)
+            continue
+        with open(path, "r", encoding="utf-8") as stream:
+            yield from _iter_stream_lines(path, stream)
+
+
+def iter_word_tasks(lines: Iterator[InputLine], chunk_size: int) -> Iterator[Tuple[str, Any]]:
+    chunk: List[InputLine] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield "words", chunk
+            chunk = []
+    if chunk:
+        yield "words", chunk
+
+
+def iter_transcript_tasks(lines: Iterator[InputLine]) -> Iterator[Tuple[str, Any]]:
+    """빈 줄이나 파일 경계에서 게임을 나눔"""
+    game_no = 0
+    current: List[InputLine] = []
+    for line in lines:
+        if current and line[0] != current[-1][0]:
+            game_no += 1
+            yield "transcript", (game_no, current)
+            current = []
+        if line[2].strip():
+            current.append(line)
+        elif current:
+            game_no += 1
+            yield "transcript", (game_no, current)
+            current = []
+    if current:
+        game_no += 1
+        yield "transcript", (game_no, current)
+
+
+def run_tasks(tasks: Iterator[Tuple[str, Any]], workers: int,
+              words_path: str, profile_key: str) -> Iterator[Tuple[List[str], int]]:
+    """작업 결과를 입력 순서대로 생성 (동시에 처리 중인 작업 수를 제한)"""
+    if workers <= 1:
+        for task in tasks:
+            yield _validate_task(task)
+        return
+
+    max_in_flight = workers * IN_FLIGHT_PER_WORKER
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(words_path, profile_key)) as pool:
+        pending: deque = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(_validate_task, (task,)))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="끝말잇기 규칙으로 단어 목록·게임 기록 일괄 검사")
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="입력 파일 (기본값: 표준 입력)")
+    parser.add_argument("--mode", choices=("words", "transcript"), default="words",
+                        help="words: 줄마다 독립 검사, transcript: 빈 줄로 구분된 게임 기록")
+    parser.add_argument("--rule-profile", choices=sorted(RULE_PROFILES), default=DEFAULT_RULE_PROFILE,
+                        help="적용할 규칙 프로필")
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH,
+                        help="사전 파일 (기본값: words.json)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="검사 프로세스 수 (기본값: 1, 0이면 CPU 수)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="words 모드에서 한 번에 넘기는 줄 수")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    try:
+        _init_worker(args.words, args.rule_profile)
+    except (OSError, ValueError) as e:
+        print(f"[오류] 사전을 불러올 수 없습니다: {e}", file=sys.stderr)
+        return 2
+
+    lines = iter_input_lines(args.inputs)
+    if args.mode == "transcript":
+        tasks = iter_transcript_tasks(lines)
+    else:
+        tasks = iter_word_tasks(lines, max(1, args.chunk_size))
+
+    rejected_total = 0
+    out = sys.stdout
+    try:
+        for output, rejected in run_tasks(tasks, workers, args.words, args.rule_profile):
+            rejected_total += rejected
+            for line in output:
+                out.write(line)
+                out.write("\n")
+    except BrokenPipeError:
+        # 출력을 받는 쪽(예: head)이 먼저 닫힘: 종료 시 flush 오류가 나지 않도록 버림
+        os.dup2(os.open(os.devnull, os.O_WRONLY), out.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"[오류] 입력을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+    out.flush()
+    return 0 if rejected_total == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,98 @@
+"""
+단어 제출 규칙 검사 (main.py의 submit_word와 validate_words.py 공용, Tk 의존 없음)
+
+검사 순서와 경고 문구는 게임 화면에 보이는 것과 같다.
+  1. 한글로 시작하고 끝나는지  2. 2글자 이상인지  3. 사전 표제어인지
+  4. 초반 턴의 이음 수 0 단어 금지  5. 이미 사용한 단어인지  6. 끝말잇기(두음법칙) 연결
+"""
+
+from typing import Callable, Container, Dict, NamedTuple, Optional
+
+from hangul import is_hangul_syllable
+from rule_profiles import RuleProfile
+
+NOT_HANGUL = "not_hangul"
+TOO_SHORT = "too_short"
+NOT_IN_DICTIONARY = "not_in_dictionary"
+ZERO_LINK_BANNED = "zero_link_banned"
+ALREADY_USED = "already_used"
+WRONG_START = "wrong_start"
+
+
+class RuleViolation(NamedTuple):
+    code: str
+    message: str
+
+
+def check_word(word: str, profile: RuleProfile, is_headword: Callable[[str], bool],
+               link_count: Callable[[str], int], used_words: Container[str],
+               turns_played: int, last_char: str) -> Optional[RuleViolation]:
+    """
+    제출 단어가 규칙을 어기면 첫 번째 위반을, 통과하면 None 반환.
+    link_count는 현재(게임 진행으로 줄어든) 이음 수, last_char는 직전 단어의 마지막 음절
+    """
+    if not is_hangul_syllable(word[0]) or not is_hangul_syllable(word[-1]):
+        return RuleViolation(NOT_HANGUL, f"{word}(은)는 잘못된 단어입니다: 한글로 시작하고 끝나야 합니다.")
+
+    if len(word) < 2:
+        return RuleViolation(TOO_SHORT, f"{word}(은)는 잘못된 단어입니다: 최소 2글자 이상이어야 합니다.")
+
+    if not is_headword(word):
+        return RuleViolation(NOT_IN_DICTIONARY,
+                             f"{word}(은)는 잘못된 단어입니다: 사전에 없는 단어이거나 명사가 아닙니다.")
+
+    if profile.bans_zero_link(turns_played) and link_count(word) == 0:
+        return RuleViolation(
+            ZERO_LINK_BANNED,
+            f"{word}(은)는 잘못된 단어입니다: 게임 시작 후 {profile.opening_ban_turns}턴까지는 "
+            "이음 수가 0인 단어를 사용할 수 없습니다.")
+
+    if word in used_words:
+        return RuleViolation(ALREADY_USED, f"{word}(은)는 잘못된 단어입니다: 이미 사용된 단어입니다.")
+
+    # 첫 단어가 아니면 끝말잇기 규칙 검사
+    if last_char and word[0] not in profile.allowed_start_chars(last_char):
+        return RuleViolation(
+            WRONG_START, f"{word}(은)는 잘못된 단어입니다: '{last_char}'(으)로 시작하는 단어를 입력하세요.")
+
+    return None
+
+
+class RuleGame:
+    """
+    게임 한 판의 규칙 상태 (사전 크기의 이음 수 사본 없이 사용한 단어 수에 비례하는 메모리만 사용)
+
+    단어를 하나 낼 때마다 그 첫 음절을 변형 집합에 포함하는 단어들의 이음 수가 1씩(0 미만 없이)
+    줄어들므로, 현재 이음 수 = max(0, 초기 이음 수 - 그 단어 뒤에 올 수 있는 음절로 시작한 단어 수)
+    """
+
+    __slots__ = ("profile", "base_link_counts", "used_words", "first_char_counts",
+                 "turns_played", "last_char")
+
+    def __init__(self, profile: RuleProfile, base_link_counts: Dict[str, int]):
+        self.profile = profile
+        self.base_link_counts = base_link_counts
+        self.used_words = set()
+        self.first_char_counts: Dict[str, int] = {}
+        self.turns_played = 0
+        self.last_char = ""
+
+    def link_count(self, word: str) -> int:
+        base = self.base_link_counts.get(word, 0)
+        if not base or not word:
+            return 0
+        played = sum(self.first_char_counts.get(c, 0)
+                     for c in self.profile.allowed_start_chars(word[-1]))
+        return max(0, base - played)
+
+    def check(self, word: str) -> Optional[RuleViolation]:
+        return check_word(word, self.profile, self.base_link_counts.__contains__, self.link_count,
+                          self.used_words, self.turns_played, self.last_char)
+
+    def play(self, word: str):
+        """check를 통과한 단어를 기록"""
+        self.used_words.add(word)
+        self.first_char_counts[word[0]] = self.first_char_counts.get(word[0], 0) + 1
+        self.turns_played += 1
+        self.last_char = word[-1]
+